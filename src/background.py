@@ -0,0 +1,159 @@
+"""Background work for the Tk UI: run hint/solver tasks off the main thread.
+
+English: Tk callbacks run on the main loop, so any heavy computation there
+(candidate counts, suggested guesses, keyboard colouring) freezes the
+window. `BackgroundScheduler` sends such tasks to an executor and delivers
+the results back on the main loop by polling with `after()`:
+
+  - Tasks are submitted under a *key*. Submitting again under the same key
+    makes the previous task stale: it is cancelled if it has not started
+    yet, and its result is dropped if it has (a running process cannot be
+    interrupted, but nothing it returns reaches the UI).
+  - Polling only runs while tasks are pending, so an idle board costs
+    nothing.
+  - The default executor is a process pool started with 'spawn' (a forked
+    child would inherit the Tk/X connection). The main thread then never
+    competes for the GIL with the analysis, which keeps input latency low
+    (see `python bench.py hints`). A thread pool is used when processes are
+    not available.
+
+`analyze` is the task used by the game frames; it is a top-level function
+so it can be pickled to worker processes.
+
+Español: Los callbacks de Tk corren en el bucle principal, así que cualquier
+cálculo pesado ahí congela la ventana. `BackgroundScheduler` envía esas
+tareas a un ejecutor y entrega los resultados en el bucle principal
+consultando con `after()`. Las tareas se envían bajo una *clave*: volver a
+enviar con la misma clave deja obsoleta la anterior (se cancela si no
+empezó y su resultado se descarta si ya empezó). El ejecutor por defecto es
+un pool de procesos iniciado con 'spawn', de modo que el hilo principal no
+compite por el GIL con el análisis.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Shared default executor for every scheduler (created on first use).
+# Ejecutor por defecto compartido por todos los planificadores (creado al primer uso).
+_executor = None
+
+
+def default_executor():
+    """Return the shared worker pool (a 'spawn' process pool when possible).
+
+    Español: Devuelve el pool compartido (de procesos 'spawn' si es posible).
+    """
+    global _executor
+    if _executor is None:
+        try:
+            _executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+        except (OSError, ValueError, NotImplementedError):
+            _executor = ThreadPoolExecutor(max_workers=1)
+    return _executor
+
+
+class BackgroundScheduler:
+    """Keyed background tasks whose callbacks run on the Tk main loop.
+
+    English: `widget` is any Tk object with `after()` (a widget or the
+    interpreter). Callbacks receive the task result, or are skipped when the
+    task failed or became stale.
+    Español: `widget` es cualquier objeto Tk con `after()`. Los callbacks
+    reciben el resultado, o no se llaman si la tarea falló o quedó obsoleta.
+    """
+
+    def __init__(self, widget, executor=None, poll_ms: int = 10):
+        self.widget = widget
+        self.executor = executor
+        self.poll_ms = poll_ms
+        # key -> (future, callback) of the live task for that key.
+        # clave -> (future, callback) de la tarea vigente para esa clave.
+        self._tasks = {}
+        self._polling = None
+        self.errors = []
+
+    def submit(self, key, fn, *args, callback=None):
+        """Run `fn(*args)` in the background, replacing any task under `key`.
+
+        Español: Ejecuta `fn(*args)` en segundo plano y reemplaza la tarea de `key`.
+        """
+        self.cancel(key)
+        executor = self.executor or default_executor()
+        self._tasks[key] = (executor.submit(fn, *args), callback)
+        if self._polling is None:
+            self._polling = self.widget.after(self.poll_ms, self._poll)
+
+    def cancel(self, key):
+        """Make the task under `key` stale (cancelled if not yet running).
+
+        Español: Deja obsoleta la tarea de `key` (se cancela si aún no corre).
+        """
+        entry = self._tasks.pop(key, None)
+        if entry is not None:
+            entry[0].cancel()
+
+    def cancel_all(self):
+        for key in list(self._tasks):
+            self.cancel(key)
+
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def _poll(self):
+        self._polling = None
+        for key, (future, callback) in list(self._tasks.items()):
+            if not future.done():
+                continue
+            del self._tasks[key]
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                self.errors.append(error)
+            elif callback is not None:
+                callback(future.result())
+        if self._tasks:
+            self._polling = self.widget.after(self.poll_ms, self._poll)
+
+    def close(self):
+        """Drop every task and stop polling (the shared pool stays up).
+
+        Español: Descarta todas las tareas y deja de consultar.
+        """
+        self.cancel_all()
+        if self._polling is not None:
+            try:
+                self.widget.after_cancel(self._polling)
+            except Exception:
+                pass
+            self._polling = None
+
+
+def analyze(length: int, history, top_k: int = 3):
+    """Hints for a game state: candidate count, suggestions and letter states.
+
+    English: `history` is a list of (word, pattern) pairs. Returns a dict
+    with 'candidatos' (how many secrets remain), 'sugerencias' (best
+    guesses by entropy, see `solver.rank_guesses`) and 'letras' (best estado
+    seen per letter, for keyboard colouring).
+    Español: `history` es una lista de pares (palabra, patrón). Devuelve un
+    diccionario con 'candidatos', 'sugerencias' y 'letras' (mejor estado
+    visto por letra, para colorear el teclado).
+    """
+    import candidates
+    import solver
+    from encoding import ESTADOS
+
+    index = candidates.get_index(length)
+    mask = index.all_mask
+    letters = {}
+    for word, pattern in history:
+        mask = index.constrain(mask, word, pattern)
+        for ch in word:
+            pattern, code = divmod(pattern, 3)
+            letters[ch] = max(letters.get(ch, 0), code)
+    remaining = index.words_in(mask)
+    return {
+        'candidatos': len(remaining),
+        'sugerencias': [w for _, w in solver.rank_guesses(length, remaining, top_k=top_k)],
+        'letras': {ch: ESTADOS[code] for ch, code in letters.items()},
+    }
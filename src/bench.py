@@ -0,0 +1,1237 @@
+"""Micro-benchmarks for the game and dictionary hot paths.
+
+English: Each benchmark is a small function registered in `BENCHMARKS` and
+runnable from the `src/` directory:
+
+    python bench.py            # list available benchmarks
+    python bench.py lookup     # run one benchmark
+
+Results are printed as plain text so they can be pasted into reviews.
+
+Español: Cada benchmark es una función pequeña registrada en `BENCHMARKS` y
+se ejecuta desde el directorio `src/` (ver ejemplos arriba). Los resultados se
+imprimen como texto plano para poder pegarlos en las revisiones.
+"""
+import asyncio
+import datetime
+import json
+import os
+import random
+import resource
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+import encoding
+import patterns
+import scoring
+import snapshot
+import solver
+import word_list
+from game import CompactGame, Game, MultiGame, check_words
+from word_list import WordList
+
+# Regression budget for `python main.py --cli` to show its first prompt
+# (about 40-60 ms here; importing NumPy alone pushes it past 150 ms).
+# Presupuesto de regresión para que `main.py --cli` muestre su primer mensaje.
+FIRST_PROMPT_BUDGET_MS = 100
+
+# Heavy modules the CLI path must never import before the first prompt.
+# Módulos pesados que la CLI nunca debe importar antes del primer mensaje.
+FIRST_PROMPT_FORBIDDEN = ('tkinter', '_tkinter', 'numpy')
+
+# Most the enabled metrics may add per instrumented call (about 1-2.5 us
+# for `check_word` here: a few clock reads and histogram observations).
+# Máximo que las métricas activas pueden añadir por llamada instrumentada.
+METRICS_OVERHEAD_BUDGET_NS = 5000
+
+# Per-guess latency target of the adversarial mode on a 100k-word list.
+# Objetivo de latencia por intento del modo adversario con 100k palabras.
+ADVERSARIAL_BUDGET_MS = 50
+
+# Synthetic word length used for generated dictionaries so benchmarks never
+# clobber the real per-length caches.
+# Longitud sintética usada en diccionarios generados para no pisar las cachés reales.
+SYNTHETIC_LENGTH = 9
+
+
+def _synthetic_words(count: int, length: int = SYNTHETIC_LENGTH, seed: int = 0):
+    """Return `count` distinct random lower-case words of `length` letters.
+
+    Español: Devuelve `count` palabras aleatorias distintas de `length` letras.
+    """
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add(''.join(rng.choice(string.ascii_lowercase) for _ in range(length)))
+    return sorted(words)
+
+
+def _install_words(words, length: int = SYNTHETIC_LENGTH):
+    """Replace the cached dictionary for `length` with `words`.
+
+    Español: Reemplaza el diccionario en caché para `length` con `words`.
+    """
+    word_list._words_by_length.pop(length, None)
+    word_list._word_sets_by_length.pop(length, None)
+    word_list._word_sets_by_length[length] = frozenset(words)
+    word_list._words_by_length[length] = list(words)
+
+
+def _per_call_ns(stmt, number: int) -> float:
+    """Best-of-3 nanoseconds per call for a zero-argument callable.
+
+    Español: Mejor de 3 repeticiones, en nanosegundos por llamada.
+    """
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1e9
+
+
+def bench_lookup():
+    """`is_known_word` latency as the dictionary grows (hit and miss).
+
+    Español: Latencia de `is_known_word` al crecer el diccionario.
+    """
+    print(f"{'words':>8} {'hit ns':>10} {'miss ns':>10} {'list-scan ns':>14}")
+    for size in (1_000, 10_000, 100_000):
+        words = _synthetic_words(size)
+        _install_words(words)
+        hit = words[-1]
+        # Upper-case never appears in the normalized dictionary.
+        # Las mayúsculas nunca aparecen en el diccionario normalizado.
+        miss = 'Z' * SYNTHETIC_LENGTH
+        hit_ns = _per_call_ns(lambda: WordList.is_known_word(hit, SYNTHETIC_LENGTH), 20_000)
+        miss_ns = _per_call_ns(lambda: WordList.is_known_word(miss, SYNTHETIC_LENGTH), 20_000)
+        # Reference: the former linear scan over the ordered list.
+        # Referencia: el antiguo recorrido lineal de la lista ordenada.
+        scan_ns = _per_call_ns(lambda: hit in words, 200)
+        print(f"{size:>8} {hit_ns:>10.0f} {miss_ns:>10.0f} {scan_ns:>14.0f}")
+
+
+def bench_scoring(length='7'):
+    """One guess against every secret: `check_word` loop vs `score_all`.
+
+    Español: Una suposición contra todos los secretos: bucle vs `score_all`.
+    """
+    length = int(length)
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    guess = words[0]
+    games = [Game(secret, length=length, intentos=10 ** 9) for secret in words]
+
+    # Correctness first: both paths must agree on every secret.
+    # Primero la corrección: ambos caminos deben coincidir en cada secreto.
+    batch = scoring.score_all(guess, length)
+    for game, pattern in zip(games, batch):
+        if game.check_word(guess)[0] != encoding.decode_pattern(guess, int(pattern)):
+            raise SystemExit(f'regression: score_all disagrees with check_word on {game.palabra_secreta!r}')
+
+    loop_ns = _per_call_ns(lambda: [g.check_word(guess) for g in games], 5)
+    batch_ns = _per_call_ns(lambda: scoring.score_all(guess, length), 50)
+    engine = 'numpy' if scoring.np is not None else 'python'
+    print(f'{len(words)} secrets of length {length} ({engine} engine)')
+    print(f'  check_word loop: {loop_ns / 1e6:8.3f} ms')
+    print(f'  score_all:       {batch_ns / 1e6:8.3f} ms  ({loop_ns / batch_ns:.1f}x)')
+
+
+def bench_startup(size='200000'):
+    """Cold dictionary load: words_N.txt parsing vs compiled words_N.bin.
+
+    Español: Carga en frío: lectura de words_N.txt vs words_N.bin compilado.
+    """
+    size = int(size)
+    words = _synthetic_words(size)
+    original_dir = word_list.MODULE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        word_list.MODULE_DIR = tmp
+        try:
+            with open(word_list.words_path(SYNTHETIC_LENGTH), 'w', encoding='utf-8') as f:
+                # Mixed case and blanks so the text path does real work.
+                # Mayúsculas y líneas vacías para que la ruta de texto trabaje.
+                for w in words:
+                    f.write(f' {w.upper()}\n\n')
+
+            def text_path():
+                return word_list._load_words_file(SYNTHETIC_LENGTH)
+
+            def binary_path():
+                return word_list._load_words(SYNTHETIC_LENGTH)
+
+            start = time.perf_counter()
+            binary_path()  # first call compiles / la primera llamada compila
+            compile_s = time.perf_counter() - start
+            if binary_path() != text_path():
+                raise SystemExit('regression: compiled dictionary differs from the text file')
+            text_s = min(timeit.repeat(text_path, number=1, repeat=5))
+            binary_s = min(timeit.repeat(binary_path, number=1, repeat=5))
+            bin_size = os.path.getsize(word_list.compiled_path(SYNTHETIC_LENGTH))
+        finally:
+            word_list.MODULE_DIR = original_dir
+    print(f'{size} words of length {SYNTHETIC_LENGTH}')
+    print(f'  text parse:      {text_s * 1e3:8.1f} ms')
+    print(f'  compiled load:   {binary_s * 1e3:8.1f} ms  ({text_s / binary_s:.1f}x, checksum included)')
+    print(f'  first compile:   {compile_s * 1e3:8.1f} ms  ({bin_size / 1e6:.2f} MB)')
+
+
+def bench_solver(size='3000'):
+    """Entropy recommender scaling across 1, 2, 4 and 8 worker processes.
+
+    English: Uses a synthetic dictionary of `size` words written to a
+    temporary directory (worker processes inherit it through fork).
+    Español: Usa un diccionario sintético de `size` palabras en un directorio
+    temporal (los procesos lo heredan mediante fork).
+    """
+    size = int(size)
+    words = _synthetic_words(size)
+    original_dir = word_list.MODULE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        word_list.MODULE_DIR = tmp
+        try:
+            with open(word_list.words_path(SYNTHETIC_LENGTH), 'w', encoding='utf-8') as f:
+                f.write('\n'.join(words))
+            word_list._words_by_length.pop(SYNTHETIC_LENGTH, None)
+            start = time.perf_counter()
+            patterns.load_matrix(SYNTHETIC_LENGTH)
+            print(f'{size} words: pattern matrix built in {time.perf_counter() - start:.2f}s')
+            baseline = None
+            reference = None
+            for workers in (1, 2, 4, 8):
+                start = time.perf_counter()
+                ranked = solver.rank_guesses(SYNTHETIC_LENGTH, words, top_k=5, workers=workers)
+                elapsed = time.perf_counter() - start
+                baseline = baseline or elapsed
+                reference = reference or ranked
+                if [w for _, w in ranked] != [w for _, w in reference]:
+                    raise SystemExit(f'regression: ranking with {workers} worker(s) differs')
+                print(f'  {workers} worker(s): {elapsed:7.2f}s  speedup {baseline / elapsed:4.1f}x  best={ranked[0][1]}')
+        finally:
+            word_list.MODULE_DIR = original_dir
+            word_list._words_by_length.pop(SYNTHETIC_LENGTH, None)
+            patterns._matrices.pop(SYNTHETIC_LENGTH, None)
+
+
+def _time_to_prompt(extra_args=()):
+    """Spawn `main.py --cli`; return (ms until the first prompt, stderr).
+
+    Español: Lanza `main.py --cli`; devuelve (ms hasta el primer mensaje, stderr).
+    """
+    prompt = b'Ingrese una palabra: '
+    cmd = [sys.executable, *extra_args, 'main.py', '--cli']
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=word_list.MODULE_DIR or '.', stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    seen = proc.stdout.read(len(prompt))
+    elapsed_ms = (time.perf_counter() - start) * 1e3
+    _, err = proc.communicate(b'')
+    if seen != prompt:
+        raise RuntimeError(f'unexpected CLI output: {seen!r}')
+    return elapsed_ms, err.decode('utf-8', 'replace')
+
+
+def bench_firstprompt(runs='5'):
+    """CLI cold start: import-time report and wall-clock to first prompt.
+
+    English: Fails (exit status 1) when the median exceeds
+    `FIRST_PROMPT_BUDGET_MS` or when a `FIRST_PROMPT_FORBIDDEN` module
+    (tkinter, NumPy) gets imported.
+    Español: Falla (código 1) si la mediana supera `FIRST_PROMPT_BUDGET_MS`
+    o si se importa un módulo de `FIRST_PROMPT_FORBIDDEN` (tkinter, NumPy).
+    """
+    _, report = _time_to_prompt(['-X', 'importtime'])
+    rows = []
+    for line in report.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Top-level imports are indented by exactly one space.
+        # Los imports de primer nivel tienen exactamente un espacio.
+        if not name.startswith('  '):
+            rows.append((int(cumulative), name.strip()))
+    imported = [line.split('|')[-1].strip() for line in report.splitlines() if line.startswith('import time:')]
+    rows.sort(reverse=True)
+    print('slowest top-level imports (cumulative us):')
+    for cumulative, name in rows[:10]:
+        print(f'  {cumulative:>8}  {name}')
+
+    times = sorted(_time_to_prompt()[0] for _ in range(int(runs)))
+    median = times[len(times) // 2]
+    print(f'time to first prompt: median {median:.1f} ms, best {times[0]:.1f} ms '
+          f'(budget {FIRST_PROMPT_BUDGET_MS} ms)')
+    for name in FIRST_PROMPT_FORBIDDEN:
+        if name in imported:
+            raise SystemExit(f'regression: the CLI path imported {name}')
+    if median > FIRST_PROMPT_BUDGET_MS:
+        raise SystemExit(f'regression: first prompt took {median:.1f} ms')
+
+
+def _write_corpus(path: str, target: int, vocab, rng) -> int:
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        while written < target:
+            line = ' '.join(rng.choices(vocab, k=2_000)) + '.\n'
+            f.write(line)
+            written += len(line)
+    return written
+
+
+def bench_ingest(megabytes='50'):
+    """Streaming corpus ingestion: throughput and peak RSS of `ingest.py`.
+
+    English: Ingests synthetic corpora of 1/4 and the full requested size in
+    child processes. Peak resident memory must not grow with the corpus
+    (at most `slack` MB more for the 4x larger input).
+    Español: Ingiere corpus sintéticos de 1/4 y del tamaño pedido en
+    procesos hijos. El pico de memoria residente no debe crecer con el corpus.
+    """
+    slack_mb = 16
+    target = int(float(megabytes) * 1e6)
+    rng = random.Random(0)
+    vocab = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10)))
+             for _ in range(300_000)]
+    peaks = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # Smaller run first: RUSAGE_CHILDREN keeps the maximum over children.
+        # Primero la ejecución pequeña: RUSAGE_CHILDREN guarda el máximo.
+        for size in (target // 4, target):
+            source = os.path.join(tmp, 'corpus.txt')
+            written = _write_corpus(source, size, vocab, rng)
+            cmd = [sys.executable, 'ingest.py', source, '--out', os.path.join(tmp, 'out'),
+                   '--lengths', '5', '6', '7', '--max-buffer', '10000', '--quiet']
+            start = time.perf_counter()
+            result = subprocess.run(cmd, cwd=word_list.MODULE_DIR or '.', capture_output=True, text=True, check=True)
+            elapsed = time.perf_counter() - start
+            # ru_maxrss is reported in KiB on Linux / en KiB en Linux.
+            peak_mb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+            peaks.append(peak_mb)
+            print(f'{written / 1e6:6.1f} MB corpus in {elapsed:6.2f}s ({written / 1e6 / elapsed:5.1f} MB/s), '
+                  f'peak RSS {peak_mb:6.1f} MB')
+            print('   ' + result.stdout.replace('\n', '  ').rstrip())
+    if peaks[1] - peaks[0] > slack_mb:
+        raise SystemExit('regression: ingestion memory grew with the corpus size')
+
+
+def bench_encoding(games='100000', length='5'):
+    """History memory and scoring throughput: tuple lists vs `Feedback`.
+
+    English: Builds 6-guess histories for `games` games in both the classic
+    list-of-tuples form and the compact `encoding.Feedback` form, measuring
+    allocated bytes with tracemalloc and scoring time per guess.
+    Español: Construye historiales de 6 intentos para `games` partidas en la
+    forma clásica (listas de tuplas) y en la compacta (`Feedback`), midiendo
+    bytes asignados con tracemalloc y tiempo de puntuación por intento.
+    """
+    games, length = int(games), int(length)
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    rng = random.Random(0)
+    # Fresh string objects, as produced by `input_word.strip().lower()`.
+    # Cadenas nuevas, como las produce `input_word.strip().lower()`.
+    plays = [(rng.choice(words), [''.join(rng.choice(words)) for _ in range(6)]) for _ in range(games)]
+
+    def classic():
+        return [[encoding.decode_pattern(g, encoding.score_pair(g, secret)) for g in guesses]
+                for secret, guesses in plays]
+
+    def compact():
+        return [[encoding.Feedback(g, encoding.score_pair(g, secret)) for g in guesses]
+                for secret, guesses in plays]
+
+    print(f'{games} games x 6 guesses, length {length}')
+    for name, build in (('tuple lists', classic), ('Feedback', compact)):
+        tracemalloc.start()
+        histories = build()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del histories
+        seconds = min(timeit.repeat(build, number=1, repeat=3))
+        print(f'  {name:<12} {current / games:8.0f} B/game  {seconds / (games * 6) * 1e9:8.0f} ns/guess')
+
+
+def bench_server(sessions='10000', connections='100', length='5'):
+    """NDJSON server load test: sessions/sec and p50/p99 guess latency.
+
+    English: Starts `server.GameServer` on an ephemeral local port, opens
+    `connections` client sockets, creates `sessions` concurrent sessions
+    spread over them and plays every game to the end with random known
+    words. Latency is measured per request from the client side.
+    Español: Arranca `server.GameServer` en un puerto local efímero, abre
+    `connections` sockets, crea `sessions` sesiones concurrentes repartidas
+    entre ellos y juega cada partida hasta el final con palabras conocidas.
+    """
+    import server
+
+    sessions, connections, length = int(sessions), int(connections), int(length)
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+
+    async def call(reader, writer, request):
+        writer.write(json.dumps(request).encode() + b'\n')
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    async def client(port, count, rng, latencies):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        ids = [(await call(reader, writer, {'op': 'new', 'length': length}))['session'] for _ in range(count)]
+        await created.wait()
+        live = ids
+        while live:
+            still = []
+            for session_id in live:
+                start = time.perf_counter()
+                response = await call(reader, writer, {'op': 'guess', 'session': session_id,
+                                                       'word': rng.choice(words)})
+                latencies.append(time.perf_counter() - start)
+                if 'palabra' not in response:
+                    still.append(session_id)
+            live = still
+        writer.close()
+
+    async def run():
+        game_server = server.GameServer(server.SessionStore(max_sessions=sessions * 2))
+        listener = await game_server.start('127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        latencies = []
+        shares = [sessions // connections + (i < sessions % connections) for i in range(connections)]
+        start = time.perf_counter()
+        tasks = [asyncio.ensure_future(client(port, n, random.Random(i), latencies)) for i, n in enumerate(shares)]
+        while len(game_server.store) < sessions:
+            await asyncio.sleep(0.01)
+        create_s = time.perf_counter() - start
+        live = len(game_server.store)
+        created.set()
+        play_start = time.perf_counter()
+        await asyncio.gather(*tasks)
+        play_s = time.perf_counter() - play_start
+        listener.close()
+        game_server.sweeper.cancel()
+        return create_s, live, play_s, latencies
+
+    created = asyncio.Event()
+    create_s, live, play_s, latencies = asyncio.run(run())
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+    print(f'{live} concurrent sessions over {connections} connections')
+    print(f'  created in {create_s:.2f}s ({sessions / create_s:,.0f} sessions/s)')
+    print(f'  {len(latencies)} guesses in {play_s:.2f}s ({len(latencies) / play_s:,.0f} guesses/s)')
+    print(f'  guess latency p50 {p50:.2f} ms, p99 {p99:.2f} ms')
+
+
+def bench_sessions(sessions='1000000', guesses='2', length='5'):
+    """Bytes per live game at high session counts: `Game` vs `CompactGame`.
+
+    Español: Bytes por partida viva con muchas sesiones: `Game` vs `CompactGame`.
+    """
+    sessions, guesses, length = int(sessions), int(guesses), int(length)
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    rng = random.Random(0)
+    secrets_ = [rng.choice(words) for _ in range(sessions)]
+    plays = [rng.choice(words) for _ in range(guesses * 64)]
+    print(f'{sessions} live sessions, {guesses} guesses each, length {length}')
+    for cls in (Game, CompactGame):
+        tracemalloc.start()
+        start = time.perf_counter()
+        table = {}
+        for i, secret in enumerate(secrets_):
+            game = cls(secret, length=length)
+            for k in range(guesses):
+                game.check_word(plays[(i + k) % len(plays)])
+            table[i] = game
+        elapsed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # Subtract the session table itself, which is the same for both.
+        # Se descuenta la propia tabla de sesiones, igual para ambas clases.
+        per_game = (current - sys.getsizeof(table)) / sessions
+        print(f'  {cls.__name__:<12} {per_game:7.0f} B/game  ({elapsed:.1f}s to build)')
+        del table
+
+
+def bench_snapshot(sessions='1000000', guesses='2', length='5'):
+    """Snapshot write/restore time for many live sessions, plus delta replay.
+
+    Español: Tiempo de escribir/restaurar una instantánea con muchas sesiones y de reproducir deltas.
+    """
+    sessions, guesses, length = int(sessions), int(guesses), int(length)
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    rng = random.Random(0)
+    table = {}
+    for i in range(sessions):
+        game = CompactGame(rng.choice(words), length=length)
+        for _ in range(guesses):
+            game.check_word(rng.choice(words))
+        table[f'{i:016x}'] = game
+    print(f'{sessions} sessions, {guesses} guesses each, length {length}')
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sessions.snap')
+        start = time.perf_counter()
+        snapshot.write_snapshot(path, table)
+        write_s = time.perf_counter() - start
+        size = os.path.getsize(path)
+        start = time.perf_counter()
+        restored, _ = snapshot.read_snapshot(path)
+        read_s = time.perf_counter() - start
+        print(f'  write   {write_s:6.2f}s  {size / 1e6:7.1f} MB  ({size / sessions:.0f} B/session)')
+        print(f'  restore {read_s:6.2f}s  ({sessions / read_s:,.0f} sessions/s)')
+        sample = rng.sample(sorted(table), min(1000, sessions))
+        same = all(restored[k].get_historial() == table[k].get_historial()
+                   and restored[k].get_intentos_restantes() == table[k].get_intentos_restantes()
+                   for k in sample)
+        print(f'  round trip identical on {len(sample)} sampled sessions: {same}')
+        if not same:
+            raise SystemExit('regression: snapshot round trip changed sessions')
+
+        # Delta log: one guess per session on a tenth of the table.
+        # Registro delta: un intento por sesión en una décima parte de la tabla.
+        delta_path = path + '.delta.0'
+        updates = [(k, rng.choice(words)) for k in sample[:1] + rng.sample(sorted(table), sessions // 10)]
+        log = snapshot.DeltaLog(delta_path)
+        start = time.perf_counter()
+        for session_id, word in updates:
+            log.log_guess(session_id, word)
+        log.close()
+        append_us = (time.perf_counter() - start) / len(updates) * 1e6
+        start = time.perf_counter()
+        snapshot.replay_deltas(delta_path, restored)
+        replay_s = time.perf_counter() - start
+        print(f'  delta   {append_us:6.2f} us/append, replay {len(updates)} records in {replay_s:.2f}s')
+
+
+def bench_batch(pairs='200000', length='5'):
+    """`check_words` over many (game, guess) pairs vs a `check_word` loop.
+
+    Español: `check_words` sobre muchos pares (partida, suposición) frente a un bucle de `check_word`.
+    """
+    pairs, length = int(pairs), int(length)
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    rng = random.Random(0)
+    secrets_ = [rng.choice(words) for _ in range(pairs)]
+    guesses = [rng.choice(words) for _ in range(pairs)]
+    print(f'{pairs} pairs, one game each, length {length}')
+
+    def fresh():
+        return [Game(s, length=length, intentos=2) for s in secrets_]
+
+    games = fresh()
+    start = time.perf_counter()
+    expected = [game.check_word(word) for game, word in zip(games, guesses)]
+    loop_s = time.perf_counter() - start
+    games = fresh()
+    start = time.perf_counter()
+    batch = check_words(list(zip(games, guesses)))
+    batch_s = time.perf_counter() - start
+    print(f'  check_word loop {loop_s / pairs * 1e9:8.0f} ns/pair')
+    print(f'  check_words     {batch_s / pairs * 1e9:8.0f} ns/pair  ({loop_s / batch_s:.1f}x)')
+    print(f'  identical results: {batch == expected}')
+    if batch != expected:
+        raise SystemExit('regression: check_words differs from the check_word loop')
+
+
+_SECRET_PICK = '''
+import sys, time
+sys.path.insert(0, {src!r})
+import word_list
+word_list.MODULE_DIR = {tmp!r}
+start = time.perf_counter()
+if {indexed!r}:
+    import word_index
+    picks = [word_index.random_word({length}) for _ in range(1000)]
+else:
+    import random
+    word_list.WordList._ensure_loaded({length})
+    picks = [random.choice(word_list._words_by_length[{length}]) for _ in range(1000)]
+elapsed = time.perf_counter() - start
+# VmHWM, not ru_maxrss: the latter keeps the forking parent's peak.
+# VmHWM y no ru_maxrss: este conserva el pico del proceso padre.
+with open('/proc/self/status') as f:
+    rss_kb = next(line.split()[1] for line in f if line.startswith('VmHWM'))
+print(elapsed, rss_kb)
+'''
+
+
+def bench_secret(size='1000000'):
+    """Secret picking in a fresh process: mmap'd index vs loading the list.
+
+    Español: Elegir secretos en un proceso nuevo: índice mmap vs cargar la lista.
+    """
+    import word_index
+
+    size = int(size)
+    words = _synthetic_words(size)
+    original_dir = word_list.MODULE_DIR
+    src = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as tmp:
+        word_list.MODULE_DIR = tmp
+        try:
+            with open(word_list.words_path(SYNTHETIC_LENGTH), 'w', encoding='utf-8') as f:
+                f.writelines(w + '\n' for w in words)
+            word_index.get_index(SYNTHETIC_LENGTH)  # compile once / compila una vez
+            print(f'{size} words of length {SYNTHETIC_LENGTH}, 1000 picks per process')
+            for label, indexed in (('load list + choice', False), ('mmap index', True)):
+                script = _SECRET_PICK.format(src=src, tmp=tmp, length=SYNTHETIC_LENGTH, indexed=indexed)
+                out = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+                elapsed, rss_kb = out.stdout.split()
+                print(f'  {label:<20} {float(elapsed) * 1e3:8.1f} ms  max RSS {int(rss_kb) / 1024:6.1f} MB')
+            days = [datetime.date(2026, 1, 1) + datetime.timedelta(days=d) for d in range(365)]
+            daily = [word_index.word_of_the_day(SYNTHETIC_LENGTH, day) for day in days]
+            again = [word_index.word_of_the_day(SYNTHETIC_LENGTH, day) for day in days]
+            print(f'  word of the day: deterministic={daily == again}, '
+                  f'{len(set(daily))} distinct over {len(days)} days')
+            if daily != again:
+                raise SystemExit('regression: word of the day is not deterministic')
+            index = word_index._indexes.pop(SYNTHETIC_LENGTH)[1]
+            if index is not None:
+                index.close()
+        finally:
+            word_list.MODULE_DIR = original_dir
+
+
+def bench_deck(draws='3000000', players='2000'):
+    """Shuffled-deck rotation: millions of draws, no repeats within a cycle.
+
+    Español: Rotación con mazo barajado: millones de extracciones sin repetir en un ciclo.
+    """
+    import deck
+
+    draws, players = int(draws), int(players)
+    # One large deck: every cycle must be an exact permutation.
+    # Un mazo grande: cada ciclo debe ser una permutación exacta.
+    count = 1_000_003
+    single = deck.Deck(count, seed=12345)
+    seen = bytearray(count)
+    ok = True
+    cycles = []
+    start = time.perf_counter()
+    for n in range(draws):
+        index = single.draw()
+        if seen[index]:
+            ok = False
+        seen[index] = 1
+        if n % count == 0:
+            cycles.append(index)
+        if single.cursor == 0:
+            ok = ok and all(seen)
+            seen = bytearray(count)
+    elapsed = time.perf_counter() - start
+    print(f'{draws} draws from one deck of {count}: {elapsed / draws * 1e6:.2f} us/draw')
+    print(f'  every cycle a permutation: {ok}, cycle openers {cycles}')
+
+    # Many players on the real dictionary, persisted and resumed mid-cycle.
+    # Muchos jugadores con el diccionario real, guardados y reanudados a mitad de ciclo.
+    length = 5
+    store = deck.DeckStore(length, seed=7)
+    size = store.count
+    per_player = max(1, draws // players)
+    names = [f'player-{i}' for i in range(players)]
+    history = {name: [] for name in names}
+    half = per_player // 2
+    for name in names:
+        history[name].extend(store.draw(name) for _ in range(half))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'decks')
+        start = time.perf_counter()
+        store.save(path)
+        store = deck.DeckStore.load(path)
+        io_s = time.perf_counter() - start
+        state_size = os.path.getsize(path)
+    for name in names:
+        history[name].extend(store.draw(name) for _ in range(per_player - half))
+    fresh_ok = True
+    for picks in history.values():
+        for c in range(0, len(picks), size):
+            cycle = picks[c:c + size]
+            fresh_ok = fresh_ok and len(set(cycle)) == len(cycle)
+    print(f'{players} players x {per_player} draws over {size} words (save/load at {half}):')
+    print(f'  no repeats within a cycle: {fresh_ok}')
+    if not fresh_ok:
+        raise SystemExit('regression: a deck repeated a word within a cycle')
+    print(f'  state {state_size / players:.0f} B/player, save+load {io_s * 1e3:.1f} ms')
+
+
+def bench_board(builds='20', restarts='50'):
+    """GUI board: frame build and restart time, Canvas renderer vs Entry grid.
+
+    Español: Tablero de la GUI: tiempo de construcción y reinicio, Canvas vs cuadrícula de Entry.
+    """
+    import tkinter as tk
+
+    import ui
+
+    builds, restarts = int(builds), int(restarts)
+    try:
+        root = tk.Tk()
+    except tk.TclError as exc:
+        print(f'No display available, skipping: {exc}')
+        return
+    root.withdraw()
+    try:
+        for length in (5, 7):
+            WordList._ensure_loaded(length)
+            words = word_list._words_by_length[length]
+            print(f'length {length}:')
+            for name, cls in ui.BOARDS.items():
+                start = time.perf_counter()
+                for _ in range(builds):
+                    frame = cls(root, length=length)
+                    frame.pack()
+                    root.update_idletasks()
+                    frame.destroy()
+                build_ms = (time.perf_counter() - start) / builds * 1e3
+
+                commands = len(root.tk.call('info', 'commands'))
+                frame = cls(root, length=length)
+                frame.pack()
+                root.update_idletasks()
+                held = len(root.tk.call('info', 'commands')) - commands
+                elapsed = 0.0
+                for n in range(restarts):
+                    # Paint two scored rows, then time the restart itself.
+                    # Pinta dos filas puntuadas y mide sólo el reinicio.
+                    for row in range(2):
+                        guess = words[(n + row) % len(words)]
+                        frame._paint_row(row, frame.game.check_word(guess)[0])
+                    root.update_idletasks()
+                    start = time.perf_counter()
+                    frame.restart()
+                    root.update_idletasks()
+                    elapsed += time.perf_counter() - start
+                frame.destroy()
+                print(f'  {name:<7} build {build_ms:7.2f} ms  restart {elapsed / restarts * 1e3:7.2f} ms'
+                      f'  Tcl commands per frame {held}')
+    finally:
+        root.destroy()
+
+
+def _loop_latency(interp, scheduler, task, period_ms: int = 5):
+    """Run the Tcl event loop until `task` delivers; return (latencies ms, wall s, result).
+
+    Español: Ejecuta el bucle de eventos hasta que `task` entrega su resultado.
+    """
+    results = []
+    latencies = []
+    state = {'due': None}
+
+    def tick():
+        now = time.perf_counter()
+        latencies.append((now - state['due']) * 1e3)
+        state['due'] = time.perf_counter() + period_ms / 1e3
+        interp.after(period_ms, tick)
+
+    start = time.perf_counter()
+    # Stale submissions: only the last one may deliver a result.
+    # Envíos obsoletos: sólo el último puede entregar un resultado.
+    for n in range(3):
+        scheduler.submit('hints', *task, callback=lambda r, n=n: results.append((n, r)))
+    state['due'] = time.perf_counter() + period_ms / 1e3
+    interp.after(period_ms, tick)
+    while not results:
+        interp.dooneevent()
+    wall = time.perf_counter() - start
+    return latencies, wall, results
+
+
+def _use_module_dir(path: str):
+    """Pool initializer: read dictionaries (and their caches) from `path`.
+
+    Español: Inicializador del pool: leer diccionarios (y cachés) desde `path`.
+    """
+    word_list.MODULE_DIR = path
+
+
+def bench_hints(size='4000', length='7'):
+    """UI hint analysis off the main loop: event-loop latency while it runs.
+
+    Español: Análisis de pistas fuera del bucle principal: latencia del bucle mientras corre.
+    """
+    import multiprocessing
+    import tkinter as tk
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    import background
+
+    size, length = int(size), int(length)
+    words = _synthetic_words(size, length)
+    with tempfile.TemporaryDirectory() as tmp:
+        _use_module_dir(tmp)
+        with open(word_list.words_path(length), 'w', encoding='utf-8') as f:
+            f.writelines(w + '\n' for w in words)
+        start = time.perf_counter()
+        patterns.load_matrix(length)  # build once up front / se construye una vez antes
+        print(f'{size} synthetic words of length {length} (pattern matrix built in '
+              f'{time.perf_counter() - start:.1f}s)')
+        guess = words[0]
+        history = [(guess, encoding.score_pair(guess, words[len(words) // 2]))]
+        task = (background.analyze, length, history)
+
+        start = time.perf_counter()
+        background.analyze(*task[1:])
+        inline_s = time.perf_counter() - start
+        print(f'  inline in a Tk callback: the loop is blocked for {inline_s * 1e3:.0f} ms')
+
+        interp = tk.Tcl()
+        processes = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'),
+                                        initializer=_use_module_dir, initargs=(tmp,))
+        for label, executor in (('thread pool', ThreadPoolExecutor(max_workers=1)),
+                                ('process pool', processes)):
+            scheduler = background.BackgroundScheduler(interp, executor)
+            _loop_latency(interp, scheduler, task)  # warm up workers / calienta los procesos
+            latencies, wall, results = _loop_latency(interp, scheduler, task)
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(f'  {label:<13} result in {wall * 1e3:5.0f} ms; loop latency max {latencies[-1]:5.1f} ms,'
+                  f' p99 {p99:5.1f} ms over {len(latencies)} ticks; delivered {[n for n, _ in results]}')
+            scheduler.close()
+            executor.shutdown()
+        hints = results[-1][1]
+        print(f"  hints: {hints['candidatos']} candidates, suggestions {hints['sugerencias']}")
+
+
+def bench_metrics(calls='200000', length='5'):
+    """Instrumentation overhead: hot paths with metrics disabled vs enabled.
+
+    English: Fails (exit 1) when enabling metrics adds more than
+    `METRICS_OVERHEAD_BUDGET_NS` per call. Counter values are checked by
+    tests/test_metrics.py.
+    Español: Coste de la instrumentación: rutas críticas con métricas
+    desactivadas vs activadas. Falla si activarlas añade más de
+    `METRICS_OVERHEAD_BUDGET_NS` por llamada.
+    """
+    import metrics
+
+    calls, length = int(calls), int(length)
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    rng = random.Random(0)
+    guesses = [rng.choice(words) for _ in range(1024)]
+    secret = words[0]
+    state = {'i': 0}
+
+    def check_word():
+        game = Game(secret, length=length, intentos=calls + 1)
+        for i in range(calls):
+            game.check_word(guesses[i & 1023])
+
+    def known():
+        for i in range(calls):
+            WordList.is_known_word(guesses[i & 1023], length)
+
+    def batch():
+        games = [Game(secret, length=length, intentos=2) for _ in range(calls // 4)]
+        for i in range(0, len(games), 256):
+            check_words([(g, guesses[(i + j) & 1023]) for j, g in enumerate(games[i:i + 256])])
+
+    def guard():
+        for _ in range(calls):
+            if metrics.ENABLED:
+                state['i'] += 1
+
+    def empty():
+        for _ in range(calls):
+            pass
+
+    print(f'{calls} calls per measurement, length {length}')
+    base = min(timeit.repeat(empty, number=1, repeat=5))
+    guard_ns = (min(timeit.repeat(guard, number=1, repeat=5)) - base) / calls * 1e9
+    print(f'  one disabled guard (`if metrics.ENABLED`): {guard_ns:5.1f} ns')
+    over = []
+    for label, fn, n in (('check_word', check_word, calls), ('is_known_word', known, calls),
+                         ('check_words', batch, calls // 4)):
+        results = []
+        for enabled in (False, True):
+            metrics.enable() if enabled else metrics.disable()
+            results.append(min(timeit.repeat(fn, number=1, repeat=5)) / n * 1e9)
+        metrics.disable()
+        off, on = results
+        print(f'  {label:<14} disabled {off:7.0f} ns  enabled {on:7.0f} ns  (+{on - off:.0f} ns, {on / off - 1:+.0%})')
+        if on - off > METRICS_OVERHEAD_BUDGET_NS:
+            over.append(f'{label} +{on - off:.0f} ns')
+    metrics.reset()
+    if over:
+        raise SystemExit(f'regression: metrics overhead over {METRICS_OVERHEAD_BUDGET_NS} ns: {", ".join(over)}')
+
+
+def bench_adversarial(size='100000', games='20'):
+    """Adversarial mode: per-guess partition latency on a large dictionary.
+
+    Español: Modo adversario: latencia de partición por intento con un diccionario grande.
+    """
+    import partition
+    from game import AdversarialGame
+
+    size, games, length = int(size), int(games), SYNTHETIC_LENGTH
+    words = _synthetic_words(size, length)
+    _install_words(words, length)
+    scoring.encoded_words(length)  # encode once up front / se codifica una vez antes
+    rng = random.Random(0)
+    print(f'{size} synthetic words of length {length}, {games} games')
+
+    guess = words[0]
+    start = time.perf_counter()
+    sizes = {}
+    for secret in words:
+        p = encoding.score_pair(guess, secret)
+        sizes[p] = sizes.get(p, 0) + 1
+    pairwise_s = time.perf_counter() - start
+    start = time.perf_counter()
+    best, rows = partition.largest_bucket(guess, None, length)
+    bucketed_s = time.perf_counter() - start
+    print(f'  first guess, one pair at a time {pairwise_s * 1e3:7.1f} ms')
+    print(f'  first guess, bucketed           {bucketed_s * 1e3:7.1f} ms  ({pairwise_s / bucketed_s:.0f}x);'
+          f' same bucket: {sizes[best] == len(rows)}')
+    if sizes[best] != len(rows):
+        raise SystemExit('regression: bucketed partition disagrees with pairwise scoring')
+
+    latencies = {}
+    wins = 0
+    for _ in range(games):
+        game = AdversarialGame(length=length, intentos=8)
+        for turn in range(8):
+            pool = words if turn == 0 else game.get_candidatos()
+            start = time.perf_counter()
+            _, _, _, is_winner = game.check_word(rng.choice(pool))
+            latencies.setdefault(turn + 1, []).append(time.perf_counter() - start)
+            if is_winner:
+                wins += 1
+                break
+    print(f'  guesses played from the remaining candidates; {wins}/{games} games won within 8')
+    worst = 0.0
+    for turn, times in sorted(latencies.items()):
+        worst = max(worst, max(times))
+        print(f'    guess {turn}: mean {sum(times) / len(times) * 1e3:6.2f} ms  max {max(times) * 1e3:6.2f} ms')
+    print(f'  worst guess {worst * 1e3:.1f} ms (budget {ADVERSARIAL_BUDGET_MS} ms)')
+    if worst * 1e3 > ADVERSARIAL_BUDGET_MS:
+        raise SystemExit(f'regression: adversarial guess took {worst * 1e3:.1f} ms')
+
+
+def bench_multi(boards='16,64', guesses='2000', length='5'):
+    """Multi-board guesses: one `MultiGame.check_word` vs N `Game.check_word` calls.
+
+    Español: Intentos en varios tableros: un `MultiGame.check_word` frente a N llamadas a `Game.check_word`.
+    """
+    guesses, length = int(guesses), int(length)
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    rng = random.Random(0)
+    print(f'{guesses} guesses per measurement, length {length}')
+    for n in (int(b) for b in boards.split(',')):
+        secrets_ = rng.sample(words, n)
+        # Guesses never solve a board, so every board is scored every time.
+        # Los intentos nunca resuelven un tablero: se puntúan todos siempre.
+        taken = set(secrets_)
+        plays = [w for w in (rng.choice(words) for _ in range(guesses * 2)) if w not in taken][:guesses]
+
+        def separate():
+            games = [Game(s, length=length, intentos=guesses) for s in secrets_]
+            return [[game.check_word(w)[0] for game in games] for w in plays]
+
+        def multi():
+            game = MultiGame(secrets_, length=length, intentos=guesses)
+            return [game.check_word(w)[0] for w in plays]
+
+        separate_s = min(timeit.repeat(separate, number=1, repeat=3))
+        multi_s = min(timeit.repeat(multi, number=1, repeat=3))
+        same = [[r.pattern for r in row] for row in separate()] == [[r.pattern for r in row] for row in multi()]
+        print(f'  {n:3d} boards: {n} x Game.check_word {separate_s / guesses * 1e6:7.1f} us/guess'
+              f'  MultiGame.check_word {multi_s / guesses * 1e6:7.1f} us/guess'
+              f'  ({separate_s / multi_s:.1f}x); same patterns: {same}')
+        if not same:
+            raise SystemExit(f'regression: MultiGame patterns differ with {n} boards')
+
+
+def _naive_hard_violation(historial, word: str):
+    """Hard-mode check that re-walks the whole history (the baseline).
+
+    Español: Comprobación del modo difícil que recorre todo el historial (la referencia).
+    """
+    for resultados in historial:
+        needed = {}
+        for pos, (letter, estado) in enumerate(resultados):
+            if estado == 'verde' and word[pos] != letter:
+                return True
+            if estado != 'rojo':
+                needed[letter] = needed.get(letter, 0) + 1
+        for letter, n in needed.items():
+            if word.count(letter) < n:
+                return True
+    return False
+
+
+def bench_hard(attempts='1,10,100', guesses='20000', length='5'):
+    """Hard mode: O(length) validation vs re-walking the history, and legal-guess filtering.
+
+    Español: Modo difícil: validación O(longitud) frente a recorrer el historial, y filtro de intentos legales.
+    """
+    import candidates
+
+    guesses, length = int(guesses), int(length)
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    index = candidates.get_index(length)
+    rng = random.Random(0)
+    print(f'{guesses} validations per measurement, length {length}')
+    for n in (int(a) for a in attempts.split(',')):
+        secret = rng.choice(words)
+        game = Game(secret, length=length, intentos=n, hard=True)
+        # Play `n` legal guesses that never hit the secret (repeats allowed).
+        # Se juegan `n` intentos legales que nunca aciertan (se permiten repetidos).
+        while len(game.historial) < n:
+            game.check_word(rng.choice([w for w in game.get_intentos_legales() if w != secret]))
+        probes = [rng.choice(words) for _ in range(1024)]
+        historial = game.get_historial()
+        constraints = game.restricciones
+        naive_s = min(timeit.repeat(lambda: [_naive_hard_violation(historial, w) for w in probes],
+                                    number=max(1, guesses // 1024), repeat=3))
+        summary_s = min(timeit.repeat(lambda: [constraints.violation(w) for w in probes],
+                                      number=max(1, guesses // 1024), repeat=3))
+        calls = max(1, guesses // 1024) * 1024
+        same = [_naive_hard_violation(historial, w) for w in words] == \
+            [constraints.violation(w) is not None for w in words]
+        print(f'  after {n:3d} guesses: re-walk {naive_s / calls * 1e9:8.0f} ns  summary {summary_s / calls * 1e9:6.0f} ns'
+              f'  ({naive_s / summary_s:.0f}x); same verdicts: {same}')
+        if not same:
+            raise SystemExit(f'regression: hard-mode verdicts differ after {n} guesses')
+        filter_s = min(timeit.repeat(lambda: [w for w in words if constraints.violation(w) is None], number=5, repeat=3)) / 5
+        mask_s = min(timeit.repeat(lambda: index.words_in(constraints.mask(index)), number=5, repeat=3)) / 5
+        print(f'    legal guesses ({index.count(constraints.mask(index))}/{len(words)}): filter loop'
+              f' {filter_s * 1e6:7.0f} us  compiled mask {mask_s * 1e6:6.0f} us')
+
+
+def _traced_bytes(build):
+    """Bytes still allocated after `build()`, and its result.
+
+    Español: Bytes que siguen asignados tras `build()`, y su resultado.
+    """
+    tracemalloc.start()
+    value = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, value
+
+
+def bench_dawg(lengths='5,7', size='200000'):
+    """Dictionary backends: memory per word and lookup latency, list+set vs DAWG.
+
+    Español: Backends del diccionario: memoria por palabra y latencia, lista+conjunto vs DAWG.
+    """
+    from dawg import Dawg
+
+    rng = random.Random(0)
+    sources = []
+    for length in (int(n) for n in lengths.split(',')):
+        WordList._ensure_loaded(length)
+        sources.append((f'words_{length}', list(word_list._words_by_length[length])))
+    sources.append((f'{int(size)} synthetic', _synthetic_words(int(size))))
+    for label, words in sources:
+        # Fresh str objects, so neither side is charged or spared for sharing.
+        # Cadenas nuevas, para que ninguno de los dos comparta las existentes.
+        text = '\n'.join(words)
+        list_bytes, (plain, known) = _traced_bytes(lambda: (lambda w: (w, frozenset(w)))(text.split('\n')))
+        dawg_bytes, graph = _traced_bytes(lambda: Dawg(text.split('\n')))
+        if list(graph) != plain:
+            raise SystemExit(f'regression: {label} DAWG does not round-trip the word list')
+        n = len(words)
+        print(f'{label}: {n} words, DAWG of {graph.node_count()} nodes')
+        print(f'  memory   list+set {list_bytes / n:6.1f} B/word  DAWG {dawg_bytes / n:6.1f} B/word'
+              f'  (list+set / DAWG {list_bytes / dawg_bytes:.1f}x)')
+        probes = [rng.choice(words) for _ in range(500)] + \
+            [''.join(rng.choice(string.ascii_lowercase) for _ in range(len(words[0]))) for _ in range(500)]
+        indexes = [rng.randrange(n) for _ in range(1000)]
+        prefixes = [w[:2] for w in probes[:100]]
+        rows = (
+            ('membership', lambda: [w in known for w in probes], lambda: [w in graph for w in probes], 1000),
+            ('index', lambda: [plain[i] for i in indexes], lambda: [graph[i] for i in indexes], 1000),
+            ('prefix (2 letters)', lambda: [[w for w in plain if w.startswith(p)] for p in prefixes],
+             lambda: [graph.with_prefix(p) for p in prefixes], 100),
+        )
+        for name, baseline, fn, calls in rows:
+            number = 1 if calls == 100 else 20
+            base_s = min(timeit.repeat(baseline, number=number, repeat=3)) / (calls * number)
+            dawg_s = min(timeit.repeat(fn, number=number, repeat=3)) / (calls * number)
+            print(f'  {name:<19} list+set {base_s * 1e6:9.2f} us  DAWG {dawg_s * 1e6:7.2f} us')
+        same = [sorted(w for w in plain if w.startswith(p)) for p in prefixes] == [graph.with_prefix(p) for p in prefixes]
+        print(f'  same prefix results: {same}')
+        if not same:
+            raise SystemExit(f'regression: {label} DAWG prefix results differ')
+
+
+def bench_coldstart(threads='32', rounds='10', size='50000', lengths='5,6,7,8'):
+    """Concurrent cold start: many threads hammering lookups while dictionaries load.
+
+    Español: Arranque en frío concurrente: muchos hilos consultando mientras se cargan los diccionarios.
+    """
+    import threading
+    import word_index
+
+    threads, rounds, size = int(threads), int(rounds), int(size)
+    lengths = [int(n) for n in lengths.split(',')]
+    ops = 2000
+    sources = {length: _synthetic_words(size, length, seed=length) for length in lengths}
+    known = {length: set(words) for length, words in sources.items()}
+    saved = (word_list.MODULE_DIR, dict(word_list._words_by_length), dict(word_list._word_sets_by_length),
+             dict(word_index._indexes))
+    load_locked = WordList.__dict__['_load_locked']
+    loads = {}
+    loads_lock = threading.Lock()
+
+    def counted(length):
+        with loads_lock:
+            loads[length] = loads.get(length, 0) + 1
+        load_locked.__func__(WordList, length)
+
+    print(f'{threads} threads x {ops} lookups per round, {rounds} cold rounds, '
+          f'{size} words for each length {lengths}')
+    with tempfile.TemporaryDirectory() as tmp:
+        word_list.MODULE_DIR = tmp
+        WordList._load_locked = counted
+        try:
+            for length, words in sources.items():
+                with open(word_list.words_path(length), 'w', encoding='utf-8') as f:
+                    f.writelines(w + '\n' for w in words)
+            errors = []
+            elapsed = 0.0
+            for r in range(rounds):
+                # Cold state; every other round also drops the compiled files
+                # (so threads race to compile) and starts the background preload.
+                # Estado en frío; una ronda de cada dos borra también los
+                # compilados y arranca la precarga en segundo plano.
+                word_list._words_by_length.clear()
+                word_list._word_sets_by_length.clear()
+                for _, index in word_index._indexes.values():
+                    if index is not None:
+                        index.close()
+                word_index._indexes.clear()
+                if r % 2:
+                    for length in lengths:
+                        os.remove(word_list.compiled_path(length))
+                loads.clear()
+                barrier = threading.Barrier(threads + 1)
+
+                def hammer(tid):
+                    barrier.wait()
+                    try:
+                        for i in range(ops):
+                            length = lengths[(tid + i) % len(lengths)]
+                            word = WordList.get_random_word(length)
+                            if word not in known[length]:
+                                errors.append(f'random word {word!r} not in length {length}')
+                            if not WordList.is_known_word(sources[length][i % size], length):
+                                errors.append(f'known word rejected for length {length}')
+                            if WordList.is_known_word('#' * length, length):
+                                errors.append(f'unknown word accepted for length {length}')
+                    except Exception as exc:
+                        errors.append(repr(exc))
+
+                workers = [threading.Thread(target=hammer, args=(t,)) for t in range(threads)]
+                for worker in workers:
+                    worker.start()
+                preload = WordList.prewarm() if r % 2 else None
+                start = time.perf_counter()
+                barrier.wait()
+                for worker in workers:
+                    worker.join()
+                if preload is not None:
+                    preload.join()
+                elapsed += time.perf_counter() - start
+                if any(n != 1 for n in loads.values()) or sorted(loads) != lengths:
+                    errors.append(f'round {r}: loads per length {loads}')
+                for length in lengths:
+                    if list(word_list._words_by_length[length]) != sources[length]:
+                        errors.append(f'round {r}: length {length} published out of order')
+            total = rounds * threads * ops * 3
+            print(f'  {total} lookups in {elapsed:.2f} s ({total / elapsed:,.0f}/s); '
+                  f'each length loaded exactly once per round: {not any("loads" in e for e in errors)}')
+            print(f'  errors: {len(errors)}' + (f' (first: {errors[0]})' if errors else ''))
+            if errors:
+                raise SystemExit(f'regression: {errors[0]}')
+        finally:
+            WordList._load_locked = load_locked
+            for _, index in word_index._indexes.values():
+                if index is not None:
+                    index.close()
+            word_list.MODULE_DIR = saved[0]
+            word_list._words_by_length.clear()
+            word_list._words_by_length.update(saved[1])
+            word_list._word_sets_by_length.clear()
+            word_list._word_sets_by_length.update(saved[2])
+            word_index._indexes.clear()
+            word_index._indexes.update(saved[3])
+
+
+def bench_tree(lengths='5,7', states='200'):
+    """Decision tree: build time and size, per-move latency vs ranking guesses at play time.
+
+    Español: Árbol de decisión: tiempo y tamaño de construcción, latencia por jugada frente a ordenar intentos.
+    """
+    import decision_tree
+
+    rng = random.Random(0)
+    for length in (int(n) for n in lengths.split(',')):
+        patterns.load_matrix(length)  # the tree is built from the matrix / el árbol parte de la matriz
+        start = time.perf_counter()
+        path = decision_tree.build_tree(length)
+        build_s = time.perf_counter() - start
+        tree = decision_tree.load_tree(length)
+        counts = decision_tree.evaluate(tree)
+        mean = sum(k * v for k, v in counts.items()) / len(tree.words)
+        print(f'words_{length}: {len(tree.words)} words -> {tree.node_count()} nodes, '
+              f'{os.path.getsize(path) / 1e3:.1f} kB, built in {build_s:.2f} s; '
+              f'{mean:.3f} guesses on average, at most {max(counts)}')
+        # Game states along the tree: a random secret and 0..2 tree moves.
+        # Estados de partida sobre el árbol: secreto al azar y 0..2 jugadas.
+        games = []
+        for _ in range(int(states)):
+            game = Game(rng.choice(tree.words), length=length, intentos=6)
+            for _ in range(rng.randrange(3)):
+                if game.check_word(tree.next_guess(game.get_historial()))[3]:
+                    break
+            games.append(game)
+        tree_s = min(timeit.repeat(lambda: [solver.suggest_guess(g) for g in games], number=1, repeat=3))
+        rank_s = min(timeit.repeat(lambda: [solver.suggest_guess(g, tree=False) for g in games], number=1, repeat=1))
+        print(f'  suggest_guess over {len(games)} states: tree walk {tree_s / len(games) * 1e6:8.1f} us'
+              f'  entropy ranking {rank_s / len(games) * 1e6:10.1f} us  ({rank_s / tree_s:.0f}x)')
+
+
+BENCHMARKS = {
+    'lookup': bench_lookup,
+    'scoring': bench_scoring,
+    'startup': bench_startup,
+    'solver': bench_solver,
+    'firstprompt': bench_firstprompt,
+    'ingest': bench_ingest,
+    'encoding': bench_encoding,
+    'server': bench_server,
+    'sessions': bench_sessions,
+    'snapshot': bench_snapshot,
+    'batch': bench_batch,
+    'secret': bench_secret,
+    'deck': bench_deck,
+    'board': bench_board,
+    'hints': bench_hints,
+    'metrics': bench_metrics,
+    'adversarial': bench_adversarial,
+    'multi': bench_multi,
+    'hard': bench_hard,
+    'dawg': bench_dawg,
+    'coldstart': bench_coldstart,
+    'tree': bench_tree,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in BENCHMARKS:
+        print('Benchmarks disponibles / available benchmarks:')
+        for name, fn in BENCHMARKS.items():
+            print(f'  {name:<12} {fn.__doc__.splitlines()[0]}')
+        return
+    BENCHMARKS[argv[0]](*argv[1:])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""Candidate-set engine: narrow the possible secrets from guess feedback.
+
+English: For each word length a `CandidateIndex` keeps bitmask indexes over
+the ordered word list (bit i = word i, stored as Python ints):
+
+  - `at[(pos, letter)]`: words with `letter` at position `pos`.
+  - `at_least[(letter, n)]`: words containing `letter` at least `n` times.
+
+A scored guess becomes a handful of bitwise intersections: greens
+keep `at[(i, ch)]`, yellows and reds drop it, and per-letter counts are
+bounded by `at_least` (exactly, when some copy of the letter was red). Each
+guess therefore costs O(length) big-int operations, independent of how many
+guesses came before.
+
+Español: Para cada longitud, un `CandidateIndex` mantiene índices de
+máscaras de bits sobre la lista ordenada de palabras (bit i = palabra i).
+Cada intento puntuado se traduce en unas pocas intersecciones de
+bits, por lo que cada intento cuesta O(longitud) operaciones, sin importar
+cuántos intentos hubo antes.
+"""
+import metrics
+import word_list
+from encoding import AMARILLO, VERDE
+from word_list import WordList
+
+# Built indexes: length -> CandidateIndex.
+# Índices construidos: longitud -> CandidateIndex.
+_indexes = {}
+
+
+class CandidateIndex:
+    """Bitmask indexes over one length's word list.
+
+    Español: Índices de máscaras de bits sobre la lista de una longitud.
+    """
+
+    def __init__(self, words, length: int):
+        self.words = words
+        # Plain list for `words_in`; a `dawg.Dawg` backend would decode every
+        # word on each read.
+        # Lista simple para `words_in`; un backend `dawg.Dawg` decodificaría
+        # cada palabra en cada lectura.
+        self._decoded = words if isinstance(words, list) else list(words)
+        self.length = length
+        self.all_mask = (1 << len(words)) - 1
+        at = {}
+        at_least = {}
+        for i, w in enumerate(words):
+            bit = 1 << i
+            counts = {}
+            for pos, ch in enumerate(w):
+                at[(pos, ch)] = at.get((pos, ch), 0) | bit
+                counts[ch] = counts.get(ch, 0) + 1
+            for ch, n in counts.items():
+                for k in range(1, n + 1):
+                    at_least[(ch, k)] = at_least.get((ch, k), 0) | bit
+        self.at = at
+        self.at_least = at_least
+
+    def constrain(self, mask: int, guess: str, pattern: int) -> int:
+        """Intersect `mask` with the words consistent with one scored guess.
+
+        English: `pattern` is the base-3 feedback of `guess` (see
+        `encoding.py`). The returned mask holds exactly the words that would
+        have produced the same feedback for that guess.
+        Español: `pattern` es el resultado en base 3 de `guess` (ver
+        `encoding.py`). La máscara devuelta contiene exactamente las palabras
+        que habrían producido el mismo resultado para esa suposición.
+        """
+        found = {}
+        capped = set()
+        for pos, ch in enumerate(guess):
+            pattern, code = divmod(pattern, 3)
+            here = self.at.get((pos, ch), 0)
+            if code == VERDE:
+                mask &= here
+                found[ch] = found.get(ch, 0) + 1
+            else:
+                mask &= ~here
+                if code == AMARILLO:
+                    found[ch] = found.get(ch, 0) + 1
+                else:
+                    capped.add(ch)
+        for ch, n in found.items():
+            mask &= self.at_least.get((ch, n), 0)
+        for ch in capped:
+            # A red copy means the secret has exactly `found[ch]` of `ch`.
+            # Una copia roja implica exactamente `found[ch]` apariciones.
+            mask &= ~self.at_least.get((ch, found.get(ch, 0) + 1), 0)
+        return mask
+
+    def count(self, mask: int) -> int:
+        """Number of candidates in `mask`.
+
+        Español: Número de candidatas en `mask`.
+        """
+        return bin(mask).count('1')
+
+    def words_in(self, mask: int):
+        """Candidate words in `mask`, in dictionary order.
+
+        Español: Palabras candidatas en `mask`, en el orden del diccionario.
+        """
+        words = self._decoded
+        out = []
+        while mask:
+            low = mask & -mask
+            out.append(words[low.bit_length() - 1])
+            mask ^= low
+        return out
+
+
+def get_index(length: int) -> CandidateIndex:
+    """Return the (cached) candidate index for `length`.
+
+    Español: Devuelve el índice de candidatas (en caché) para `length`.
+    """
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    index = _indexes.get(length)
+    if index is None or index.words is not words:
+        if metrics.ENABLED:
+            metrics.CANDIDATE_INDEX_MISS.inc()
+        index = CandidateIndex(words, length)
+        _indexes[length] = index
+    elif metrics.ENABLED:
+        metrics.CANDIDATE_INDEX_HIT.inc()
+    return index
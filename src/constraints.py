@@ -0,0 +1,119 @@
+"""Hard-mode constraint state, updated incrementally from scored guesses.
+
+English: In hard mode every guess must reuse the revealed hints: a green
+letter stays in its position and every green or yellow letter appears at
+least as many times as revealed. Rather than re-walking the history, a
+`Constraints` object folds each scored guess into a summary:
+
+  - `fixed[pos]`: letter known at `pos` (greens), or None.
+  - `min_counts[ch]`: letter `ch` appears at least this many times.
+  - `max_counts[ch]`: exact count of `ch` once some copy was red; 0 means
+    the letter is excluded.
+  - `forbidden`: (pos, ch) pairs known to be wrong (yellows and reds).
+
+The sum of the minimum counts never exceeds the word length, so
+`violation()` checks a guess in O(length) however many attempts were made.
+`mask()` compiles the same summary into a bitmask over a
+`candidates.CandidateIndex`, which pre-filters the dictionary to the guesses
+that are still legal (with `strict=True`, to the words consistent with every
+hint, i.e. the possible secrets).
+
+Español: En modo difícil cada intento debe reutilizar las pistas
+reveladas: una letra verde se queda en su posición y cada letra verde o
+amarilla aparece al menos tantas veces como se reveló. En lugar de recorrer
+el historial, `Constraints` acumula cada intento en un resumen (posiciones
+fijas, mínimos por letra, máximos/letras excluidas y posiciones prohibidas),
+así `violation()` comprueba un intento en O(longitud). `mask()` compila el
+mismo resumen en una máscara de bits sobre un `CandidateIndex` para filtrar
+el diccionario a los intentos aún legales.
+"""
+from encoding import AMARILLO, VERDE
+
+
+class Constraints:
+    """Summary of the hints revealed so far for one word length.
+
+    Español: Resumen de las pistas reveladas hasta ahora para una longitud.
+    """
+
+    __slots__ = ('length', 'fixed', 'min_counts', 'max_counts', 'forbidden')
+
+    def __init__(self, length: int):
+        self.length = length
+        self.fixed = [None] * length
+        self.min_counts = {}
+        self.max_counts = {}
+        self.forbidden = set()
+
+    def update(self, guess: str, pattern: int):
+        """Fold one scored guess (base-3 `pattern`) into the summary.
+
+        Español: Incorpora un intento puntuado (`pattern` en base 3) al resumen.
+        """
+        found = {}
+        capped = set()
+        for pos, ch in enumerate(guess):
+            pattern, code = divmod(pattern, 3)
+            if code == VERDE:
+                self.fixed[pos] = ch
+                found[ch] = found.get(ch, 0) + 1
+            else:
+                self.forbidden.add((pos, ch))
+                if code == AMARILLO:
+                    found[ch] = found.get(ch, 0) + 1
+                else:
+                    capped.add(ch)
+        for ch, n in found.items():
+            if n > self.min_counts.get(ch, 0):
+                self.min_counts[ch] = n
+        for ch in capped:
+            # A red copy means the secret has exactly `found[ch]` of `ch`.
+            # Una copia roja implica exactamente `found[ch]` apariciones.
+            self.max_counts[ch] = found.get(ch, 0)
+
+    def violation(self, word: str):
+        """Why `word` breaks hard mode, or None when it is allowed.
+
+        English: Only the hard-mode rule is enforced (greens in place,
+        revealed letters reused); excluded letters and forbidden positions
+        may still be played, as in the original game.
+        Español: Sólo se aplica la regla del modo difícil (verdes en su
+        sitio, letras reveladas reutilizadas); las letras excluidas y las
+        posiciones prohibidas se pueden seguir jugando, como en el original.
+        """
+        for pos, ch in enumerate(self.fixed):
+            if ch is not None and word[pos] != ch:
+                return f'La letra {pos + 1} debe ser {ch.upper()}'
+        if self.min_counts:
+            counts = {}
+            for ch in word:
+                counts[ch] = counts.get(ch, 0) + 1
+            for ch, n in self.min_counts.items():
+                if counts.get(ch, 0) < n:
+                    times = '' if n == 1 else f' {n} veces'
+                    return f'El intento debe usar {ch.upper()}{times}'
+        return None
+
+    def mask(self, index, strict: bool = False) -> int:
+        """Bitmask of the words of `index` that satisfy the summary.
+
+        English: `index` is the `candidates.CandidateIndex` of the length.
+        Without `strict` the mask holds the legal hard-mode guesses; with it,
+        also excluded letters, exact counts and forbidden positions apply.
+        Español: `index` es el `CandidateIndex` de la longitud. Sin `strict`
+        la máscara contiene los intentos legales del modo difícil; con él se
+        aplican también letras excluidas, conteos exactos y posiciones
+        prohibidas.
+        """
+        mask = index.all_mask
+        for pos, ch in enumerate(self.fixed):
+            if ch is not None:
+                mask &= index.at.get((pos, ch), 0)
+        for ch, n in self.min_counts.items():
+            mask &= index.at_least.get((ch, n), 0)
+        if strict:
+            for ch, n in self.max_counts.items():
+                mask &= ~index.at_least.get((ch, n + 1), 0)
+            for key in self.forbidden:
+                mask &= ~index.at.get(key, 0)
+        return mask
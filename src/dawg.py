@@ -0,0 +1,219 @@
+"""Compact dictionary backend: a minimized word graph (DAWG) in flat arrays.
+
+English: A `Dawg` stores one word list as a deterministic acyclic word
+graph: a trie whose identical subtrees (shared suffixes) are merged, built
+incrementally from the sorted words so only the current path is ever
+unminimized. The graph is then flattened into a few arrays:
+
+    first[node]     offset of the node's first edge (edges are contiguous)
+    count[node]     words reachable from the node
+    final[node]     1 when a word ends at the node
+    labels          one str with every edge letter, sorted per node
+    target[edge]    node the edge leads to
+    offset[edge]    words of the node ranked before the edge's subtree
+
+Lookups walk one edge per letter (`str.find` over a node's few labels), so
+membership and prefix tests cost O(length). `offset` lets the graph map a
+rank to its word with one bisection per letter, without storing the
+words. A `perm` array keeps the original list order, so a `Dawg` is a
+drop-in sequence-and-set for the `word_list` caches: `len()`, `dawg[i]`
+(the i-th word of the source list), iteration and `in`. `with_prefix`
+enumerates completions in sorted order.
+
+Español: Un `Dawg` guarda una lista de palabras como un grafo acíclico de
+palabras: un trie cuyos subárboles idénticos (sufijos comunes) se fusionan,
+construido de forma incremental a partir de las palabras ordenadas y
+aplanado en unos pocos arreglos. Las búsquedas recorren una arista por
+letra, así que pertenencia y prefijos cuestan O(longitud); `offset` permite
+pasar de un rango a su palabra sin guardar las palabras, y `perm` conserva
+el orden original de la lista, de modo que un `Dawg` sustituye a la lista y
+al conjunto de `word_list`. `with_prefix` enumera las terminaciones en orden.
+"""
+from array import array
+from bisect import bisect_right
+
+
+class Dawg:
+    """Minimized word graph over `words`; see the module docstring.
+
+    Español: Grafo de palabras minimizado sobre `words`.
+    """
+
+    __slots__ = ('_first', '_count', '_final', '_labels', '_target', '_offset', '_root', '_perm')
+
+    def __init__(self, words):
+        words = list(words)
+        order = sorted(range(len(words)), key=words.__getitem__)
+        # Incremental minimization (sorted input): `path` holds the open
+        # nodes of the previous word as [final, [(label, child)]], and
+        # frozen nodes are shared through `register` by their signature.
+        # Minimización incremental: `path` guarda los nodos abiertos de la
+        # palabra anterior y los nodos cerrados se comparten por su firma.
+        register = {}
+        finals = []
+        edges = []
+        path = [[False, []]]
+        previous = ''
+        perm = array('I', [0]) * len(words)
+
+        def freeze(depth):
+            while len(path) - 1 > depth:
+                final, out = path.pop()
+                signature = (final, tuple(out))
+                node = register.get(signature)
+                if node is None:
+                    node = register[signature] = len(finals)
+                    finals.append(final)
+                    edges.append(signature[1])
+                parent = path[-1][1]
+                parent[-1] = (parent[-1][0], node)
+
+        rank = 0
+        for i in order:
+            word = words[i]
+            if word == previous and rank:
+                perm[i] = rank - 1
+                continue
+            common = 0
+            limit = min(len(word), len(previous))
+            while common < limit and word[common] == previous[common]:
+                common += 1
+            freeze(common)
+            for ch in word[common:]:
+                path[-1][1].append((ch, None))
+                path.append([False, []])
+            path[-1][0] = True
+            previous = word
+            perm[i] = rank
+            rank += 1
+        freeze(0)
+        final, out = path[0]
+        self._root = len(finals)
+        finals.append(final)
+        edges.append(tuple(out))
+
+        # Flatten. Children always have smaller ids than their parents, so
+        # counts fill in one forward pass.
+        # Aplanado. Los hijos siempre tienen ids menores que sus padres.
+        self._first = array('I', [0])
+        self._count = array('I')
+        self._final = bytearray(finals)
+        self._target = array('I')
+        self._offset = array('I')
+        labels = []
+        for node, out in enumerate(edges):
+            total = 1 if finals[node] else 0
+            for label, child in out:
+                labels.append(label)
+                self._target.append(child)
+                self._offset.append(total)
+                total += self._count[child]
+            self._count.append(total)
+            self._first.append(len(self._target))
+        self._labels = ''.join(labels)
+        self._perm = perm
+
+    def _walk(self, prefix: str):
+        """Node reached by `prefix` from the root, or None.
+
+        Español: Nodo al que lleva `prefix` desde la raíz, o None.
+        """
+        node = self._root
+        first, labels, target = self._first, self._labels, self._target
+        for ch in prefix:
+            edge = labels.find(ch, first[node], first[node + 1])
+            if edge < 0:
+                return None
+            node = target[edge]
+        return node
+
+    def __contains__(self, word) -> bool:
+        if not isinstance(word, str):
+            return False
+        node = self._walk(word)
+        return node is not None and self._final[node] == 1
+
+    def __len__(self):
+        return len(self._perm)
+
+    def word_at_rank(self, rank: int) -> str:
+        """The `rank`-th distinct word in sorted order.
+
+        Español: La palabra número `rank` en orden alfabético.
+        """
+        if not 0 <= rank < self._count[self._root]:
+            raise IndexError(rank)
+        first, final, labels, target, offset = self._first, self._final, self._labels, self._target, self._offset
+        node = self._root
+        letters = []
+        while not (rank == 0 and final[node]):
+            edge = bisect_right(offset, rank, first[node], first[node + 1]) - 1
+            rank -= offset[edge]
+            letters.append(labels[edge])
+            node = target[edge]
+        return ''.join(letters)
+
+    def __getitem__(self, i: int) -> str:
+        """The `i`-th word of the source list (same order as the list).
+
+        Español: La palabra `i` de la lista de origen (mismo orden).
+        """
+        if i < 0:
+            i += len(self._perm)
+        if not 0 <= i < len(self._perm):
+            raise IndexError(i)
+        return self.word_at_rank(self._perm[i])
+
+    def __iter__(self):
+        for rank in self._perm:
+            yield self.word_at_rank(rank)
+
+    def has_prefix(self, prefix: str) -> bool:
+        """True when some word starts with `prefix`.
+
+        Español: True si alguna palabra empieza por `prefix`.
+        """
+        node = self._walk(prefix)
+        # The root of an empty graph exists but reaches no word.
+        # La raíz de un grafo vacío existe pero no lleva a ninguna palabra.
+        return node is not None and self._count[node] > 0
+
+    def count_prefix(self, prefix: str) -> int:
+        """Number of words starting with `prefix`.
+
+        Español: Número de palabras que empiezan por `prefix`.
+        """
+        node = self._walk(prefix)
+        return 0 if node is None else self._count[node]
+
+    def with_prefix(self, prefix: str, limit: int = None):
+        """Words starting with `prefix`, in sorted order (at most `limit`).
+
+        Español: Palabras que empiezan por `prefix`, en orden (como mucho `limit`).
+        """
+        node = self._walk(prefix)
+        out = []
+        if node is None:
+            return out
+        first, final, labels, target = self._first, self._final, self._labels, self._target
+        # Depth-first with an explicit stack of (node, word so far), pushed
+        # in reverse so words come out in sorted order.
+        # En profundidad con una pila explícita, apilada al revés para
+        # obtener las palabras en orden.
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if final[node]:
+                out.append(word)
+                if limit is not None and len(out) >= limit:
+                    break
+            for edge in range(first[node + 1] - 1, first[node] - 1, -1):
+                stack.append((target[edge], word + labels[edge]))
+        return out
+
+    def node_count(self) -> int:
+        """Nodes in the minimized graph (for size reports).
+
+        Español: Nodos del grafo minimizado (para informes de tamaño).
+        """
+        return len(self._count)
@@ -0,0 +1,446 @@
+"""Precomputed decision trees: the whole guessing strategy for a dictionary.
+
+English: For a fixed words_N.txt the best guess only depends on the
+(guess, pattern) history, so the strategy can be solved once offline and
+stored as a tree: each node holds the guess to play and one edge per
+possible feedback pattern leading to the next node (the all-green pattern
+ends the game and has no edge). The file sits next to the word list as
+'words_N.tree', in flat little-endian arrays:
+
+    header (64 bytes): magic, length, words, nodes, edges, breadth (0 = all), sha256(words_N.txt)
+    guess[nodes]       uint32 row of the node's guess in the word list
+    first[nodes + 1]   uint32 offset of the node's first edge
+    pattern[edges]     feedback pattern of the edge (sorted per node), as wide
+                       as in `patterns.py` (uint8/uint16/uint32 by length)
+    child[edges]       uint32 node the edge leads to
+
+Answering "best guess at this state" walks one edge per guess played (one
+bisection over at most 3**N patterns), so it costs the same whatever the
+dictionary size. A tree whose checksum no longer matches the word file is
+rebuilt. Build every tree ahead of time (prints time and size) with:
+
+    python decision_tree.py
+
+The search minimizes the total number of guesses over all secrets
+(branch and bound with memoization: a bucket of m secrets needs at least
+2m - 1 guesses). By default every guess is tried at every node, best
+expected information first, so the tree is optimal; for large dictionaries
+`breadth` limits each node to that many guesses (plus as many candidate
+secrets) and the tree is then the best within that beam.
+
+Español: Para un words_N.txt fijo el mejor intento sólo depende del
+historial (intento, patrón), así que la estrategia se resuelve una vez y se
+guarda como un árbol: cada nodo tiene el intento a jugar y una arista por
+patrón posible hacia el siguiente nodo. El archivo 'words_N.tree' guarda el
+árbol en arreglos planos y se regenera si cambia la suma de control del
+diccionario. Consultar el mejor intento recorre una arista por intento
+jugado, con coste constante. La búsqueda minimiza el total de intentos
+(ramificación y poda con memoización). Por defecto prueba todos los
+intentos en cada nodo, así que el árbol es óptimo; con diccionarios grandes
+`breadth` limita cada nodo a ese número de intentos (más otros tantos
+candidatos).
+"""
+import argparse
+import array
+import math
+import os
+import struct
+import sys
+import time
+from bisect import bisect_left
+
+import patterns
+import word_list
+from encoding import score_pair, winning_pattern
+from scoring import np
+from word_list import WordList
+
+MAGIC = b'WRDLTRE1'
+HEADER = struct.Struct('<8sIIIII32s')
+HEADER_SIZE = 64
+
+# Guesses tried per node by default; None tries them all (optimal tree).
+# Intentos probados por nodo por defecto; None los prueba todos (óptimo).
+BREADTH = None
+
+# Loaded trees: length -> DecisionTree.
+# Árboles cargados: longitud -> DecisionTree.
+_trees = {}
+
+# Lengths without a fresh tree: length -> stamps of the word and tree files
+# when that was last checked, so `load_tree(build=False)` does not rehash
+# words_N.txt on every call until one of them changes.
+# Longitudes sin árbol vigente: longitud -> sellos de los archivos de
+# palabras y del árbol, para no recalcular la suma en cada llamada.
+_misses = {}
+
+
+class DecisionTree:
+    """Read-only decision tree over the ordered word list of one length.
+
+    Español: Árbol de decisión de sólo lectura sobre la lista de una longitud.
+    """
+
+    __slots__ = ('length', 'words', 'guess', 'first', 'pattern', 'child', 'breadth', 'path')
+
+    def __init__(self, length: int, words, guess, first, pattern, child, breadth: int, path=None):
+        self.length = length
+        self.words = words
+        self.guess = guess
+        self.first = first
+        self.pattern = pattern
+        self.child = child
+        self.breadth = breadth
+        self.path = path
+
+    def node_count(self) -> int:
+        return len(self.guess)
+
+    def nbytes(self) -> int:
+        """Size of the flat arrays (the file body).
+
+        Español: Tamaño de los arreglos planos (el cuerpo del archivo).
+        """
+        return sum(len(a) * a.itemsize for a in (self.guess, self.first, self.pattern, self.child))
+
+    def guess_at(self, node: int) -> str:
+        return self.words[self.guess[node]]
+
+    def step(self, node: int, pattern: int):
+        """Node reached from `node` after `pattern`, or None when off the tree.
+
+        Español: Nodo al que se llega desde `node` tras `pattern`, o None.
+        """
+        lo, hi = self.first[node], self.first[node + 1]
+        edge = bisect_left(self.pattern, pattern, lo, hi)
+        if edge < hi and self.pattern[edge] == pattern:
+            return self.child[edge]
+        return None
+
+    def walk(self, history):
+        """Node after `history` (objects with `.word` and `.pattern`, e.g.
+        `Game.get_historial()`), or None when a guess left the tree.
+
+        Español: Nodo tras `history`, o None si algún intento se salió del árbol.
+        """
+        node = 0
+        for resultados in history:
+            if node is None or self.guess_at(node) != resultados.word:
+                return None
+            node = self.step(node, resultados.pattern)
+        return node
+
+    def next_guess(self, history):
+        """Best guess after `history`, or None when it left the tree.
+
+        Español: Mejor intento tras `history`, o None si se salió del árbol.
+        """
+        node = self.walk(history)
+        return None if node is None else self.guess_at(node)
+
+
+def tree_path(length: int) -> str:
+    """Path of the 'words_N.tree' sidecar for `length`.
+
+    Español: Ruta del archivo auxiliar 'words_N.tree'.
+    """
+    return os.path.join(word_list.MODULE_DIR, f'words_{length}.tree')
+
+
+def _file_stamp(path: str):
+    """(size, mtime_ns) of `path`, or None if missing.
+
+    Español: (tamaño, mtime_ns) de `path`, o None si no existe.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _read_header(path: str):
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read(HEADER_SIZE)
+    except FileNotFoundError:
+        return None
+    if len(raw) < HEADER_SIZE:
+        return None
+    header = HEADER.unpack_from(raw)
+    if header[0] != MAGIC:
+        return None
+    return header[1:]
+
+
+class _Solver:
+    """Bounded exact search over one pattern matrix (see the module docstring).
+
+    Español: Búsqueda exacta acotada sobre una matriz de patrones.
+    """
+
+    def __init__(self, matrix, length: int, breadth: int):
+        self.matrix = matrix
+        self.breadth = breadth
+        self.win = winning_pattern(length)
+        self.memo = {}
+
+    def split(self, guess: int, rows):
+        """Buckets of `rows` (a tuple of secret rows) by the pattern of `guess`.
+
+        Español: Buckets de `rows` según el patrón de `guess`.
+        """
+        values = self.matrix.data[guess, list(rows)].tolist() if np is not None else \
+            [self.matrix.data[guess * self.matrix.count + r] for r in rows]
+        out = {}
+        for row, pattern in zip(rows, values):
+            out.setdefault(pattern, []).append(row)
+        return {pattern: tuple(bucket) for pattern, bucket in out.items()}
+
+    def _scores(self, rows):
+        """sum(c * log2(c)) over the bucket sizes of every guess (lower is better).
+
+        Español: sum(c * log2(c)) de los buckets de cada intento (menor es mejor).
+        """
+        n, count = len(rows), self.matrix.count
+        if np is not None:
+            block = np.sort(self.matrix.data[:, list(rows)], axis=1)
+            starts = np.ones(block.shape, dtype=bool)
+            starts[:, 1:] = block[:, 1:] != block[:, :-1]
+            flat = np.flatnonzero(starts.ravel())
+            sizes = np.diff(np.append(flat, count * n)).astype(np.float64)
+            return np.bincount(flat // n, weights=sizes * np.log2(sizes), minlength=count).tolist()
+        scores = []
+        for guess in range(count):
+            sizes = {}
+            for row in rows:
+                p = self.matrix.data[guess * count + row]
+                sizes[p] = sizes.get(p, 0) + 1
+            scores.append(sum(c * math.log2(c) for c in sizes.values()))
+        return scores
+
+    def options(self, rows):
+        """Guesses worth trying for `rows`, most promising first.
+
+        Español: Intentos que vale la pena probar para `rows`, los mejores primero.
+        """
+        scores = self._scores(rows)
+        members = set(rows)
+
+        def key(guess):
+            return round(scores[guess], 9), guess not in members, guess
+
+        ranked = sorted(range(len(scores)), key=key)
+        if self.breadth is None:
+            return ranked
+        best = ranked[:self.breadth]
+        best += [g for g in sorted(rows, key=key)[:self.breadth] if g not in best]
+        return best
+
+    def solve(self, rows, bound=float('inf')):
+        """(total guesses, best guess) for `rows`; exact when below `bound`.
+
+        Español: (total de intentos, mejor intento) para `rows`; exacto si
+        queda por debajo de `bound`.
+        """
+        n = len(rows)
+        if n <= 2:
+            return 2 * n - 1, rows[0]
+        cached = self.memo.get(rows)
+        if cached is not None:
+            return cached
+        best = (bound, None)
+        for guess in self.options(rows):
+            buckets = self.split(guess, rows)
+            if len(buckets) == 1 and guess not in buckets.get(self.win, ()):
+                continue
+            # Every secret takes this guess; each other bucket needs at
+            # least one more guess per secret, and 2 for all but one.
+            # Cada secreto usa este intento; los demás buckets necesitan al
+            # menos un intento más por secreto, y 2 para todos salvo uno.
+            lower = n + sum(2 * len(b) - 1 for p, b in buckets.items() if p != self.win)
+            if lower >= best[0]:
+                continue
+            total = lower
+            for p, bucket in sorted(buckets.items(), key=lambda item: -len(item[1])):
+                if p == self.win:
+                    continue
+                total += self.solve(bucket, best[0] - total + 2 * len(bucket) - 1)[0] - (2 * len(bucket) - 1)
+                if total >= best[0]:
+                    break
+            if total < best[0]:
+                best = (total, guess)
+        if best[1] is not None:
+            self.memo[rows] = best
+        return best
+
+
+def solve_tree(length: int, breadth: int = BREADTH):
+    """Solve the strategy for `length`; return (DecisionTree, total guesses).
+
+    English: The total is summed over every secret of the dictionary, so
+    total / words is the expected number of guesses.
+    Español: El total se suma sobre todos los secretos, así que total /
+    palabras es el número esperado de intentos.
+    """
+    matrix = patterns.load_matrix(length)
+    words = matrix.words
+    solver = _Solver(matrix, length, breadth)
+    rows = tuple(range(matrix.count))
+    total, _ = solver.solve(rows) if rows else (0, None)
+    guess, first, child = array.array('I'), array.array('I', [0]), array.array('I')
+    pattern = array.array(patterns._typecode(length))
+    # Breadth-first flattening: children get the next free ids in order.
+    # Aplanado en anchura: los hijos reciben los siguientes ids en orden.
+    queue = [rows] if rows else []
+    for rows in queue:
+        best = solver.solve(rows)[1]
+        guess.append(best)
+        for p, bucket in sorted(solver.split(best, rows).items()):
+            if p == solver.win:
+                continue
+            pattern.append(p)
+            child.append(len(queue))
+            queue.append(bucket)
+        first.append(len(pattern))
+    return DecisionTree(length, words, guess, first, pattern, child, breadth), total
+
+
+def build_tree(length: int, breadth: int = BREADTH) -> str:
+    """Solve and write the decision tree for `length`; return its path.
+
+    English: Writes to a temporary file and renames it into place, as
+    `patterns.build_matrix` does.
+    Español: Escribe en un archivo temporal y lo renombra al final, como
+    `patterns.build_matrix`.
+    """
+    checksum = word_list.words_checksum(length)
+    if checksum is None:
+        raise FileNotFoundError(word_list.words_path(length))
+    tree, _ = solve_tree(length, breadth)
+    path = tree_path(length)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    header = HEADER.pack(MAGIC, length, len(tree.words), tree.node_count(), len(tree.pattern), breadth or 0, checksum)
+    with open(tmp, 'wb') as f:
+        f.write(header.ljust(HEADER_SIZE, b'\0'))
+        for values in (tree.guess, tree.first, tree.pattern, tree.child):
+            if sys.byteorder != 'little':
+                values = array.array(values.typecode, values)
+                values.byteswap()
+            f.write(values.tobytes())
+    os.replace(tmp, path)
+    tree.path = path
+    _trees[length] = tree
+    return path
+
+
+def _read_tree(path: str, length: int, words, header):
+    """Read the arrays of a tree file, or None when the body is inconsistent.
+
+    English: The body must have exactly the sizes announced by the header
+    and only in-range offsets, rows and nodes; a truncated or corrupt file
+    is then rebuilt instead of walking out of range.
+    Español: El cuerpo debe tener exactamente los tamaños de la cabecera y
+    sólo desplazamientos, filas y nodos válidos; si no, se reconstruye.
+    """
+    _, count, nodes, edges, breadth, _ = header
+    layout = (('I', nodes), ('I', nodes + 1), (patterns._typecode(length), edges), ('I', edges))
+    with open(path, 'rb') as f:
+        f.seek(HEADER_SIZE)
+        body = f.read()
+    if len(body) != sum(array.array(typecode).itemsize * n for typecode, n in layout):
+        return None
+    arrays = []
+    offset = 0
+    for typecode, n in layout:
+        values = array.array(typecode)
+        values.frombytes(body[offset:offset + n * values.itemsize])
+        if sys.byteorder != 'little':
+            values.byteswap()
+        arrays.append(values)
+        offset += n * values.itemsize
+    guess, first, _, child = arrays
+    if (first[0] != 0 or first[-1] != edges or any(a > b for a, b in zip(first, first[1:]))
+            or (nodes and max(guess) >= count) or (edges and max(child) >= nodes)):
+        return None
+    return DecisionTree(length, words, *arrays, breadth or None, path)
+
+
+def load_tree(length: int, build: bool = True):
+    """Return the decision tree for `length`, building it if missing or stale.
+
+    English: With `build=False` a missing or stale tree gives None instead
+    (building takes seconds, so play-time callers fall back to `solver`).
+    Español: Con `build=False` un árbol ausente u obsoleto devuelve None
+    (construirlo tarda segundos; en juego se recurre a `solver`).
+    """
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    cached = _trees.get(length)
+    if cached is not None and cached.words is words:
+        return cached
+    path = tree_path(length)
+    stamps = _file_stamp(word_list.words_path(length)), _file_stamp(path)
+    if not build and _misses.get(length) == stamps:
+        return None
+    checksum = word_list.words_checksum(length)
+    if checksum is None:
+        _misses[length] = stamps
+        return None
+    header = _read_header(path)
+    tree = None
+    if header is not None and (header[0], header[1], header[5]) == (length, len(words), checksum):
+        tree = _read_tree(path, length, words, header)
+    if tree is None:
+        if not build:
+            _misses[length] = stamps
+            return None
+        build_tree(length)
+        return _trees[length]
+    _misses.pop(length, None)
+    _trees[length] = tree
+    return tree
+
+
+def best_guess(game, build: bool = False):
+    """Tree move for a running `Game`, or None (no fresh tree, or off the tree).
+
+    Español: Jugada del árbol para un `Game` en curso, o None.
+    """
+    tree = load_tree(game.length, build=build)
+    return None if tree is None else tree.next_guess(game.get_historial())
+
+
+def evaluate(tree):
+    """Play every secret through `tree`: return {guesses needed: secrets}.
+
+    Español: Juega cada secreto con `tree`: devuelve {intentos: secretos}.
+    """
+    counts = {}
+    for secret in tree.words:
+        node, used = 0, 1
+        while tree.guess_at(node) != secret:
+            node = tree.step(node, score_pair(tree.guess_at(node), secret))
+            used += 1
+        counts[used] = counts.get(used, 0) + 1
+    return dict(sorted(counts.items()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the decision tree of every words_N.txt')
+    parser.add_argument('--breadth', type=int, default=BREADTH,
+                        help='guesses tried per node (default: all, optimal tree)')
+    args = parser.parse_args(argv)
+    for length in word_list.available_lengths():
+        start = time.perf_counter()
+        path = build_tree(length, args.breadth)
+        elapsed = time.perf_counter() - start
+        tree = _trees[length]
+        counts = evaluate(tree)
+        mean = sum(k * v for k, v in counts.items()) / len(tree.words)
+        print(f'{os.path.basename(path)}: {tree.node_count()} nodes, {os.path.getsize(path) / 1e3:.1f} kB'
+              f' in {elapsed:.2f}s; {mean:.3f} guesses on average, at most {max(counts)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""Non-repeating secret rotation: per-player shuffled decks with O(1) state.
+
+English: A `Deck` hands out the indexes 0..count-1 of a dictionary in a
+seeded pseudo-random order, each exactly once per *cycle*, then reshuffles
+for the next cycle. The permutation is never stored: position `cursor` of
+cycle `cycle` is mapped through a small keyed Feistel network over the next
+power-of-four domain, with cycle walking to stay below `count`. A deck is
+therefore just (seed, cycle, cursor) and a draw is O(1) (a few integer
+mixes; cycle walking needs fewer than 4 rounds on average).
+
+`DeckStore` keeps one deck per player (or per shard) for one word length
+and persists them in a compact fixed-width file:
+
+    header   magic, length, dictionary size, store seed, record count
+    records  count x (player key 16 bytes, seed u64, cycle u32, cursor u32)
+
+where the player key is a 16-byte BLAKE2b digest of the player id, so ids
+of any length fit a fixed-width record.
+
+If the dictionary size changed since the file was written, every deck starts
+a new cycle (the old order no longer covers the same words).
+
+Español: Un `Deck` entrega los índices 0..count-1 de un diccionario en un
+orden pseudoaleatorio con semilla, cada uno exactamente una vez por *ciclo*,
+y luego baraja de nuevo. La permutación nunca se guarda: la posición
+`cursor` del ciclo `cycle` pasa por una pequeña red de Feistel con clave, así
+que un mazo es sólo (semilla, ciclo, cursor) y cada extracción es O(1).
+`DeckStore` mantiene un mazo por jugador (o partición) y los persiste en un
+archivo compacto de registros de ancho fijo.
+"""
+import hashlib
+import os
+import struct
+
+import word_index
+
+MAGIC = b'WRDLDCK1'
+HEADER = struct.Struct('<8sIIQI')
+RECORD = struct.Struct('<16sQII')
+KEY_WIDTH = 16
+
+_MASK64 = (1 << 64) - 1
+_ROUNDS = 4
+
+
+def _mix(value: int) -> int:
+    """64-bit integer finalizer (splitmix64).
+
+    Español: Mezclador final de enteros de 64 bits (splitmix64).
+    """
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+class Deck:
+    """Seeded shuffled deck over `count` indexes; see the module docstring.
+
+    Español: Mazo barajado con semilla sobre `count` índices.
+    """
+
+    __slots__ = ('count', 'seed', 'cycle', 'cursor', '_keys', '_half')
+
+    def __init__(self, count: int, seed: int, cycle: int = 0, cursor: int = 0):
+        if count <= 0:
+            raise ValueError('A deck needs at least one card')
+        self.count = count
+        self.seed = seed & _MASK64
+        self.cycle = cycle
+        self.cursor = cursor
+        self._keys = None
+        self._half = max(1, ((count - 1).bit_length() + 1) // 2)
+
+    def _round_keys(self):
+        if self._keys is None:
+            raw = hashlib.sha256(struct.pack('<QI', self.seed, self.cycle)).digest()
+            self._keys = struct.unpack_from(f'<{_ROUNDS}Q', raw)
+        return self._keys
+
+    def position(self, cursor: int) -> int:
+        """Index dealt at `cursor` in the current cycle (no state change).
+
+        Español: Índice que sale en `cursor` del ciclo actual (sin cambiar estado).
+        """
+        half = self._half
+        mask = (1 << half) - 1
+        keys = self._round_keys()
+        value = cursor
+        while True:
+            left, right = value >> half, value & mask
+            for key in keys:
+                left, right = right, left ^ (_mix(right ^ key) & mask)
+            value = left << half | right
+            # Cycle walking: re-encrypt until the value lands in range.
+            # Recorrido de ciclo: se vuelve a cifrar hasta caer en el rango.
+            if value < self.count:
+                return value
+
+    def draw(self) -> int:
+        """Deal the next index; reshuffles after `count` draws.
+
+        Español: Reparte el siguiente índice; baraja de nuevo tras `count` extracciones.
+        """
+        index = self.position(self.cursor)
+        self.cursor += 1
+        if self.cursor == self.count:
+            self.cycle += 1
+            self.cursor = 0
+            self._keys = None
+        return index
+
+    def remaining(self) -> int:
+        """Draws left before the deck cycles.
+
+        Español: Extracciones restantes antes de que el mazo cicle.
+        """
+        return self.count - self.cursor
+
+
+class DeckStore:
+    """One `Deck` per player id for a word length, with compact persistence.
+
+    English: Player decks are seeded from the store seed and the player id,
+    so a fresh store with the same seed deals the same sequences.
+    Español: Los mazos se siembran con la semilla del almacén y el id del
+    jugador, así que un almacén nuevo con la misma semilla reparte igual.
+    """
+
+    def __init__(self, length: int, seed: int = 0, count: int = None):
+        self.length = length
+        self.seed = seed & _MASK64
+        self.count = len(word_index._words(length)) if count is None else count
+        # Player key (see module docstring) -> Deck.
+        # Clave del jugador (ver la documentación del módulo) -> Deck.
+        self.decks = {}
+
+    def deck(self, player_id: str) -> Deck:
+        key = hashlib.blake2b(player_id.encode('utf-8'), digest_size=KEY_WIDTH).digest()
+        deck = self.decks.get(key)
+        if deck is None:
+            raw = hashlib.sha256(struct.pack('<Q', self.seed) + key).digest()
+            deck = self.decks[key] = Deck(self.count, int.from_bytes(raw[:8], 'little'))
+        return deck
+
+    def draw(self, player_id: str) -> int:
+        """Next dictionary index for `player_id`.
+
+        Español: Siguiente índice del diccionario para `player_id`.
+        """
+        return self.deck(player_id).draw()
+
+    def draw_word(self, player_id: str) -> str:
+        """Next secret word for `player_id`, never repeated within a cycle.
+
+        Español: Siguiente palabra secreta para `player_id`, sin repetir en un ciclo.
+        """
+        return word_index._words(self.length)[self.draw(player_id)]
+
+    def save(self, path: str):
+        """Write every deck to `path` atomically.
+
+        Español: Escribe todos los mazos en `path` de forma atómica.
+        """
+        parts = [HEADER.pack(MAGIC, self.length, self.count, self.seed, len(self.decks))]
+        for key, deck in self.decks.items():
+            parts.append(RECORD.pack(key, deck.seed, deck.cycle, deck.cursor))
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.writelines(parts)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, count: int = None):
+        """Read a store written by `save`.
+
+        English: `count` is the current dictionary size (looked up when
+        omitted); if it differs from the saved one, every deck moves to a
+        fresh cycle.
+        Español: `count` es el tamaño actual del diccionario; si difiere del
+        guardado, cada mazo pasa a un ciclo nuevo.
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, length, saved_count, seed, records = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not a deck store')
+        store = cls(length, seed, count)
+        changed = store.count != saved_count
+        for key, deck_seed, cycle, cursor in RECORD.iter_unpack(
+                data[HEADER.size:HEADER.size + records * RECORD.size]):
+            if changed:
+                cycle, cursor = cycle + 1, 0
+            store.decks[key] = Deck(store.count, deck_seed, cycle, cursor)
+        return store
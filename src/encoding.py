@@ -0,0 +1,195 @@
+"""Compact integer encodings for words and feedback (standard library only).
+
+English: The building blocks shared by `Game` and the batch engines:
+
+  - Words are packed 5 bits per letter into one int (`pack_word`), letter
+    i in bits [5*i, 5*i + 5), using the codes of `ALPHABET`.
+  - Feedback is one base-3 int (the "pattern"):
+        pattern = sum(code[i] * 3**i)   with rojo=0, amarillo=1, verde=2
+  - `Feedback` is a lazy, read-only view (packed word + pattern) that only
+    expands into the classic list of (letter, estado) tuples when a caller
+    indexes or iterates it.
+
+Español: Piezas comunes a `Game` y a los motores por lotes: palabras
+empaquetadas a 5 bits por letra en un entero, resultados como un entero en
+base 3 y `Feedback`, una vista perezosa que sólo se expande a la lista
+clásica de tuplas (letra, estado) cuando alguien la indexa o recorre.
+"""
+
+# Per-position feedback codes and their string names used by `Game`.
+# Códigos de estado por posición y sus nombres usados por `Game`.
+ROJO, AMARILLO, VERDE = 0, 1, 2
+ESTADOS = ('rojo', 'amarillo', 'verde')
+
+# Letters accepted by the encoders, mapped to small integers (fits 5 bits).
+# Letras aceptadas por los codificadores, mapeadas a enteros pequeños (caben en 5 bits).
+ALPHABET = 'abcdefghijklmnopqrstuvwxyzñ'
+LETTER_CODES = {ch: i for i, ch in enumerate(ALPHABET)}
+BITS_PER_LETTER = 5
+
+# Powers of three by position, so scoring avoids repeated multiplication.
+# Potencias de tres por posición, para no multiplicar en cada puntuación.
+_POWERS = tuple(3 ** i for i in range(64))
+
+
+def winning_pattern(length: int) -> int:
+    """Pattern value meaning "all green".
+
+    Español: Valor de patrón que significa "todo verde".
+    """
+    return _POWERS[length] - 1
+
+
+def score_pair(guess: str, secret: str) -> int:
+    """Score a single guess against a single secret and return its pattern.
+
+    English: This is the two-pass algorithm behind `Game.check_word`; the
+    batch engines must agree with it on every pair.
+    Español: Es el algoritmo en dos pasadas de `Game.check_word`; los motores
+    por lotes deben coincidir con él en cada par.
+    """
+    # First pass: count remaining (unmatched) target letters; greens excluded
+    # Primer paso: contar las letras objetivo restantes (no coincidentes), sin verdes.
+    remaining = {}
+    for g, s in zip(guess, secret):
+        if g != s:
+            remaining[s] = remaining.get(s, 0) + 1
+
+    # Second pass: green, yellow (if remaining count available) or red
+    # Segundo paso: verde, amarillo (si hay conteo restante disponible) o rojo.
+    pattern = 0
+    for i, (g, s) in enumerate(zip(guess, secret)):
+        if g == s:
+            pattern += VERDE * _POWERS[i]
+        elif remaining.get(g):
+            pattern += AMARILLO * _POWERS[i]
+            remaining[g] -= 1
+    return pattern
+
+
+def decode_pattern(guess: str, pattern: int):
+    """Expand a pattern into the `check_word` form: list of (letter, estado).
+
+    Español: Expande un patrón a la forma de `check_word`: lista de (letra, estado).
+    """
+    resultados = []
+    for ch in guess:
+        pattern, code = divmod(pattern, 3)
+        resultados.append((ch, ESTADOS[code]))
+    return resultados
+
+
+def encode_pattern(resultados) -> int:
+    """Inverse of `decode_pattern`.
+
+    Español: Inversa de `decode_pattern`.
+    """
+    codes = {name: code for code, name in enumerate(ESTADOS)}
+    pattern = 0
+    for _, estado in reversed(resultados):
+        pattern = pattern * 3 + codes[estado]
+    return pattern
+
+
+def pack_word(word: str) -> int:
+    """Pack a word into an int, 5 bits per letter (first letter lowest).
+
+    English: Raises ValueError for letters outside `ALPHABET`.
+    Español: Lanza ValueError si hay letras fuera de `ALPHABET`.
+    """
+    packed = 0
+    shift = 0
+    try:
+        for ch in word:
+            packed |= LETTER_CODES[ch] << shift
+            shift += BITS_PER_LETTER
+    except KeyError as exc:
+        raise ValueError(f'Unsupported letter in {word!r}') from exc
+    return packed
+
+
+def unpack_word(packed: int, length: int) -> str:
+    """Inverse of `pack_word` for a word of `length` letters.
+
+    Español: Inversa de `pack_word` para una palabra de `length` letras.
+    """
+    mask = (1 << BITS_PER_LETTER) - 1
+    letters = []
+    for _ in range(length):
+        letters.append(ALPHABET[packed & mask])
+        packed >>= BITS_PER_LETTER
+    return ''.join(letters)
+
+
+class Feedback:
+    """Lazy view of one scored guess: packed word + base-3 pattern.
+
+    English: Behaves like the classic `check_word` result (a sequence of
+    (letter, estado) tuples, equal to the equivalent list) but stores only
+    two ints. Words with letters outside `ALPHABET` are kept as plain
+    strings instead of being packed.
+    Español: Se comporta como el resultado clásico de `check_word` (una
+    secuencia de tuplas (letra, estado), igual a la lista equivalente) pero
+    sólo guarda dos enteros. Las palabras con letras fuera de `ALPHABET` se
+    guardan como cadenas sin empaquetar.
+    """
+
+    __slots__ = ('_word', 'pattern', 'length')
+
+    def __init__(self, word: str, pattern: int):
+        try:
+            self._word = pack_word(word)
+        except ValueError:
+            self._word = word
+        self.pattern = pattern
+        self.length = len(word)
+
+    @classmethod
+    def from_packed(cls, packed: int, pattern: int, length: int):
+        """Build a view from an already packed word (see `pack_word`).
+
+        Español: Crea una vista a partir de una palabra ya empaquetada.
+        """
+        view = cls.__new__(cls)
+        view._word = packed
+        view.pattern = pattern
+        view.length = length
+        return view
+
+    @property
+    def word(self) -> str:
+        if isinstance(self._word, str):
+            return self._word
+        return unpack_word(self._word, self.length)
+
+    @property
+    def is_winner(self) -> bool:
+        return self.pattern == winning_pattern(self.length)
+
+    def decode(self):
+        """Return the classic list of (letter, estado) tuples.
+
+        Español: Devuelve la lista clásica de tuplas (letra, estado).
+        """
+        return decode_pattern(self.word, self.pattern)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.decode())
+
+    def __getitem__(self, index):
+        return self.decode()[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Feedback):
+            return self.pattern == other.pattern and self.word == other.word
+        if isinstance(other, (list, tuple)):
+            return self.decode() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'Feedback({self.decode()!r})'
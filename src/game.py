@@ -1,3 +1,10 @@
+import sys
+
+import candidates
+import metrics
+import word_list
+from constraints import Constraints
+from encoding import ALPHABET, LETTER_CODES, Feedback, pack_word, score_pair, winning_pattern
 from word_list import WordList
 
 
@@ -19,38 +26,64 @@ class Game:
     API summary / Resumen:
       - Game(length=6)              # crea juego con palabras de 6 letras por defecto
       - check_word(input_word) -> (resultados, is_length_valid, is_known, is_winner)
-        resultados: list[(letter, estado)] or None when unknown
+        resultados: sequence of (letter, estado) -- a lazy `encoding.Feedback`
+                    view -- or None when unknown
         is_length_valid: bool
         is_known: bool (is word in dict for the mode)
         is_winner: bool
+        A known guess rejected by hard mode returns (None, True, True, False);
+        `check_hard_mode(word)` explains why.
+      - get_candidatos() / get_num_candidatos()   # secretos aún posibles
+      - Game(length=5, hard=True)  # hard mode: revealed hints must be reused / modo difícil
+      - get_intentos_legales()      # guesses hard mode still allows / intentos aún legales
+      - check_words([(game, guess), ...])         # module-level batch form / versión por lotes
+      - AdversarialGame(length=6)   # secret chosen as late as possible / secreto elegido lo más tarde posible
+      - MultiGame(length=5, tableros=4)  # one guess against several boards / un intento en varios tableros
+
+    Instances use `__slots__` (no per-object `__dict__`); see `CompactGame`
+    for the densest per-session layout.
+    Las instancias usan `__slots__`; ver `CompactGame` para la forma más compacta.
     """
 
-    def __init__(self, palabra_secreta=None, length: int = 6, intentos=6):
+    __slots__ = ('length', 'palabra_secreta', 'intentos', 'historial', '_candidatos', 'restricciones')
+
+    def __init__(self, palabra_secreta=None, length: int = 6, intentos=6, hard: bool = False):
         self.length = length
         self.palabra_secreta = palabra_secreta or WordList.get_random_word(self.length)
         self.intentos = intentos
         self.historial = []
+        # Bitmask of still-possible secrets; built lazily on first query.
+        # Máscara de secretos aún posibles; se construye al primer uso.
+        self._candidatos = None
+        # Hard-mode summary of the revealed hints (see `constraints.py`).
+        # Resumen de las pistas reveladas en modo difícil (ver `constraints.py`).
+        self.restricciones = Constraints(length) if hard else None
 
     def check_word(self, input_word: str):
         """Validate and score a guess.
 
         English: Returns a tuple: (resultados, is_length_valid, is_known, is_winner)
 
-        - resultados: list of (letter, estado) where estado is 'verde'|'amarillo'|'rojo'.
-            If the word is not known, resultados is None.
+        - resultados: sequence of (letter, estado) where estado is 'verde'|'amarillo'|'rojo',
+            returned as a compact `encoding.Feedback` view that compares equal
+            to the equivalent list. If the word is not known, resultados is None.
         - is_length_valid: whether the guess has the expected length.
         - is_known: whether the guess is present in the dictionary for the mode.
         - is_winner: True when all letters are 'verde'.
         
         Español: Devuelve una tupla: (resultados, longitud_valida, es_conocida, es_ganador)
 
-        - resultados: lista de (letra, estado) donde estado es 'verde' | 'amarillo' | 'rojo'.
-            Si la palabra no es conocida, resultados es None.
+        - resultados: secuencia de (letra, estado) donde estado es 'verde' | 'amarillo' | 'rojo',
+            devuelta como vista compacta `encoding.Feedback`. Si la palabra no
+            es conocida, resultados es None.
         - longitud_valida: indica si la suposición tiene la longitud esperada.
         - es_conocida: indica si la suposición está presente en el diccionario del modo.
         - es_ganador: True cuando todas las letras son 'verde'.
         """
+        start = metrics.clock() if metrics.ENABLED else None
         if not isinstance(input_word, str):
+            if start is not None:
+                metrics.GUESSES['invalid'].inc()
             return None, False, False, False
 
         word = input_word.strip().lower()
@@ -60,6 +93,8 @@ class Game:
         is_length_valid = WordList.is_correct_length(word, self.length)
 
         if not is_length_valid:
+            if start is not None:
+                metrics.GUESSES['invalid'].inc()
             return None, False, False, False
 
         # Known-word check (dictionary depends on length)
@@ -69,41 +104,65 @@ class Game:
         # If not known, do not compute hints or consume attempts
         # Si no es conocida, no calcular pistas ni consumir intentos.
         if not is_known:
+            if start is not None:
+                metrics.GUESSES['unknown'].inc()
             return None, True, False, False
 
-        target = self.palabra_secreta
-        resultados = [None] * len(target)
-
-        # First pass: greens and build remaining counts for unmatched target letters
-        # Primer paso: identificar verdes y construir el conteo restante de letras objetivo no coincidentes.
-        remaining = {}
-        for i, ch in enumerate(target):
-            if word[i] == ch:
-                resultados[i] = (word[i], 'verde')
-            else:
-                remaining[ch] = remaining.get(ch, 0) + 1
-
-        # Second pass: yellows (if remaining count available) or red
-        # Segundo paso: amarillos (si hay conteo restante disponible) o rojo.
-        for i, ch in enumerate(word):
-            if resultados[i] is not None:
-                continue
-            if remaining.get(ch, 0) > 0:
-                resultados[i] = (ch, 'amarillo')
-                remaining[ch] -= 1
-            else:
-                resultados[i] = (ch, 'rojo')
+        # Hard mode: the guess must reuse the revealed hints (O(length)).
+        # Modo difícil: el intento debe reutilizar las pistas (O(longitud)).
+        if self.restricciones is not None and self.restricciones.violation(word) is not None:
+            if start is not None:
+                metrics.GUESSES['rejected'].inc()
+            return None, True, True, False
 
-        self.historial.append(resultados)
+        # Score into the compact form (base-3 pattern); the returned view
+        # only expands into (letter, estado) tuples when a caller reads it.
+        # Puntúa en forma compacta (patrón en base 3); la vista devuelta sólo
+        # se expande a tuplas (letra, estado) cuando alguien la lee.
+        if start is None:
+            pattern = self._score(word)
+        else:
+            scored = metrics.clock()
+            pattern = self._score(word)
+            metrics.SCORE_SECONDS.observe(metrics.clock() - scored)
+        resultados = self._record(word, pattern)
+        if self._candidatos is not None:
+            self._candidatos = candidates.get_index(self.length).constrain(self._candidatos, word, pattern)
+        if self.restricciones is not None:
+            self.restricciones.update(word, pattern)
 
-        is_winner = all(estado == 'verde' for _, estado in resultados)
+        is_winner = resultados.is_winner
 
         # Consume an attempt for a valid known guess
         # Consume un intento para una suposición válida y conocida.
         self.intentos -= 1
 
+        if start is not None:
+            metrics.GUESSES['scored'].inc()
+            metrics.CHECK_WORD_SECONDS.observe(metrics.clock() - start)
         return resultados, True, True, is_winner
 
+    def _score(self, word: str) -> int:
+        """Pattern of a known guess against the secret.
+
+        Español: Patrón de una suposición conocida contra el secreto.
+        """
+        return score_pair(word, self.palabra_secreta)
+
+    def _record(self, word: str, pattern: int, packed=None):
+        """Append one scored guess to the history and return its view.
+
+        English: `packed` is the already packed word, when the caller has it.
+        Español: Añade un intento puntuado al historial y devuelve su vista;
+        `packed` es la palabra ya empaquetada, si el llamador la tiene.
+        """
+        if packed is None:
+            resultados = Feedback(word, pattern)
+        else:
+            resultados = Feedback.from_packed(packed, pattern, self.length)
+        self.historial.append(resultados)
+        return resultados
+
     def get_historial(self):
         """Return the history of past guesses.
 
@@ -123,4 +182,440 @@ class Game:
 
         Español: Devuelve la palabra objetivo actual.
         """
-        return self.palabra_secreta
\ No newline at end of file
+        return self.palabra_secreta
+
+    def _candidate_mask(self):
+        if self._candidatos is None:
+            index = candidates.get_index(self.length)
+            mask = index.all_mask
+            for resultados in self.get_historial():
+                mask = index.constrain(mask, resultados.word, resultados.pattern)
+            self._candidatos = mask
+        return self._candidatos
+
+    def get_candidatos(self):
+        """Return the dictionary words still consistent with the history.
+
+        Español: Devuelve las palabras del diccionario aún compatibles con el
+        historial de intentos.
+        """
+        return candidates.get_index(self.length).words_in(self._candidate_mask())
+
+    def get_num_candidatos(self):
+        """Return how many dictionary words are still possible secrets.
+
+        Español: Devuelve cuántas palabras del diccionario siguen siendo posibles.
+        """
+        return candidates.get_index(self.length).count(self._candidate_mask())
+
+    def check_hard_mode(self, input_word: str):
+        """Why hard mode rejects `input_word`, or None when it is allowed.
+
+        Español: Por qué el modo difícil rechaza `input_word`, o None si se permite.
+        """
+        if self.restricciones is None:
+            return None
+        word = input_word.strip().lower()
+        if len(word) != self.length:
+            return None
+        return self.restricciones.violation(word)
+
+    def get_intentos_legales(self):
+        """Return the dictionary words hard mode still accepts as guesses.
+
+        English: Without hard mode this is the whole dictionary.
+        Español: Devuelve las palabras del diccionario que el modo difícil
+        aún acepta como intento; sin modo difícil, todo el diccionario.
+        """
+        index = candidates.get_index(self.length)
+        if self.restricciones is None:
+            return list(index.words)
+        return index.words_in(self.restricciones.mask(index))
+
+
+# Below this many known guesses of one length, `check_words` scores in pure
+# Python: importing NumPy and building arrays would cost more than it saves.
+# Por debajo de este número de intentos de una longitud, `check_words` puntúa
+# en Python puro: importar NumPy y crear arreglos costaría más de lo que ahorra.
+BATCH_VECTOR_MIN = 64
+
+
+def check_words(pairs):
+    """Batch `check_word`: validate and score many (game, guess) pairs at once.
+
+    English: Returns one `check_word`-shaped tuple per pair, in order, and
+    applies the same rules: invalid or unknown guesses change nothing, known
+    guesses consume an attempt and are appended to the game's history. A game
+    may appear several times; its guesses are applied in batch order.
+    Dictionary lookups are done per length against the frozenset index, and
+    scoring of large groups goes through `scoring.score_pairs` (vectorized).
+    With metrics enabled, every pair counts in `wordle_guesses_total` as it
+    would through `check_word`.
+
+    Español: `check_word` por lotes: valida y puntúa muchos pares
+    (partida, suposición) de una vez. Devuelve una tupla como la de
+    `check_word` por par, en orden, con las mismas reglas: las suposiciones
+    inválidas o desconocidas no cambian nada y las conocidas consumen un
+    intento y se añaden al historial. Una partida puede aparecer varias veces.
+    Con métricas activas, cada par cuenta en `wordle_guesses_total` como en
+    `check_word`.
+    """
+    start = metrics.clock() if metrics.ENABLED else None
+    out = [(None, False, False, False)] * len(pairs)
+    # length -> (pair indexes, guesses, secrets) of the known guesses.
+    # longitud -> (índices, suposiciones, secretos) de las suposiciones conocidas.
+    groups = {}
+    for k, (game, input_word) in enumerate(pairs):
+        if not isinstance(input_word, str):
+            if start is not None:
+                metrics.GUESSES['invalid'].inc()
+            continue
+        word = input_word.strip().lower()
+        length = game.length
+        if len(word) != length:
+            if start is not None:
+                metrics.GUESSES['invalid'].inc()
+            continue
+        if game.palabra_secreta is None or game.restricciones is not None:
+            # Unresolved adversarial games score by partitioning, and hard
+            # mode must see each guess before validating the next one.
+            # Las partidas adversarias sin resolver puntúan particionando, y
+            # el modo difícil debe ver cada intento antes de validar el siguiente.
+            out[k] = game.check_word(word)
+            continue
+        group = groups.get(length)
+        if group is None:
+            WordList._ensure_loaded(length)
+            group = groups[length] = ([], [], [], word_list._word_sets_by_length[length])
+        if word not in group[3]:
+            if start is not None:
+                metrics.GUESSES['unknown'].inc()
+            out[k] = (None, True, False, False)
+            continue
+        group[0].append(k)
+        group[1].append(word)
+        group[2].append(game.palabra_secreta)
+
+    scored = []
+    for indexes, guesses, secrets, _ in groups.values():
+        if len(guesses) >= BATCH_VECTOR_MIN:
+            import scoring
+            found = scoring.score_pairs(guesses, secrets)
+            packs = scoring.pack_words(guesses)
+        else:
+            found = [score_pair(g, s) for g, s in zip(guesses, secrets)]
+            packs = [None] * len(guesses)
+        scored.extend(zip(indexes, guesses, found, packs))
+    # Apply in batch order so repeated games see their guesses in sequence.
+    # Se aplica en el orden del lote para que las partidas repetidas vean sus
+    # intentos en secuencia.
+    scored.sort()
+    for k, word, pattern, packed in scored:
+        game = pairs[k][0]
+        resultados = game._record(word, pattern, packed)
+        if game._candidatos is not None:
+            game._candidatos = candidates.get_index(game.length).constrain(game._candidatos, word, pattern)
+        game.intentos -= 1
+        out[k] = (resultados, True, True, resultados.is_winner)
+    if start is not None:
+        metrics.GUESSES['scored'].inc(len(scored))
+        metrics.CHECK_WORDS_SECONDS.observe(metrics.clock() - start)
+    return out
+
+
+class CompactGame(Game):
+    """Low-footprint `Game` for high session density (same public API).
+
+    English: Keeps the history in one fixed-size `bytearray` of
+    attempts x length cells, each cell holding `letter_code << 2 | estado`,
+    plus a count of used rows. The secret is an interned string, shared with
+    the dictionary list or every other game using the same word. Guesses must
+    use letters of `encoding.ALPHABET`. `get_historial()` rebuilds
+    `Feedback` views on demand.
+
+    Español: Guarda el historial en un único `bytearray` de tamaño fijo
+    (intentos x longitud celdas, cada una `codigo_letra << 2 | estado`) y un
+    contador de filas usadas. La palabra secreta es una cadena internada y
+    compartida. `get_historial()` reconstruye las vistas `Feedback` al pedirlas.
+    """
+
+    __slots__ = ('_cells', '_rows')
+
+    def __init__(self, palabra_secreta=None, length: int = 6, intentos=6, hard: bool = False):
+        self.length = length
+        self.palabra_secreta = sys.intern(palabra_secreta or WordList.get_random_word(length))
+        self.intentos = intentos
+        self.historial = None
+        self._candidatos = None
+        self.restricciones = Constraints(length) if hard else None
+        self._cells = bytearray(intentos * length)
+        self._rows = 0
+
+    @property
+    def historial(self):
+        return self.get_historial()
+
+    @historial.setter
+    def historial(self, value):
+        # History lives in `_cells`; the base-class slot stays unused.
+        # El historial vive en `_cells`; el slot de la clase base no se usa.
+        pass
+
+    def _record(self, word: str, pattern: int, packed=None):
+        length = self.length
+        start = self._rows * length
+        if start + length > len(self._cells):
+            self._cells.extend(bytes(length))
+        cells = self._cells
+        remaining = pattern
+        try:
+            for i, ch in enumerate(word):
+                remaining, code = divmod(remaining, 3)
+                cells[start + i] = LETTER_CODES[ch] << 2 | code
+        except KeyError as exc:
+            raise ValueError(f'CompactGame cannot store letters outside ALPHABET: {word!r}') from exc
+        self._rows += 1
+        if packed is None:
+            return Feedback(word, pattern)
+        return Feedback.from_packed(packed, pattern, length)
+
+    def export_state(self):
+        """Return (intentos, rows, used history cells) for snapshots.
+
+        Español: Devuelve (intentos, filas, celdas usadas) para instantáneas.
+        """
+        return self.intentos, self._rows, bytes(self._cells[:self._rows * self.length])
+
+    @classmethod
+    def from_state(cls, palabra_secreta: str, length: int, intentos: int, rows: int, cells: bytes):
+        """Rebuild a game from `export_state()` data without rescoring.
+
+        Español: Reconstruye una partida desde `export_state()` sin repuntuar.
+        """
+        game = cls.__new__(cls)
+        game.length = length
+        game.palabra_secreta = sys.intern(palabra_secreta)
+        game.intentos = intentos
+        game._candidatos = None
+        game.restricciones = None
+        game._cells = bytearray(cells) + bytes(max(intentos, 0) * length)
+        game._rows = rows
+        return game
+
+    def _row(self, row: int):
+        length = self.length
+        cells = self._cells[row * length:(row + 1) * length]
+        word = ''.join(ALPHABET[c >> 2] for c in cells)
+        pattern = 0
+        for c in reversed(cells):
+            pattern = pattern * 3 + (c & 3)
+        return Feedback(word, pattern)
+
+    def get_historial(self):
+        """Return the history of past guesses, decoded from the cell array.
+
+        Español: Devuelve el historial de intentos, decodificado de las celdas.
+        """
+        return [self._row(r) for r in range(self._rows)]
+
+
+class AdversarialGame(Game):
+    """Absurdle-style `Game`: the secret is not fixed up front.
+
+    English: The game keeps the rows of every secret still consistent with
+    the history (see `partition.py`). Each known guess splits them by
+    feedback pattern and only the largest bucket survives, so the player
+    always gets the least helpful answer. The guess wins only when it is the
+    last remaining candidate. `palabra_secreta` stays None until a single
+    candidate is left; `get_palabra_secreta()` then returns it, or before
+    that any remaining candidate (all of them fit the history).
+
+    Español: El juego conserva las filas de todos los secretos aún
+    compatibles con el historial. Cada suposición conocida los divide por
+    patrón y sólo sobrevive el bucket más grande, de modo que el jugador
+    recibe siempre la respuesta menos útil. Sólo se gana adivinando el último
+    candidato. `palabra_secreta` es None hasta que queda uno solo.
+    """
+
+    __slots__ = ('_filas',)
+
+    def __init__(self, length: int = 6, intentos=6, hard: bool = False):
+        self.length = length
+        self.palabra_secreta = None
+        self.intentos = intentos
+        self.historial = []
+        self._candidatos = None
+        self.restricciones = Constraints(length) if hard else None
+        # Rows of the remaining secrets; None is the whole dictionary.
+        # Filas de los secretos restantes; None es todo el diccionario.
+        self._filas = None
+
+    def _score(self, word: str) -> int:
+        # Imported here: partition pulls in scoring and NumPy, which a CLI
+        # start must not pay for (see `python bench.py firstprompt`).
+        # Se importa aquí: partition arrastra scoring y NumPy.
+        import partition
+        pattern, self._filas = partition.largest_bucket(word, self._filas, self.length)
+        if len(self._filas) == 1:
+            self.palabra_secreta = partition.row_words(self._filas, self.length)[0]
+        return pattern
+
+    def get_palabra_secreta(self):
+        """Return the secret, or one of the still-possible secrets.
+
+        Español: Devuelve el secreto, o uno de los secretos aún posibles.
+        """
+        if self.palabra_secreta is not None:
+            return self.palabra_secreta
+        WordList._ensure_loaded(self.length)
+        words = word_list._words_by_length[self.length]
+        return words[0 if self._filas is None else int(self._filas[0])]
+
+    def get_candidatos(self):
+        import partition
+        return partition.row_words(self._filas, self.length)
+
+    def get_num_candidatos(self):
+        import partition
+        return partition.row_count(self._filas, self.length)
+
+
+# From this many unsolved boards, `MultiGame` scores with NumPy in one pass;
+# below it the per-board loop is cheaper than building arrays.
+# Desde este número de tableros sin resolver, `MultiGame` puntúa con NumPy en
+# una pasada; por debajo, el bucle por tablero es más barato.
+MULTI_VECTOR_MIN = 32
+
+
+class MultiGame:
+    """Quordle/Octordle-style game: every guess is played on N boards.
+
+    English: Each board has its own secret and history; all of them share
+    the attempts. A guess is validated and looked up once, then scored
+    against every unsolved board in one batched pass (a NumPy pass over the
+    secrets encoded at creation for many boards, see `MULTI_VECTOR_MIN`).
+    A solved board stops receiving guesses; the game is won when every
+    board is solved. The default attempts are `tableros + 5` (9 for 4
+    boards, 13 for 8).
+
+    API:
+      - MultiGame(palabras_secretas=None, length=5, tableros=4, intentos=None)
+      - check_word(input_word) -> (resultados, is_length_valid, is_known, is_winner)
+        resultados: one `encoding.Feedback` per board, None for boards that
+                    were already solved; None when the guess is not scored
+        is_winner: True when every board is solved
+      - get_historial(tablero), get_resueltos(), get_intentos_restantes(),
+        get_palabras_secretas()
+
+    Español: Cada tablero tiene su propio secreto e historial y todos
+    comparten los intentos. Un intento se valida y se busca una sola vez y se
+    puntúa contra todos los tableros sin resolver en una pasada por lotes.
+    Un tablero resuelto deja de recibir intentos; se gana cuando todos están
+    resueltos.
+    """
+
+    __slots__ = ('length', 'palabras_secretas', 'intentos', 'historiales', 'resueltos', '_encoded')
+
+    def __init__(self, palabras_secretas=None, length: int = 5, tableros: int = 4, intentos=None):
+        boards = tableros if palabras_secretas is None else len(palabras_secretas)
+        if boards < 1:
+            raise ValueError(f'A multi-board game needs at least one board, got {boards}')
+        self.length = length
+        if palabras_secretas is None:
+            palabras_secretas = WordList.get_random_words(length, tableros)
+        self.palabras_secretas = [sys.intern(w) for w in palabras_secretas]
+        self.intentos = len(self.palabras_secretas) + 5 if intentos is None else intentos
+        self.historiales = [[] for _ in self.palabras_secretas]
+        self.resueltos = [False] * len(self.palabras_secretas)
+        # Encoded secrets for the NumPy pass; built on first use.
+        # Secretos codificados para la pasada NumPy; se crean al primer uso.
+        self._encoded = None
+
+    def _scores(self, word: str, boards):
+        """Patterns of `word` against the secrets of `boards`, in order.
+
+        Español: Patrones de `word` contra los secretos de `boards`, en orden.
+        """
+        secrets = self.palabras_secretas
+        if len(boards) < MULTI_VECTOR_MIN:
+            return [score_pair(word, secrets[b]) for b in boards]
+        import scoring
+        if scoring.np is None:
+            return [score_pair(word, secrets[b]) for b in boards]
+        if self._encoded is None:
+            self._encoded = scoring.encode_words(secrets, self.length)
+        encoded = self._encoded
+        if len(boards) != len(secrets):
+            encoded = encoded[boards]
+        return scoring.score_against(word, encoded).tolist()
+
+    def check_word(self, input_word: str):
+        """Validate a guess once and score it on every unsolved board.
+
+        English: Same rules and tuple shape as `Game.check_word`; see the
+        class docstring for `resultados`.
+        Español: Mismas reglas y forma de tupla que `Game.check_word`; ver la
+        documentación de la clase para `resultados`.
+        """
+        if not isinstance(input_word, str):
+            if metrics.ENABLED:
+                metrics.GUESSES['invalid'].inc()
+            return None, False, False, False
+        word = input_word.strip().lower()
+        if not WordList.is_correct_length(word, self.length):
+            if metrics.ENABLED:
+                metrics.GUESSES['invalid'].inc()
+            return None, False, False, False
+        if not WordList.is_known_word(word, self.length):
+            if metrics.ENABLED:
+                metrics.GUESSES['unknown'].inc()
+            return None, True, False, False
+
+        boards = [b for b, solved in enumerate(self.resueltos) if not solved]
+        try:
+            packed = pack_word(word)
+        except ValueError:
+            packed = None
+        resultados = [None] * len(self.resueltos)
+        win = winning_pattern(self.length)
+        for b, pattern in zip(boards, self._scores(word, boards)):
+            if packed is None:
+                view = Feedback(word, pattern)
+            else:
+                view = Feedback.from_packed(packed, pattern, self.length)
+            self.historiales[b].append(view)
+            resultados[b] = view
+            if pattern == win:
+                self.resueltos[b] = True
+        self.intentos -= 1
+        if metrics.ENABLED:
+            metrics.GUESSES['scored'].inc()
+        return resultados, True, True, all(self.resueltos)
+
+    def get_historial(self, tablero: int):
+        """Return the history of one board.
+
+        Español: Devuelve el historial de un tablero.
+        """
+        return self.historiales[tablero]
+
+    def get_resueltos(self):
+        """Return one solved flag per board.
+
+        Español: Devuelve un indicador de resuelto por tablero.
+        """
+        return list(self.resueltos)
+
+    def get_intentos_restantes(self):
+        """Return remaining attempts, shared by all boards.
+
+        Español: Devuelve los intentos que quedan, comunes a todos los tableros.
+        """
+        return self.intentos
+
+    def get_palabras_secretas(self):
+        """Return the secret word of each board, in board order.
+
+        Español: Devuelve la palabra secreta de cada tablero, en orden.
+        """
+        return list(self.palabras_secretas)
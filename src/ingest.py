@@ -0,0 +1,247 @@
+"""Streaming ingestion of a large text corpus into per-length word files.
+
+English: Reads one (possibly multi-gigabyte) source in bounded-size chunks,
+normalizes every token (lower-case, letters of `encoding.ALPHABET` only),
+partitions the words by length in a single pass and deduplicates them with
+bounded memory: each length keeps an in-memory set of at most
+`max_buffer` words, which is spilled to a sorted temporary run when full;
+runs are then merged and deduplicated with `heapq.merge`, at most
+`MERGE_FAN_IN` at a time (groups of runs merge into intermediate runs
+first), so the number of open files stays bounded. The output is one
+sorted 'words_N.txt' per length, which `WordList` picks up (and compiles
+to 'words_N.bin') on first load.
+
+    python ingest.py corpus.txt --out . --lengths 5 7
+
+Español: Lee una fuente (posiblemente de varios gigabytes) en bloques de
+tamaño acotado, normaliza cada token, reparte las palabras por longitud en
+una sola pasada y elimina duplicados con memoria acotada (conjuntos en
+memoria que se vuelcan a ficheros temporales ordenados y luego se mezclan).
+El resultado es un 'words_N.txt' ordenado por longitud, que `WordList`
+carga (y compila a 'words_N.bin') en el primer uso.
+"""
+import argparse
+import codecs
+import heapq
+import os
+import re
+import sys
+import tempfile
+import time
+
+from encoding import ALPHABET
+
+# Runs of unicode letters; tokens are then filtered against ALPHABET.
+# Secuencias de letras unicode; luego se filtran contra ALPHABET.
+TOKEN = re.compile(r'[^\W\d_]+')
+ALLOWED = frozenset(ALPHABET)
+
+# Most runs open at once while merging (well below usual file limits).
+# Máximo de series abiertas a la vez al mezclar.
+MERGE_FAN_IN = 64
+
+
+class _LengthBucket:
+    """Bounded-memory deduplicating collector for one word length.
+
+    Español: Colector con memoria acotada y sin duplicados para una longitud.
+    """
+
+    def __init__(self, length: int, max_buffer: int, tmp_dir: str):
+        self.length = length
+        self.max_buffer = max_buffer
+        self.tmp_dir = tmp_dir
+        self.buffer = set()
+        self.runs = []
+
+    def add(self, word: str):
+        self.buffer.add(word)
+        if len(self.buffer) >= self.max_buffer:
+            self.spill()
+
+    def spill(self):
+        if not self.buffer:
+            return
+        fd, path = tempfile.mkstemp(prefix=f'run{self.length}_', suffix='.txt', dir=self.tmp_dir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.writelines(w + '\n' for w in sorted(self.buffer))
+        self.runs.append(path)
+        self.buffer = set()
+
+    def _merge(self, paths, out) -> int:
+        """Merge sorted run files into the open file `out`, dropping duplicates.
+
+        Español: Mezcla series ordenadas en `out`, sin duplicados.
+        """
+        files = []
+        written = 0
+        previous = None
+        try:
+            for path in paths:
+                files.append(open(path, 'r', encoding='utf-8'))
+            for line in heapq.merge(*files):
+                if line != previous:
+                    out.write(line)
+                    written += 1
+                    previous = line
+        finally:
+            for f in files:
+                f.close()
+        return written
+
+    def write(self, out_path: str) -> int:
+        """Merge all runs into `out_path`; return the number of unique words.
+
+        English: While there are more than `MERGE_FAN_IN` runs, groups of
+        that many are merged into intermediate runs first.
+        Español: Mientras haya más de `MERGE_FAN_IN` series, se mezclan
+        primero por grupos en series intermedias.
+        """
+        self.spill()
+        tmp = f'{out_path}.{os.getpid()}.tmp'
+        try:
+            while len(self.runs) > MERGE_FAN_IN:
+                group, self.runs = self.runs[:MERGE_FAN_IN], self.runs[MERGE_FAN_IN:]
+                fd, path = tempfile.mkstemp(prefix=f'run{self.length}_', suffix='.txt', dir=self.tmp_dir)
+                self.runs.append(path)
+                with os.fdopen(fd, 'w', encoding='utf-8') as out:
+                    self._merge(group, out)
+                for p in group:
+                    os.remove(p)
+            with open(tmp, 'w', encoding='utf-8') as out:
+                written = self._merge(self.runs, out)
+            os.replace(tmp, out_path)
+        finally:
+            for p in self.runs:
+                os.remove(p)
+            self.runs = []
+        return written
+
+
+def iter_tokens(stream, chunk_size: int = 1 << 20, encoding: str = 'utf-8', on_chunk=None,
+                max_token: int = 64):
+    """Yield normalized tokens from a binary stream read in `chunk_size` bytes.
+
+    English: A token cut by a chunk boundary is carried over to the next
+    chunk. Tokens longer than `max_token` letters are dropped, and so is a
+    carried token once it grows past that, so memory stays bounded by
+    `chunk_size` plus `max_token` even when a chunk is all letters.
+    `on_chunk(bytes_read)` is called after every chunk.
+    Español: Un token cortado por el límite de bloque se arrastra al
+    siguiente. Los tokens de más de `max_token` letras se descartan (también
+    el arrastrado en cuanto lo supera), así la memoria queda acotada por
+    `chunk_size` más `max_token` aunque un bloque sea todo letras.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    carry = ''
+    # True while inside an over-long token that continues in the next chunk.
+    # True mientras se está dentro de un token demasiado largo que sigue.
+    skipping = False
+    bytes_read = 0
+    while True:
+        raw = stream.read(chunk_size)
+        final = not raw
+        bytes_read += len(raw)
+        text = carry + decoder.decode(raw, final=final)
+        start = 0
+        if skipping:
+            # Drop the rest of the over-long token cut by the previous chunk.
+            # Descarta el resto del token demasiado largo del bloque anterior.
+            match = TOKEN.match(text)
+            start = match.end() if match else 0
+            skipping = start == len(text) and not final
+        cut = len(text)
+        if not final and not skipping:
+            # Keep a trailing (possibly partial) token for the next chunk,
+            # unless it is already too long to be wanted.
+            # Conserva el token final (posiblemente parcial) para el siguiente
+            # bloque, salvo que ya sea demasiado largo.
+            while cut > start and len(text) - cut <= max_token and TOKEN.match(text, cut - 1):
+                cut -= 1
+            if len(text) - cut > max_token:
+                while cut > start and TOKEN.match(text, cut - 1):
+                    cut -= 1
+                skipping = True
+        for match in TOKEN.finditer(text, start, cut):
+            token = match.group()
+            if len(token) <= max_token:
+                token = token.lower()
+                if ALLOWED.issuperset(token):
+                    yield token
+        carry = '' if skipping else text[cut:]
+        if on_chunk is not None and raw:
+            on_chunk(bytes_read)
+        if final:
+            return
+
+
+def ingest(source: str, out_dir: str, lengths=None, min_length: int = 4, max_length: int = 8,
+           chunk_size: int = 1 << 20, max_buffer: int = 200_000, progress=None):
+    """Ingest `source` into 'words_N.txt' files under `out_dir`.
+
+    English: `lengths` restricts the output to those lengths (otherwise
+    every length in [min_length, max_length]). `progress(bytes_read,
+    total_bytes, tokens)` is called after each chunk. Returns a dict
+    length -> unique words written.
+    Español: `lengths` limita la salida a esas longitudes. `progress` se
+    llama tras cada bloque. Devuelve un dict longitud -> palabras únicas.
+    """
+    wanted = set(lengths) if lengths else set(range(min_length, max_length + 1))
+    total = os.path.getsize(source)
+    tokens = 0
+    os.makedirs(out_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=out_dir) as tmp_dir:
+        buckets = {n: _LengthBucket(n, max_buffer, tmp_dir) for n in wanted}
+
+        def on_chunk(bytes_read):
+            if progress is not None:
+                progress(bytes_read, total, tokens)
+
+        with open(source, 'rb') as stream:
+            for token in iter_tokens(stream, chunk_size, on_chunk=on_chunk, max_token=max(wanted)):
+                tokens += 1
+                bucket = buckets.get(len(token))
+                if bucket is not None:
+                    bucket.add(token)
+
+        return {n: buckets[n].write(os.path.join(out_dir, f'words_{n}.txt')) for n in sorted(buckets)}
+
+
+def progress_printer(stream=sys.stderr, interval: float = 0.25):
+    """Return a throttled `progress` callback that writes one status line.
+
+    Español: Devuelve un callback `progress` limitado que escribe una línea de estado.
+    """
+    last = [0.0]
+
+    def report(bytes_read: int, total: int, tokens: int):
+        now = time.monotonic()
+        if bytes_read < total and now - last[0] < interval:
+            return
+        last[0] = now
+        pct = 100.0 * bytes_read / total if total else 100.0
+        stream.write(f'\r{bytes_read / 1e6:10.1f} MB / {total / 1e6:.1f} MB ({pct:5.1f}%)  {tokens:,} tokens')
+        if bytes_read >= total:
+            stream.write('\n')
+        stream.flush()
+
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Ingest a text corpus into words_N.txt files')
+    parser.add_argument('source')
+    parser.add_argument('--out', default=os.path.dirname(os.path.abspath(__file__)))
+    parser.add_argument('--lengths', type=int, nargs='*')
+    parser.add_argument('--chunk-size', type=int, default=1 << 20)
+    parser.add_argument('--max-buffer', type=int, default=200_000)
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+    counts = ingest(args.source, args.out, args.lengths, chunk_size=args.chunk_size,
+                    max_buffer=args.max_buffer, progress=None if args.quiet else progress_printer())
+    for length, n in counts.items():
+        print(f'words_{length}.txt: {n} words')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,23 +1,54 @@
+import argparse
 import sys
-from game import Game
 
-try:
-    from ui import MainMenuApp
-except Exception:
-    MainMenuApp = None
+import metrics
+from game import AdversarialGame, Game, MultiGame
+from word_list import WordList
 
 
-def cli_main():
+def load_gui():
+    """Import the Tk GUI on demand; return `MainMenuApp` or None.
+
+    The GUI module (and tkinter) is only imported when the GUI is actually
+    launched, so `--cli` and `--simulate` runs never pay for it.
+    Español: La GUI (y tkinter) sólo se importa cuando se lanza de verdad.
+    """
+    try:
+        from ui import MainMenuApp
+    except Exception:
+        return None
+    return MainMenuApp
+
+
+def cli_main(length: int = 6, daily: bool = False, adversarial: bool = False, hard: bool = False):
     """Run the original CLI loop.
 
     This is preserved for users who prefer the terminal. Use the
-    `--cli` argument to force CLI mode.
+    `--cli` argument to force CLI mode. The dictionary is loaded in a
+    background thread while the player types the first guess. With
+    `daily`, the secret is the shared word of the day (`--daily`); with
+    `adversarial`, there is no fixed secret (`--adversarial`, see
+    `game.AdversarialGame`); with `hard`, revealed hints must be reused
+    (`--hard`).
     """
-    juego = Game()
+    # Prewarm the dictionary so the first prompt appears immediately.
+    # Precarga el diccionario para que el primer mensaje aparezca al instante.
+    loader = WordList.prewarm(length)
+    juego = None
 
     # si falla, juego por consola
-    while juego.get_intentos_restantes() > 0:
+    while juego is None or juego.get_intentos_restantes() > 0:
         entrada = input("Ingrese una palabra: ")
+        if juego is None:
+            loader.join()
+            if adversarial:
+                juego = AdversarialGame(length=length, hard=hard)
+            else:
+                secreta = None
+                if daily:
+                    import word_index
+                    secreta = word_index.word_of_the_day(length)
+                juego = Game(secreta, length=length, hard=hard)
 
         resultados, is_length_valid, is_known_word, is_winner = juego.check_word(entrada)
 
@@ -29,6 +60,10 @@ def cli_main():
             print("Palabra no encontrada en la lista. Intenta otra.\n")
             continue
 
+        if resultados is None:
+            print(f"Modo difícil: {juego.check_hard_mode(entrada)}.\n")
+            continue
+
         for letra, estado in resultados:
             print(f"{letra} -> {estado}", end=" | ")
         print("\n")
@@ -40,14 +75,152 @@ def cli_main():
     print(f"PERDISTE. La palabra era: {juego.get_palabra_secreta()}")
 
 
+def cli_multi(length: int = 5, tableros: int = 4):
+    """Multi-board CLI loop (`--boards N`): each guess is played on every board.
+
+    Español: Bucle de consola de varios tableros: cada intento se juega en todos.
+    """
+    loader = WordList.prewarm(length)
+    juego = None
+
+    while juego is None or juego.get_intentos_restantes() > 0:
+        entrada = input("Ingrese una palabra: ")
+        if juego is None:
+            loader.join()
+            juego = MultiGame(length=length, tableros=tableros)
+
+        resultados, is_length_valid, is_known_word, is_winner = juego.check_word(entrada)
+
+        if not is_length_valid:
+            print("Palabra incorrecta o de longitud inválida (longitud inválida).\n")
+            continue
+
+        if not is_known_word:
+            print("Palabra no encontrada en la lista. Intenta otra.\n")
+            continue
+
+        for tablero, fila in enumerate(resultados, 1):
+            if fila is None:
+                continue
+            print(f"[{tablero}]", end=" ")
+            for letra, estado in fila:
+                print(f"{letra} -> {estado}", end=" | ")
+            print("¡resuelto!" if fila.is_winner else "")
+        print(f"Resueltos: {sum(juego.get_resueltos())}/{tableros}\n")
+
+        if is_winner:
+            print("¡GANASTE!")
+            return
+
+    print(f"PERDISTE. Las palabras eran: {', '.join(juego.get_palabras_secretas())}")
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1.
+
+    Español: Tipo de argparse para cantidades de al menos 1.
+    """
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f'debe ser >= 1 / must be >= 1: {n}')
+    return n
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Wordle (GUI por defecto / GUI by default)')
+    parser.add_argument('--cli', action='store_true', help='jugar en la terminal / play in the terminal')
+    parser.add_argument('--simulate', type=positive_int, metavar='N',
+                        help='jugar N partidas sin interfaz / play N headless games')
+    parser.add_argument('--length', type=int, action='append',
+                        help='longitud de palabra; repetible con --simulate / word length, repeatable with --simulate')
+    parser.add_argument('--strategy', default='candidate',
+                        help='estrategia para --simulate: random, candidate, entropy, tree')
+    parser.add_argument('--workers', type=positive_int, default=1,
+                        help='procesos para --simulate / worker processes')
+    parser.add_argument('--seed', type=int, default=0, help='semilla / random seed')
+    parser.add_argument('--board', choices=('canvas', 'entry'), default='canvas',
+                        help='tablero de la GUI / GUI board renderer')
+    parser.add_argument('--metrics', choices=('text', 'prometheus'),
+                        help='mostrar métricas al salir (stderr) / print metrics on exit (stderr)')
+    parser.add_argument('--dictionary', choices=('list', 'dawg'),
+                        help='estructura del diccionario (por defecto $WORDLE_DICTIONARY o list) / dictionary backend')
+    parser.add_argument('--preload', action='store_true',
+                        help='cargar todas las longitudes en segundo plano al arrancar / preload every length in the background')
+    parser.add_argument('--hard', action='store_true',
+                        help='modo difícil: reutilizar las pistas reveladas / hard mode: reuse revealed hints')
+    secret = parser.add_mutually_exclusive_group()
+    secret.add_argument('--daily', action='store_true',
+                        help='palabra del día en la CLI / word of the day in the CLI')
+    secret.add_argument('--adversarial', action='store_true',
+                        help='modo adversario (Absurdle): sin secreto fijo / adversarial mode: no fixed secret')
+    secret.add_argument('--boards', type=positive_int, metavar='N',
+                        help='jugar en N tableros a la vez (Quordle) / play N boards at once (Quordle)')
+    args = parser.parse_args(argv)
+    if args.simulate is not None:
+        # Checked here rather than with `choices=`: importing `simulate` (and
+        # NumPy with it) while building the parser would slow every --cli start.
+        # Se comprueba aquí y no con `choices=`: importar `simulate` al crear
+        # el analizador retrasaría cada arranque de --cli.
+        import simulate
+        if args.strategy not in simulate.STRATEGIES:
+            parser.error(f"argument --strategy: invalid choice: {args.strategy!r} "
+                         f"(choose from {', '.join(sorted(simulate.STRATEGIES))})")
+    return args
+
+
+def simulate_main(args):
+    """Run the headless simulation harness and print one report per length.
+
+    Español: Ejecuta la simulación sin interfaz e imprime un informe por longitud.
+    """
+    import simulate
+
+    for length in args.length or [5]:
+        report = simulate.simulate(args.simulate, length, args.strategy, args.workers, args.seed)
+        print(simulate.format_report(report))
+
+
 def main():
+    args = parse_args()
+    if args.metrics:
+        metrics.enable()
+    try:
+        run(args)
+    finally:
+        if args.metrics:
+            render = metrics.render_prometheus if args.metrics == 'prometheus' else metrics.render_text
+            print(render(), end='', file=sys.stderr)
+
+
+def run(args):
+    """Start the mode selected by `args` (simulation, CLI or GUI).
+
+    Español: Arranca el modo elegido en `args` (simulación, CLI o GUI).
+    """
+    if args.dictionary:
+        WordList.set_backend(args.dictionary)
+    if args.preload:
+        WordList.prewarm()
+    if args.simulate is not None:
+        simulate_main(args)
+        return
+
     # If user requested CLI, or GUI is unavailable, run CLI loop.
-    if '--cli' in sys.argv or MainMenuApp is None:
-        cli_main()
+    main_menu_app = None if args.cli else load_gui()
+    if main_menu_app is None:
+        if args.boards is not None:
+            cli_multi((args.length or [5])[0], args.boards)
+        else:
+            cli_main((args.length or [6])[0], args.daily, args.adversarial, args.hard)
         return
 
-    # Otherwise start the Tk GUI
-    app = MainMenuApp()
+    # Otherwise start the Tk GUI; both board sizes (and their prefix graphs)
+    # load while the menu shows.
+    # Si no, arranca la GUI; ambos tamaños (y sus grafos de prefijos) se
+    # cargan mientras se ve el menú.
+    WordList.prewarm(5, 7, tries=True)
+    app = main_menu_app(board=args.board, adversarial=args.adversarial, hard=args.hard, tableros=args.boards,
+                        length=(args.length or [None])[0])
     app.mainloop()
 
 
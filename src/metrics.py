@@ -0,0 +1,235 @@
+"""Low-overhead instrumentation: counters, latency histograms, cache hit rates.
+
+English: Off by default. Every instrumented site is guarded by a single
+module attribute check:
+
+    start = metrics.clock() if metrics.ENABLED else None
+    ...
+    if start is not None:
+        metrics.CHECK_WORD_SECONDS.observe(metrics.clock() - start)
+
+so a disabled build pays one global lookup and a branch per site (see
+`python bench.py metrics`). `enable()` turns collection on; `render_text()`
+gives a human snapshot (with cache hit rates) and `render_prometheus()` the
+Prometheus text exposition format. The CLI exposes both through
+`main.py --metrics text|prometheus`, the server through `--metrics` and the
+`{"op": "metrics"}` request.
+
+Updates are plain attribute increments without locks: under the GIL a
+rare lost update between threads is accepted in exchange for the cost.
+
+Español: Desactivado por defecto. Cada punto instrumentado se protege con
+una sola comprobación de atributo del módulo, así que desactivado cuesta una
+búsqueda global y un salto por punto. `enable()` activa la recogida;
+`render_text()` da un resumen legible (con tasas de acierto de cachés) y
+`render_prometheus()` el formato de texto de Prometheus. Las
+actualizaciones no usan candados: bajo el GIL se acepta perder rara vez una
+actualización entre hilos a cambio del coste.
+"""
+import bisect
+import time
+
+ENABLED = False
+
+# Monotonic clock used for all latency observations (seconds, float).
+# Reloj monótono usado en todas las latencias (segundos, float).
+clock = time.perf_counter
+
+# Histogram bucket upper bounds in seconds (1 us .. 10 s).
+# Límites superiores de los buckets en segundos (1 us .. 10 s).
+BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+
+class Counter:
+    """Monotonic counter.
+
+    Español: Contador monótono.
+    """
+
+    __slots__ = ('name', 'labels', 'value')
+
+    def __init__(self, name: str, labels=()):
+        self.name = name
+        self.labels = labels
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        self.value += amount
+
+
+class Histogram:
+    """Latency histogram over `BUCKETS` (plus sum and count).
+
+    Español: Histograma de latencias sobre `BUCKETS` (más suma y cuenta).
+    """
+
+    __slots__ = ('name', 'labels', 'counts', 'sum')
+
+    def __init__(self, name: str, labels=()):
+        self.name = name
+        self.labels = labels
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+
+    def observe(self, seconds: float, _bisect=bisect.bisect_left, _buckets=BUCKETS):
+        # Defaults bind the lookups once; this is the hottest metric call.
+        # Los valores por defecto enlazan las búsquedas una sola vez.
+        self.counts[_bisect(_buckets, seconds)] += 1
+        self.sum += seconds
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding quantile `q` (0 when empty).
+
+        Español: Límite superior del bucket que contiene el cuantil `q`.
+        """
+        count = self.count
+        if not count:
+            return 0.0
+        target = q * count
+        seen = 0
+        for bound, n in zip(BUCKETS + (float('inf'),), self.counts):
+            seen += n
+            if seen >= target:
+                return bound
+        return float('inf')
+
+
+# Every metric, in creation order: (name, sorted label pairs) -> metric;
+# and name -> (metric class, help text) for the exposition headers.
+# Todas las métricas, en orden de creación, y su tipo y ayuda por nombre.
+_registry = {}
+_help = {}
+
+
+def _metric(cls, name: str, help_text: str, labels):
+    key = (name, tuple(sorted(labels.items())))
+    metric = _registry.get(key)
+    if metric is None:
+        metric = _registry[key] = cls(name, key[1])
+        _help.setdefault(name, (cls, help_text))
+    return metric
+
+
+def counter(name: str, help_text: str = '', **labels) -> Counter:
+    return _metric(Counter, name, help_text, labels)
+
+
+def histogram(name: str, help_text: str = '', **labels) -> Histogram:
+    return _metric(Histogram, name, help_text, labels)
+
+
+def reset():
+    """Zero every metric (the metric objects stay valid).
+
+    Español: Pone a cero todas las métricas (los objetos siguen siendo válidos).
+    """
+    for metric in _registry.values():
+        if isinstance(metric, Counter):
+            metric.value = 0
+        else:
+            metric.counts = [0] * (len(BUCKETS) + 1)
+            metric.sum = 0.0
+
+
+def _label_text(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{v}"' for k, v in pairs) + '}'
+
+
+def render_prometheus() -> str:
+    """All metrics in the Prometheus text exposition format.
+
+    Español: Todas las métricas en el formato de texto de Prometheus.
+    """
+    lines = []
+    done = set()
+    # Stable sort: each family stays together, in creation order.
+    # Orden estable: cada familia queda junta, en orden de creación.
+    for (name, _), metric in sorted(_registry.items(), key=lambda item: item[0][0]):
+        if name not in done:
+            done.add(name)
+            cls, help_text = _help[name]
+            if help_text:
+                lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {"counter" if cls is Counter else "histogram"}')
+        if isinstance(metric, Counter):
+            lines.append(f'{name}{_label_text(metric.labels)} {metric.value}')
+            continue
+        cumulative = 0
+        for bound, n in zip(BUCKETS + (float('inf'),), metric.counts):
+            cumulative += n
+            le = '+Inf' if bound == float('inf') else repr(bound)
+            lines.append(f'{name}_bucket{_label_text(metric.labels, [("le", le)])} {cumulative}')
+        lines.append(f'{name}_sum{_label_text(metric.labels)} {metric.sum!r}')
+        lines.append(f'{name}_count{_label_text(metric.labels)} {metric.count}')
+    return '\n'.join(lines) + '\n'
+
+
+def render_text() -> str:
+    """Human-readable snapshot: counters, latency summaries, cache hit rates.
+
+    English: Counters with a `result` label of "hit"/"miss" are summarized
+    as a hit rate.
+    Español: Los contadores con etiqueta `result` "hit"/"miss" se resumen
+    como tasa de aciertos.
+    """
+    lines = []
+    caches = {}
+    for (name, labels), metric in _registry.items():
+        if isinstance(metric, Counter):
+            if not metric.value:
+                continue
+            lines.append(f'{name}{_label_text(labels)} {metric.value}')
+            result = dict(labels).get('result')
+            if result in ('hit', 'miss'):
+                rest = tuple(kv for kv in labels if kv[0] != 'result')
+                caches.setdefault((name, rest), {})[result] = metric.value
+        elif metric.count:
+            count = metric.count
+            lines.append(
+                f'{name}{_label_text(labels)} count={count} '
+                f'mean={metric.sum / count * 1e6:.1f}us '
+                f'p50<={metric.quantile(0.5) * 1e6:g}us p99<={metric.quantile(0.99) * 1e6:g}us')
+    for (name, rest), results in caches.items():
+        hits, misses = results.get('hit', 0), results.get('miss', 0)
+        lines.append(f'{name}{_label_text(rest)} hit_rate={hits / (hits + misses):.1%} ({hits}/{hits + misses})')
+    return '\n'.join(lines) + '\n'
+
+
+# Metrics of the game and dictionary hot paths.
+# Métricas de las rutas críticas del juego y del diccionario.
+DICTIONARY_CACHE_HIT = counter('wordle_dictionary_cache_total', 'WordList._ensure_loaded lookups', result='hit')
+DICTIONARY_CACHE_MISS = counter('wordle_dictionary_cache_total', 'WordList._ensure_loaded lookups', result='miss')
+DICTIONARY_LOAD_SECONDS = histogram('wordle_dictionary_load_seconds', 'Time to load one dictionary length')
+WORDS_FILE_PARSE_SECONDS = histogram('wordle_words_file_parse_seconds', 'Time to parse a words_N.txt file')
+KNOWN_WORD_SECONDS = histogram('wordle_known_word_seconds', 'WordList.is_known_word latency')
+CHECK_WORD_SECONDS = histogram('wordle_check_word_seconds', 'Game.check_word latency')
+SCORE_SECONDS = histogram('wordle_score_seconds', 'Scoring pass inside Game.check_word')
+CHECK_WORDS_SECONDS = histogram('wordle_check_words_seconds', 'game.check_words batch latency')
+GUESSES = {
+    result: counter('wordle_guesses_total', 'Guesses by outcome', result=result)
+    for result in ('invalid', 'unknown', 'rejected', 'scored')
+}
+PATTERN_MATRIX_HIT = counter('wordle_pattern_matrix_cache_total', 'patterns.load_matrix lookups', result='hit')
+PATTERN_MATRIX_MISS = counter('wordle_pattern_matrix_cache_total', 'patterns.load_matrix lookups', result='miss')
+CANDIDATE_INDEX_HIT = counter('wordle_candidate_index_cache_total', 'candidates.get_index lookups', result='hit')
+CANDIDATE_INDEX_MISS = counter('wordle_candidate_index_cache_total', 'candidates.get_index lookups', result='miss')
@@ -0,0 +1,134 @@
+"""Bucketed partition engine: split candidate secrets by feedback pattern.
+
+English: Given a guess and a set of candidate secrets, every candidate falls
+in the *bucket* of the pattern the guess would produce against it (see
+`encoding.py`). This module computes those buckets for a whole candidate set
+in one pass instead of one `check_word`-style pair at a time:
+
+  - Candidates are *rows*: ascending indexes into the ordered word list of
+    the length, as a NumPy intp array (or a list without NumPy). None means
+    the whole dictionary, so a fresh set costs no memory.
+  - Patterns come from `scoring.score_against` over the cached encoded
+    dictionary (a fancy-indexed slice of it for a subset), and bucket sizes
+    from one `bincount`.
+
+`largest_bucket` drives the adversarial mode (`game.AdversarialGame`): it
+keeps the biggest bucket and, among equally big ones, the least informative
+pattern (fewest greens, then fewest yellows), so the all-green pattern only
+wins when it is the last option.
+
+Español: Dado un intento y un conjunto de secretos candidatos, cada
+candidato cae en el *bucket* del patrón que produciría el intento. Este
+módulo calcula esos buckets para todo el conjunto de una vez. Los
+candidatos son *filas* (índices ascendentes en la lista ordenada de la
+longitud; None significa todo el diccionario). `largest_bucket` guía el modo
+adversario: conserva el bucket más grande y, entre los empatados, el patrón
+menos informativo (menos verdes, luego menos amarillos).
+"""
+import scoring
+import word_list
+from encoding import AMARILLO, VERDE, score_pair
+from scoring import np
+from word_list import WordList
+
+
+def row_count(rows, length: int) -> int:
+    """Number of candidates in `rows` (None = the whole dictionary).
+
+    Español: Número de candidatos en `rows` (None = todo el diccionario).
+    """
+    if rows is None:
+        WordList._ensure_loaded(length)
+        return len(word_list._words_by_length[length])
+    return len(rows)
+
+
+def row_words(rows, length: int):
+    """Candidate words of `rows`, in dictionary order.
+
+    Español: Palabras candidatas de `rows`, en el orden del diccionario.
+    """
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    if rows is None:
+        return list(words)
+    return [words[r] for r in (rows.tolist() if np is not None else rows)]
+
+
+def patterns_of(guess: str, rows, length: int):
+    """Pattern of `guess` against every candidate of `rows`, aligned with it.
+
+    Español: Patrón de `guess` contra cada candidato de `rows`, alineado.
+    """
+    if np is None:
+        WordList._ensure_loaded(length)
+        words = word_list._words_by_length[length]
+        if rows is None:
+            return [score_pair(guess, secret) for secret in words]
+        return [score_pair(guess, words[r]) for r in rows]
+    encoded = scoring.encoded_words(length)
+    return scoring.score_against(guess, encoded if rows is None else encoded[rows])
+
+
+def _hint_weight(pattern: int):
+    """Sort key of a pattern by how much it reveals: (greens, yellows, pattern).
+
+    Español: Clave de orden de un patrón según lo que revela.
+    """
+    greens = yellows = 0
+    remaining = pattern
+    while remaining:
+        remaining, code = divmod(remaining, 3)
+        if code == VERDE:
+            greens += 1
+        elif code == AMARILLO:
+            yellows += 1
+    return greens, yellows, pattern
+
+
+def buckets(guess: str, rows, length: int):
+    """Split `rows` by the pattern of `guess`: dict pattern -> rows.
+
+    English: Each value keeps the row form of the input (ascending).
+    Español: Cada valor conserva la forma de filas de la entrada (ascendente).
+    """
+    found = patterns_of(guess, rows, length)
+    if np is None:
+        out = {}
+        for row, pattern in zip(range(len(found)) if rows is None else rows, found):
+            out.setdefault(pattern, []).append(row)
+        return out
+    if rows is None:
+        rows = np.arange(len(found), dtype=np.intp)
+    order = np.argsort(found, kind='stable')
+    ordered = found[order]
+    cuts = np.flatnonzero(ordered[1:] != ordered[:-1]) + 1
+    return {int(found[chunk[0]]): rows[chunk] for chunk in np.split(order, cuts) if len(chunk)}
+
+
+def largest_bucket(guess: str, rows, length: int):
+    """Return (pattern, rows) of the biggest bucket of `guess` over `rows`.
+
+    English: Ties go to the least informative pattern (see `_hint_weight`).
+    Español: Los empates van al patrón menos informativo (ver `_hint_weight`).
+    """
+    found = patterns_of(guess, rows, length)
+    if np is None:
+        sizes = {}
+        for pattern in found:
+            sizes[pattern] = sizes.get(pattern, 0) + 1
+        best = min(sizes, key=lambda p: (-sizes[p],) + _hint_weight(p))
+        if rows is None:
+            return best, [row for row, pattern in enumerate(found) if pattern == best]
+        return best, [row for row, pattern in zip(rows, found) if pattern == best]
+    if found.dtype.itemsize <= 2:
+        # Small pattern space: one counting pass over a dense table.
+        # Espacio de patrones pequeño: una pasada de conteo sobre una tabla densa.
+        sizes = np.bincount(found)
+        tied = np.flatnonzero(sizes == sizes.max()).tolist()
+    else:
+        values, sizes = np.unique(found, return_counts=True)
+        tied = values[sizes == sizes.max()].tolist()
+    best = min(tied, key=_hint_weight)
+    keep = np.flatnonzero(found == best)
+    return best, keep if rows is None else rows[keep]
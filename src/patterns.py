@@ -0,0 +1,250 @@
+"""Precomputed guess x secret pattern matrices shared through mmap.
+
+English: For each words_N.txt this module can build the full matrix of
+feedback patterns (see `scoring.py`) for every (guess, secret) pair of the
+dictionary and store it next to the word file as 'words_N.patterns':
+
+    header (64 bytes): magic, length, count, itemsize, sha256(words_N.txt)
+    body:              count x count little-endian uint8/uint16/uint32, row = guess
+
+Files are opened read-only through `numpy.memmap` (or `mmap` without NumPy)
+so every worker process shares the same pages of the OS cache. A matrix
+whose stored checksum no longer matches the word file is rebuilt
+automatically. Build all matrices ahead of time with:
+
+    python patterns.py
+
+Español: Para cada words_N.txt este módulo construye la matriz completa de
+patrones (ver `scoring.py`) de todos los pares (suposición, secreto) y la
+guarda junto al archivo de palabras como 'words_N.patterns'. Los archivos se
+abren en sólo lectura con `numpy.memmap` (o `mmap` sin NumPy), de modo que
+todos los procesos comparten las mismas páginas de la caché del sistema. Si
+la suma de control guardada ya no coincide con el archivo de palabras, la
+matriz se reconstruye automáticamente.
+"""
+import array
+import mmap
+import os
+import struct
+import sys
+import time
+
+import encoding
+import metrics
+import scoring
+import word_list
+from scoring import np
+from word_list import WordList
+
+MAGIC = b'WRDLPAT1'
+HEADER = struct.Struct('<8sIII32s')
+HEADER_SIZE = 64
+
+# Loaded matrices: length -> PatternMatrix.
+# Matrices cargadas: longitud -> PatternMatrix.
+_matrices = {}
+
+
+class PatternMatrix:
+    """Read-only view over a guess x secret pattern matrix.
+
+    English: Rows and columns follow the ordered word list of the length.
+    `data` is a 2-D NumPy array (possibly memory-mapped) or, without NumPy, a
+    flat memoryview of `count * count` items.
+    Español: Filas y columnas siguen la lista ordenada de la longitud. `data`
+    es un arreglo NumPy 2-D (posiblemente mapeado) o, sin NumPy, un memoryview
+    plano de `count * count` elementos.
+    """
+
+    def __init__(self, words, data, path=None):
+        self.words = words
+        self.count = len(words)
+        self.index = {w: i for i, w in enumerate(words)}
+        self.data = data
+        self.path = path
+
+    def row(self, guess: str):
+        """Patterns of `guess` against every secret (aligned with `words`).
+
+        Español: Patrones de `guess` contra cada secreto.
+        """
+        i = self.index[guess]
+        if np is not None:
+            return self.data[i]
+        return self.data[i * self.count:(i + 1) * self.count]
+
+    def pattern(self, guess: str, secret: str) -> int:
+        """Pattern of a single (guess, secret) pair.
+
+        Español: Patrón de un único par (suposición, secreto).
+        """
+        return int(self.row(guess)[self.index[secret]])
+
+
+def matrix_path(length: int) -> str:
+    """Path of the 'words_N.patterns' sidecar for `length`.
+
+    Español: Ruta del archivo auxiliar 'words_N.patterns'.
+    """
+    return os.path.join(word_list.MODULE_DIR, f'words_{length}.patterns')
+
+
+def _itemsize(length: int) -> int:
+    """Bytes per stored pattern: the smallest width holding 3**length values.
+
+    Español: Bytes por patrón: el ancho más pequeño que contiene 3**length valores.
+    """
+    top = 3 ** length
+    if top <= 1 << 8:
+        return 1
+    if top <= 1 << 16:
+        return 2
+    if top <= 1 << 32:
+        return 4
+    raise ValueError(f'Patterns of length {length} do not fit in 32 bits')
+
+
+def _dtype(length: int) -> str:
+    return f'<u{_itemsize(length)}'
+
+
+def _typecode(length: int) -> str:
+    """`array`/`memoryview` typecode of `_itemsize(length)` bytes.
+
+    Español: Código de tipo de `array`/`memoryview` de `_itemsize(length)` bytes.
+    """
+    return {1: 'B', 2: 'H', 4: 'I' if array.array('I').itemsize == 4 else 'L'}[_itemsize(length)]
+
+
+def _read_header(path: str):
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read(HEADER_SIZE)
+    except FileNotFoundError:
+        return None
+    if len(raw) < HEADER_SIZE:
+        return None
+    magic, length, count, itemsize, checksum = HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        return None
+    return length, count, itemsize, checksum
+
+
+def _compute_rows(words, length: int):
+    """Yield each guess row as little-endian bytes.
+
+    Español: Genera cada fila de la matriz como bytes little-endian.
+    """
+    if np is not None:
+        secrets = scoring.encode_words(words, length)
+        dtype = _dtype(length)
+        for guess in words:
+            yield scoring.score_against(guess, secrets).astype(dtype).tobytes()
+        return
+    typecode = _typecode(length)
+    for guess in words:
+        row = array.array(typecode, (encoding.score_pair(guess, s) for s in words))
+        if sys.byteorder != 'little':
+            row.byteswap()
+        yield row.tobytes()
+
+
+def build_matrix(length: int) -> str:
+    """Compute and write the pattern matrix for `length`; return its path.
+
+    English: Writes to a temporary file and renames it into place so readers
+    never map a half-written matrix.
+    Español: Escribe en un archivo temporal y lo renombra al final para que
+    ningún lector mapee una matriz a medio escribir.
+    """
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    checksum = word_list.words_checksum(length)
+    if checksum is None:
+        raise FileNotFoundError(word_list.words_path(length))
+    path = matrix_path(length)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, length, len(words), _itemsize(length), checksum).ljust(HEADER_SIZE, b'\0'))
+        for row in _compute_rows(words, length):
+            f.write(row)
+    os.replace(tmp, path)
+    return path
+
+
+def _map_matrix(path: str, words, length: int):
+    count = len(words)
+    if count == 0:
+        return PatternMatrix(words, np.zeros((0, 0), np.uint8) if np is not None else memoryview(b''), path)
+    if np is not None:
+        data = np.memmap(path, dtype=_dtype(length), mode='r', offset=HEADER_SIZE, shape=(count, count))
+        return PatternMatrix(words, data, path)
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    body = memoryview(mapped)[HEADER_SIZE:]
+    if _itemsize(length) == 1:
+        return PatternMatrix(words, body, path)
+    if sys.byteorder == 'little':
+        return PatternMatrix(words, body.cast(_typecode(length)), path)
+    data = array.array(_typecode(length), body)
+    data.byteswap()
+    return PatternMatrix(words, memoryview(data), path)
+
+
+def _in_memory_matrix(words, length: int):
+    """Matrix for dictionaries without a word file (fallback lists).
+
+    Español: Matriz para diccionarios sin archivo (listas de respaldo).
+    """
+    body = b''.join(_compute_rows(words, length))
+    if np is not None:
+        return PatternMatrix(words, np.frombuffer(body, dtype=_dtype(length)).reshape(len(words), len(words)))
+    data = array.array(_typecode(length), body)
+    if sys.byteorder != 'little' and data.itemsize > 1:
+        data.byteswap()
+    return PatternMatrix(words, memoryview(data))
+
+
+def load_matrix(length: int) -> PatternMatrix:
+    """Return the pattern matrix for `length`, building it if missing or stale.
+
+    English: Freshness is decided by comparing the checksum and word count in
+    the header with the current words_N.txt.
+    Español: La vigencia se decide comparando la suma de control y el número
+    de palabras de la cabecera con el words_N.txt actual.
+    """
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    cached = _matrices.get(length)
+    if cached is not None and cached.words is words:
+        if metrics.ENABLED:
+            metrics.PATTERN_MATRIX_HIT.inc()
+        return cached
+    if metrics.ENABLED:
+        metrics.PATTERN_MATRIX_MISS.inc()
+
+    checksum = word_list.words_checksum(length)
+    if checksum is None:
+        matrix = _in_memory_matrix(words, length)
+    else:
+        path = matrix_path(length)
+        header = _read_header(path)
+        expected = (length, len(words), _itemsize(length), checksum)
+        if header != expected:
+            build_matrix(length)
+        matrix = _map_matrix(path, words, length)
+    _matrices[length] = matrix
+    return matrix
+
+
+def main():
+    for length in word_list.available_lengths():
+        start = time.perf_counter()
+        path = build_matrix(length)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path)
+        print(f'{os.path.basename(path)}: {size / 1e6:.2f} MB in {elapsed:.2f}s')
+
+
+if __name__ == '__main__':
+    main()
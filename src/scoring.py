@@ -0,0 +1,200 @@
+"""Batch scoring engine: one guess against many candidate secrets.
+
+English: Implements the same two-pass green/yellow/red algorithm used by
+`Game.check_word` (`encoding.score_pair`), but for a whole word list at
+once. Words are encoded as uint8 letter arrays and each feedback row is
+summarized as a single base-3 integer (the "pattern"):
+
+    pattern = sum(code[i] * 3**i)   with code rojo=0, amarillo=1, verde=2
+
+NumPy is used when available; otherwise a pure-Python fallback with the same
+results is used so the game keeps working with the standard library only.
+
+Español: Implementa el mismo algoritmo en dos pasadas que `Game.check_word`,
+pero para una lista de palabras completa. Las palabras se codifican como
+arreglos uint8 de letras y cada resultado se resume en un entero en base 3
+(el "patrón"). Se usa NumPy si está disponible; si no, una alternativa en
+Python puro con resultados idénticos.
+"""
+try:
+    import numpy as np
+except ImportError:  # optional dependency / dependencia opcional
+    np = None
+
+import word_list
+from encoding import BITS_PER_LETTER, LETTER_CODES, VERDE, pack_word, score_pair
+from word_list import WordList
+
+# Cache of encoded word arrays: length -> (source list, encoded array).
+# Caché de arreglos codificados: longitud -> (lista origen, arreglo codificado).
+_encoded_by_length = {}
+
+
+def pattern_dtype(length: int):
+    """Smallest unsigned NumPy dtype able to hold every pattern of `length`.
+
+    Español: Tipo NumPy sin signo más pequeño que contiene todos los patrones.
+    """
+    top = 3 ** length
+    if top <= 256:
+        return np.uint8
+    if top <= 65536:
+        return np.uint16
+    return np.uint32
+
+
+def encode_words(words, length: int):
+    """Encode words as an (N, length) uint8 array of letter codes.
+
+    English: Raises ValueError for words of the wrong length or with letters
+    outside `ALPHABET`.
+    Español: Lanza ValueError si alguna palabra tiene otra longitud o letras
+    fuera de `ALPHABET`.
+    """
+    if np is None:
+        raise RuntimeError('NumPy is required for encode_words')
+    out = np.empty((len(words), length), dtype=np.uint8)
+    for row, w in enumerate(words):
+        if len(w) != length:
+            raise ValueError(f'Word {w!r} does not have length {length}')
+        try:
+            out[row] = [LETTER_CODES[ch] for ch in w]
+        except KeyError as exc:
+            raise ValueError(f'Unsupported letter in {w!r}') from exc
+    return out
+
+
+def encoded_words(length: int):
+    """Encoded array for the dictionary of `length`, cached per word list.
+
+    Español: Arreglo codificado del diccionario de `length`, en caché.
+    """
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    cached = _encoded_by_length.get(length)
+    if cached is None or cached[0] is not words:
+        cached = (words, encode_words(words, length))
+        _encoded_by_length[length] = cached
+    return cached[1]
+
+
+def score_against(guess: str, secrets):
+    """Patterns of `guess` against every row of an encoded `secrets` array.
+
+    English: Vectorized over the candidates; the small per-position loop only
+    walks the guess letters to honour repeated-letter counts left to right,
+    exactly as the second pass of `check_word` does.
+    Español: Vectorizado sobre los candidatos; el pequeño bucle por posición
+    sólo recorre la suposición para respetar los conteos de letras repetidas
+    de izquierda a derecha, igual que el segundo paso de `check_word`.
+    """
+    length = secrets.shape[1]
+    g = np.array([LETTER_CODES[ch] for ch in guess], dtype=np.uint8)
+    green = secrets == g
+    unmatched = ~green
+    yellow = np.zeros_like(green)
+    for i in range(length):
+        # Unmatched occurrences of guess[i] in the secret, minus the ones
+        # already claimed by earlier yellows of the same letter.
+        # Ocurrencias no emparejadas de guess[i] menos las ya usadas.
+        available = ((secrets == g[i]) & unmatched).sum(axis=1)
+        for k in range(i):
+            if g[k] == g[i]:
+                available -= yellow[:, k]
+        yellow[:, i] = unmatched[:, i] & (available > 0)
+    codes = green.astype(np.uint32) * VERDE + yellow
+    powers = 3 ** np.arange(length, dtype=np.uint32)
+    return (codes @ powers).astype(pattern_dtype(length))
+
+
+def score_all(guess: str, length: int):
+    """Patterns of `guess` against every word of the `length` dictionary.
+
+    English: The result is aligned with the ordered word list used by
+    `WordList.get_random_word`. Returns a NumPy array when NumPy is
+    installed, otherwise a plain list of ints.
+    Español: El resultado está alineado con la lista ordenada usada por
+    `WordList.get_random_word`. Devuelve un arreglo NumPy si está instalado,
+    o una lista de enteros en caso contrario.
+    """
+    if np is None:
+        WordList._ensure_loaded(length)
+        return [score_pair(guess, secret) for secret in word_list._words_by_length[length]]
+    return score_against(guess, encoded_words(length))
+
+
+def _latin1(words):
+    """Concatenated latin-1 bytes of `words`, or None when NumPy can't be used.
+
+    Español: Bytes latin-1 concatenados de `words`, o None si no se puede usar NumPy.
+    """
+    if np is None or not words:
+        return None
+    try:
+        return ''.join(words).encode('latin-1')
+    except UnicodeEncodeError:
+        return None
+
+
+def score_pairs(guesses, secrets):
+    """Patterns of `guesses[k]` against `secrets[k]` for every k (one length).
+
+    English: The pairwise counterpart of `score_against`, for batches where
+    every guess has its own secret (e.g. `game.check_words`). Words are
+    compared as latin-1 bytes, so no letter encoding step is needed. Returns
+    a list of ints; falls back to `score_pair` without NumPy.
+    Español: La versión por pares de `score_against`, para lotes donde cada
+    suposición tiene su propio secreto. Las palabras se comparan como bytes
+    latin-1, sin paso de codificación. Devuelve una lista de enteros; sin
+    NumPy usa `score_pair`.
+    """
+    guess_bytes = _latin1(guesses)
+    secret_bytes = _latin1(secrets)
+    if guess_bytes is None or secret_bytes is None:
+        return [score_pair(g, s) for g, s in zip(guesses, secrets)]
+    length = len(guesses[0])
+    g = np.frombuffer(guess_bytes, dtype=np.uint8).reshape(-1, length)
+    s = np.frombuffer(secret_bytes, dtype=np.uint8).reshape(-1, length)
+    green = g == s
+    unmatched = ~green
+    yellow = np.zeros_like(green)
+    for i in range(length):
+        # Same left-to-right rule as `score_against`, one secret per row.
+        # Misma regla de izquierda a derecha que `score_against`, un secreto por fila.
+        gi = g[:, i:i + 1]
+        available = ((s == gi) & unmatched).sum(axis=1)
+        if i:
+            available -= ((g[:, :i] == gi) & yellow[:, :i]).sum(axis=1)
+        yellow[:, i] = unmatched[:, i] & (available > 0)
+    codes = green.astype(np.uint32) * VERDE + yellow
+    powers = 3 ** np.arange(length, dtype=np.uint32)
+    return (codes @ powers).tolist()
+
+
+def pack_words(words):
+    """`encoding.pack_word` for a batch of same-length words.
+
+    English: Returns a list of ints, with None for words that cannot be
+    packed (letters outside `ALPHABET`, or too long for 64 bits).
+    Español: Devuelve una lista de enteros, con None para las palabras que no
+    se pueden empaquetar (letras fuera de `ALPHABET` o demasiado largas).
+    """
+    raw = _latin1(words)
+    if raw is None or len(words[0]) * BITS_PER_LETTER > 64:
+        out = []
+        for w in words:
+            try:
+                out.append(pack_word(w))
+            except ValueError:
+                out.append(None)
+        return out
+    length = len(words[0])
+    table = np.full(256, 255, dtype=np.uint8)
+    for ch, code in LETTER_CODES.items():
+        table[ord(ch)] = code
+    codes = table[np.frombuffer(raw, dtype=np.uint8)].reshape(-1, length)
+    shifts = np.arange(length, dtype=np.uint64) * np.uint64(BITS_PER_LETTER)
+    packed = (codes.astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64).tolist()
+    for row in np.flatnonzero((codes == 255).any(axis=1)).tolist():
+        packed[row] = None
+    return packed
@@ -0,0 +1,371 @@
+"""Asyncio multi-session game server (newline-delimited JSON over TCP).
+
+English: Hosts many games (`CompactGame`, the low-footprint `Game`) keyed by
+session id. Each request and response is one JSON object per line:
+
+    {"op": "new", "length": 5}                -> {"session": "...", "length": 5, "intentos": 6}
+    {"op": "new", "daily": true}               -> same, with the shared word of the day
+    {"op": "new", "player": "alice"}           -> same, no repeated secret for that player
+                                                  until the dictionary is exhausted
+    {"op": "guess", "session": "...", "word": "about"}
+        -> {"resultados": [["a", "verde"], ...] | null, "length_valid": true,
+            "known": true, "winner": false, "intentos": 5}
+    {"op": "state", "session": "..."}          -> {"historial": [...], "intentos": 5}
+    {"op": "close", "session": "..."}          -> {"closed": true}
+    {"op": "metrics", "format": "prometheus"}  -> {"metrics": "<text exposition>"}
+
+An optional "id" field is echoed back so clients can pipeline requests.
+Errors are reported as {"error": "..."}. When a game ends the response also
+carries "palabra" (the secret). Idle sessions are evicted by LRU order
+(`max_sessions`) and by TTL (`ttl` seconds since last use), so memory stays
+bounded. With `--snapshot PATH` sessions survive restarts (see
+`snapshot.py`). Run with:
+
+    python server.py --port 8765 --max-sessions 100000 --ttl 900 --snapshot sessions.snap
+
+Español: Aloja muchas partidas (`CompactGame`) indexadas por id de sesión, con
+una petición y una respuesta JSON por línea. Las sesiones inactivas se
+expulsan por orden LRU (`max_sessions`) y por TTL (`ttl` segundos desde el
+último uso), de modo que la memoria queda acotada.
+"""
+import argparse
+import asyncio
+import json
+import os
+import secrets
+import signal
+import time
+from collections import OrderedDict
+
+import deck
+import metrics
+import word_index
+from game import CompactGame
+from word_list import WordList
+
+
+# Request ops, also the label values of the per-op latency histogram.
+# Operaciones de petición; también las etiquetas del histograma por operación.
+OPS = ('new', 'guess', 'state', 'close', 'metrics')
+
+
+class SessionStore:
+    """LRU + TTL table of live games.
+
+    English: The OrderedDict is kept in last-use order, so both eviction
+    rules only ever pop from the front: O(1) per evicted session.
+    Español: El OrderedDict se mantiene en orden de último uso, así que ambas
+    reglas de expulsión sólo sacan elementos del principio: O(1) por sesión.
+    """
+
+    def __init__(self, max_sessions: int = 100_000, ttl: float = 900.0, clock=time.monotonic, on_evict=None):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.clock = clock
+        # Called with the session id of every evicted session.
+        # Se llama con el id de cada sesión expulsada.
+        self.on_evict = on_evict
+        self._sessions = OrderedDict()
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def create(self, length: int, palabra_secreta: str = None) -> str:
+        session_id = secrets.token_hex(8)
+        self.add(session_id, CompactGame(palabra_secreta, length=length))
+        return session_id
+
+    def add(self, session_id: str, game):
+        """Insert an existing game (e.g. restored from a snapshot).
+
+        Español: Inserta una partida existente (p.ej. restaurada).
+        """
+        self._sessions[session_id] = (game, self.clock())
+        self._evict_over_capacity()
+
+    def games(self):
+        """Mapping session id -> game of every live session (a new dict).
+
+        Español: Diccionario id de sesión -> partida de todas las sesiones vivas.
+        """
+        return {session_id: game for session_id, (game, _) in self._sessions.items()}
+
+    def get(self, session_id: str):
+        """Return the game for `session_id` (refreshing its LRU/TTL) or None.
+
+        Español: Devuelve la partida de `session_id` (refrescando LRU/TTL) o None.
+        """
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        game, last_used = entry
+        now = self.clock()
+        if now - last_used > self.ttl:
+            self._evict(session_id)
+            return None
+        self._sessions[session_id] = (game, now)
+        self._sessions.move_to_end(session_id)
+        return game
+
+    def discard(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
+
+    def sweep(self) -> int:
+        """Evict every session idle for longer than `ttl`; return how many.
+
+        Español: Expulsa las sesiones inactivas más de `ttl`; devuelve cuántas.
+        """
+        deadline = self.clock() - self.ttl
+        removed = 0
+        while self._sessions:
+            session_id, (_, last_used) = next(iter(self._sessions.items()))
+            if last_used >= deadline:
+                break
+            self._evict(session_id)
+            removed += 1
+        return removed
+
+    def _evict_over_capacity(self):
+        while len(self._sessions) > self.max_sessions:
+            self._evict(next(iter(self._sessions)))
+
+    def _evict(self, session_id: str):
+        del self._sessions[session_id]
+        self.evicted += 1
+        if self.on_evict is not None:
+            self.on_evict(session_id)
+
+
+def _is_over(game) -> bool:
+    historial = game.get_historial()
+    return game.get_intentos_restantes() <= 0 or bool(historial and historial[-1].is_winner)
+
+
+class GameServer:
+    """Newline-delimited JSON protocol on top of a `SessionStore`.
+
+    Español: Protocolo JSON delimitado por líneas sobre un `SessionStore`.
+    """
+
+    def __init__(self, store: SessionStore = None, default_length: int = 5, journal=None, decks_path=None):
+        self.store = SessionStore() if store is None else store
+        self.default_length = default_length
+        # Per-length `deck.DeckStore` for player rotations, saved to
+        # '<decks_path>.<length>' on every sweep and on shutdown when a path
+        # is given.
+        # `deck.DeckStore` por longitud para las rotaciones de cada jugador.
+        self.decks = {}
+        self.decks_path = decks_path
+        # Optional `snapshot.Journal`: restores sessions and logs every change.
+        # `snapshot.Journal` opcional: restaura sesiones y registra cada cambio.
+        self.journal = journal
+        if journal is not None:
+            for session_id, game in journal.restore().items():
+                self.store.add(session_id, game)
+            self.store.on_evict = self._log_eviction
+        # Background TTL sweep task, created by `start()`.
+        # Tarea de barrido TTL en segundo plano, creada por `start()`.
+        self.sweeper = None
+        self.checkpointer = None
+
+    def _deck_store(self, length: int):
+        store = self.decks.get(length)
+        if store is None:
+            path = f'{self.decks_path}.{length}' if self.decks_path else None
+            if path and os.path.exists(path):
+                store = deck.DeckStore.load(path)
+            else:
+                store = deck.DeckStore(length, seed=secrets.randbits(64))
+            self.decks[length] = store
+        return store
+
+    def save_decks(self):
+        if self.decks_path:
+            for length, store in self.decks.items():
+                store.save(f'{self.decks_path}.{length}')
+
+    def _log_eviction(self, session_id: str):
+        self.journal.deltas.log_close(session_id)
+
+    def handle(self, request: dict) -> dict:
+        """Process one decoded request and return the response object.
+
+        Español: Procesa una petición decodificada y devuelve la respuesta.
+        """
+        op = request.get('op')
+        if op == 'metrics':
+            if request.get('format') == 'prometheus':
+                return {'metrics': metrics.render_prometheus()}
+            return {'metrics': metrics.render_text()}
+        if op == 'new':
+            length = int(request.get('length', self.default_length))
+            try:
+                secreta = None
+                if request.get('daily'):
+                    secreta = word_index.word_of_the_day(length)
+                elif request.get('player'):
+                    secreta = self._deck_store(length).draw_word(str(request['player']))
+                session_id = self.store.create(length, secreta)
+                game = self.store.get(session_id)
+                if self.journal is not None:
+                    try:
+                        self.journal.deltas.log_new(session_id, game)
+                    except ValueError:
+                        # Never keep a session the journal does not know.
+                        # Nunca se conserva una sesión que el registro no conoce.
+                        self.store.discard(session_id)
+                        raise
+            except ValueError as exc:
+                return {'error': str(exc)}
+            return {'session': session_id, 'length': length, 'intentos': game.get_intentos_restantes()}
+
+        game = self.store.get(request.get('session'))
+        if game is None:
+            return {'error': 'unknown or expired session'}
+
+        if op == 'guess':
+            if _is_over(game):
+                return {'error': 'game over'}
+            resultados, is_length_valid, is_known, is_winner = game.check_word(request.get('word'))
+            if is_known and self.journal is not None:
+                self.journal.deltas.log_guess(request['session'], resultados.word)
+            response = {
+                'resultados': [list(pair) for pair in resultados] if resultados is not None else None,
+                'length_valid': is_length_valid,
+                'known': is_known,
+                'winner': is_winner,
+                'intentos': game.get_intentos_restantes(),
+            }
+            if _is_over(game):
+                response['palabra'] = game.get_palabra_secreta()
+            return response
+        if op == 'state':
+            return {
+                'historial': [[list(pair) for pair in r] for r in game.get_historial()],
+                'intentos': game.get_intentos_restantes(),
+            }
+        if op == 'close':
+            closed = self.store.discard(request['session'])
+            if closed and self.journal is not None:
+                self.journal.deltas.log_close(request['session'])
+            return {'closed': closed}
+        return {'error': f'unknown op {op!r}'}
+
+    async def serve_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    start = metrics.clock() if metrics.ENABLED else None
+                    response = self.handle(request)
+                    if start is not None:
+                        op = request.get('op')
+                        metrics.histogram('wordle_server_request_seconds', 'Server request latency by op',
+                                          op=op if op in OPS else 'other').observe(metrics.clock() - start)
+                    if 'id' in request:
+                        response['id'] = request['id']
+                except (ValueError, TypeError, KeyError, AttributeError) as exc:
+                    response = {'error': f'bad request: {exc}'}
+                writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def sweep_forever(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            self.store.sweep()
+            self.save_decks()
+
+    async def checkpoint_forever(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            # Runs synchronously inside the loop, so no request interleaves.
+            # Se ejecuta de forma síncrona en el bucle: ninguna petición se intercala.
+            self.journal.checkpoint(self.store.games())
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765, sweep_interval: float = 30.0,
+                    checkpoint_interval: float = 300.0):
+        """Start listening; returns the `asyncio.Server` (sweeper runs alongside).
+
+        Español: Empieza a escuchar; devuelve el `asyncio.Server`.
+        """
+        server = await asyncio.start_server(self.serve_client, host, port, limit=1 << 16)
+        self.sweeper = asyncio.ensure_future(self.sweep_forever(sweep_interval))
+        if self.journal is not None:
+            self.checkpointer = asyncio.ensure_future(self.checkpoint_forever(checkpoint_interval))
+        return server
+
+    def shutdown(self):
+        """Stop the background tasks and persist decks and sessions.
+
+        English: Saves every deck store and writes a final checkpoint, so a
+        restart neither re-deals secrets of the current cycles nor replays
+        a long delta log.
+        Español: Guarda los mazos y escribe una instantánea final, así un
+        reinicio no repite secretos del ciclo actual.
+        """
+        for task in (self.sweeper, self.checkpointer):
+            if task is not None:
+                task.cancel()
+        self.save_decks()
+        if self.journal is not None and self.journal.deltas is not None:
+            self.journal.checkpoint(self.store.games())
+            self.journal.deltas.close()
+
+
+async def _run(args):
+    journal = None
+    if args.snapshot:
+        import snapshot
+        journal = snapshot.Journal(args.snapshot)
+    game_server = GameServer(SessionStore(args.max_sessions, args.ttl), args.length, journal, args.decks)
+    server = await game_server.start(args.host, args.port, checkpoint_interval=args.snapshot_interval)
+    # SIGTERM cancels the server like Ctrl-C, so the `finally` still runs.
+    # SIGTERM cancela el servidor como Ctrl-C, así se ejecuta el `finally`.
+    task = asyncio.current_task()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, task.cancel)
+    except (NotImplementedError, RuntimeError):
+        pass
+    print(f'Sirviendo en / serving on {args.host}:{args.port}')
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        game_server.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Wordle multi-session NDJSON server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--length', type=int, default=5, help='default word length for new sessions')
+    parser.add_argument('--max-sessions', type=int, default=100_000)
+    parser.add_argument('--ttl', type=float, default=900.0, help='idle seconds before eviction')
+    parser.add_argument('--snapshot', help='snapshot file; sessions are restored from it and its delta log')
+    parser.add_argument('--metrics', action='store_true',
+                        help='collect metrics (read them with {"op": "metrics"})')
+    parser.add_argument('--decks', help='file prefix for per-player secret rotation state')
+    parser.add_argument('--snapshot-interval', type=float, default=300.0, help='seconds between full snapshots')
+    parser.add_argument('--preload', action='store_true',
+                        help='load every words_N.txt in the background at startup')
+    args = parser.parse_args(argv)
+    if args.metrics:
+        metrics.enable()
+    if args.preload:
+        WordList.prewarm()
+    try:
+        asyncio.run(_run(args))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""Headless simulation harness: play many complete games without a UI.
+
+English: Plays N games per length against a pluggable guessing strategy and
+reports throughput (games/sec, guesses/sec), the distribution of attempts
+needed to win and the loss rate. Games are split across worker processes,
+each with its own seeded RNG, so runs are reproducible for a given
+(seed, workers) pair. This is the throughput benchmark for changes to
+`game.py` and `word_list.py`. Run it from `main.py`:
+
+    python main.py --simulate 10000 --length 5 --strategy candidate --workers 4
+
+A strategy is a callable `strategy(game, rng) -> guess`; register new ones
+in `STRATEGIES`.
+
+Español: Juega N partidas por longitud con una estrategia intercambiable e
+informa del rendimiento (partidas/s, intentos/s), la distribución de
+intentos para ganar y la tasa de derrotas. Las partidas se reparten entre
+procesos, cada uno con su propio RNG con semilla, así que las ejecuciones
+son reproducibles. Una estrategia es un invocable
+`strategy(game, rng) -> suposición`; las nuevas se registran en `STRATEGIES`.
+"""
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import decision_tree
+import solver
+import word_list
+from game import Game
+from word_list import WordList
+
+# Opening guess per length for the entropy strategy (the first state of
+# every game is identical, so it is computed once per process).
+# Primer intento por longitud para la estrategia de entropía.
+_openings = {}
+
+
+def strategy_random(game, rng):
+    """Any dictionary word, ignoring feedback.
+
+    Español: Cualquier palabra del diccionario, ignorando las pistas.
+    """
+    return rng.choice(word_list._words_by_length[game.length])
+
+
+def strategy_candidate(game, rng):
+    """A random word among the still-possible secrets.
+
+    Español: Una palabra al azar entre los secretos aún posibles.
+    """
+    return rng.choice(game.get_candidatos())
+
+
+def strategy_entropy(game, rng):
+    """The highest expected-information guess from `solver.py`.
+
+    Español: La suposición con mayor información esperada de `solver.py`.
+    """
+    if not game.get_historial():
+        if game.length not in _openings:
+            _openings[game.length] = solver.suggest_guess(game, tree=False)
+        return _openings[game.length]
+    return solver.suggest_guess(game, tree=False)
+
+
+def strategy_tree(game, rng):
+    """The move of the precomputed decision tree (built on first use).
+
+    Español: La jugada del árbol de decisión precalculado (se construye al primer uso).
+    """
+    guess = decision_tree.best_guess(game, build=True)
+    return guess if guess is not None else solver.suggest_guess(game, tree=False)
+
+
+STRATEGIES = {
+    'random': strategy_random,
+    'candidate': strategy_candidate,
+    'entropy': strategy_entropy,
+    'tree': strategy_tree,
+}
+
+
+def play_games(count: int, length: int, strategy: str, seed: int, intentos: int = 6):
+    """Play `count` games in this process and return aggregated counters.
+
+    English: Returns a dict with `wins` (attempts used -> games), `losses`
+    and `guesses`. Raises ValueError when the strategy plays a word that is
+    not in the dictionary.
+    Español: Devuelve un dict con `wins` (intentos usados -> partidas),
+    `losses` y `guesses`. Lanza ValueError si la estrategia juega una
+    palabra que no está en el diccionario.
+    """
+    rng = random.Random(seed)
+    choose = STRATEGIES[strategy]
+    WordList._ensure_loaded(length)
+    words = word_list._words_by_length[length]
+    wins = {}
+    losses = 0
+    guesses = 0
+    for _ in range(count):
+        game = Game(rng.choice(words), length=length, intentos=intentos)
+        while game.get_intentos_restantes() > 0:
+            guess = choose(game, rng)
+            _, _, is_known, is_winner = game.check_word(guess)
+            if not is_known:
+                # Retrying would loop forever on a strategy that keeps
+                # returning the same unplayable word.
+                # Reintentar entraría en un bucle infinito.
+                raise ValueError(f'Strategy {strategy!r} played unknown word {guess!r}')
+            guesses += 1
+            if is_winner:
+                used = intentos - game.get_intentos_restantes()
+                wins[used] = wins.get(used, 0) + 1
+                break
+        else:
+            losses += 1
+    return {'wins': wins, 'losses': losses, 'guesses': guesses}
+
+
+def simulate(games: int, length: int, strategy: str = 'candidate', workers: int = 1, seed: int = 0):
+    """Play `games` games over `workers` processes and return a report dict.
+
+    Español: Juega `games` partidas en `workers` procesos y devuelve un informe.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f'Unknown strategy {strategy!r}; choose from {sorted(STRATEGIES)}')
+    if workers < 1:
+        raise ValueError(f'workers must be at least 1, got {workers}')
+    shares = [games // workers + (1 if i < games % workers else 0) for i in range(workers)]
+    start = time.perf_counter()
+    if workers == 1:
+        parts = [play_games(games, length, strategy, seed)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(play_games, n, length, strategy, seed + i) for i, n in enumerate(shares) if n]
+            parts = [f.result() for f in futures]
+    elapsed = time.perf_counter() - start
+
+    wins = {}
+    for part in parts:
+        for used, n in part['wins'].items():
+            wins[used] = wins.get(used, 0) + n
+    return {
+        'games': games,
+        'length': length,
+        'strategy': strategy,
+        'workers': workers,
+        'seconds': elapsed,
+        'wins': dict(sorted(wins.items())),
+        'losses': sum(p['losses'] for p in parts),
+        'guesses': sum(p['guesses'] for p in parts),
+    }
+
+
+def format_report(report) -> str:
+    """Human-readable summary of a `simulate` report.
+
+    Español: Resumen legible de un informe de `simulate`.
+    """
+    games = report['games']
+    seconds = report['seconds'] or 1e-9
+    lines = [
+        f"length={report['length']} strategy={report['strategy']} workers={report['workers']}",
+        f"  games:    {games} in {seconds:.2f}s ({games / seconds:,.0f} games/s)",
+        f"  guesses:  {report['guesses']} ({report['guesses'] / seconds:,.0f} guesses/s)",
+        f"  losses:   {report['losses']} ({100 * report['losses'] / max(games, 1):.2f}%)",
+        '  attempts to win:',
+    ]
+    won = sum(report['wins'].values())
+    for used, n in report['wins'].items():
+        bar = '#' * round(40 * n / max(won, 1))
+        lines.append(f'    {used}: {n:>8} {bar}')
+    if won:
+        mean = sum(used * n for used, n in report['wins'].items()) / won
+        lines.append(f'  mean attempts (wins): {mean:.3f}')
+    return '\n'.join(lines)
@@ -0,0 +1,242 @@
+"""Bulk session snapshots with append-only deltas.
+
+English: A snapshot stores every live `CompactGame` as columnar, fixed-width
+records written sequentially in one pass:
+
+    header   magic, count, cell width, generation
+    ids      count x 16 bytes   (session id, ascii, NUL padded)
+    length   count x uint8
+    intentos count x int16
+    rows     count x uint8
+    secret   count x uint64     (`encoding.pack_word`)
+    cells    count x width      (history cells, see `CompactGame`)
+
+Restoring is a single read of the file followed by column slicing, with no
+rescoring. Between full snapshots, changes go to an append-only delta log of
+fixed-width records (new / guess / close). Each snapshot carries a
+*generation*; deltas are written to '<path>.delta.<generation>', so a crash
+between writing a snapshot and dropping the old log can never replay the
+same guess twice. `Journal` ties both together for the server.
+
+Español: Una instantánea guarda todas las `CompactGame` vivas como registros
+columnares de ancho fijo escritos secuencialmente de una vez. Restaurar es
+una única lectura del archivo seguida de cortes por columna, sin repuntuar.
+Entre instantáneas completas los cambios van a un registro de deltas sólo
+de anexado. Cada instantánea lleva una *generación*, así un fallo entre
+escribir la instantánea y borrar el registro antiguo nunca repite intentos.
+"""
+import array
+import glob
+import os
+import struct
+import sys
+
+from encoding import BITS_PER_LETTER, pack_word, unpack_word
+from game import CompactGame
+
+MAGIC = b'WRDLSNP1'
+HEADER = struct.Struct('<8sIII')
+HEADER_SIZE = 32
+ID_WIDTH = 16
+
+# Delta records: op, session id, length, intentos, packed word.
+# Registros delta: operación, id de sesión, longitud, intentos, palabra empaquetada.
+DELTA = struct.Struct('<B16sBhQ')
+OP_NEW, OP_GUESS, OP_CLOSE = 1, 2, 3
+
+# Longest word a uint64 `pack_word` field can hold.
+# Palabra más larga que cabe en un campo uint64 de `pack_word`.
+MAX_LENGTH = 64 // BITS_PER_LETTER
+
+
+def _encode_id(session_id: str) -> bytes:
+    raw = session_id.encode('ascii')
+    if len(raw) > ID_WIDTH:
+        raise ValueError(f'Session id longer than {ID_WIDTH} bytes: {session_id!r}')
+    return raw
+
+
+def _column(typecode: str, values) -> bytes:
+    column = array.array(typecode, values)
+    if sys.byteorder != 'little' and column.itemsize > 1:
+        column.byteswap()
+    return column.tobytes()
+
+
+def _read_column(typecode: str, data, offset: int, count: int):
+    column = array.array(typecode)
+    column.frombytes(data[offset:offset + count * column.itemsize])
+    if sys.byteorder != 'little' and column.itemsize > 1:
+        column.byteswap()
+    return column, offset + count * column.itemsize
+
+
+def write_snapshot(path: str, sessions, generation: int = 0):
+    """Write `sessions` (id -> CompactGame) to `path` atomically.
+
+    Español: Escribe `sessions` (id -> CompactGame) en `path` de forma atómica.
+    """
+    ids, lengths, intentos, rows, secrets_, cells = [], [], [], [], [], []
+    for session_id, game in sessions.items():
+        left, used, history = game.export_state()
+        ids.append(_encode_id(session_id))
+        lengths.append(game.length)
+        intentos.append(left)
+        rows.append(used)
+        secrets_.append(pack_word(game.get_palabra_secreta()))
+        cells.append(history)
+    width = max((len(c) for c in cells), default=0)
+    parts = [
+        HEADER.pack(MAGIC, len(ids), width, generation).ljust(HEADER_SIZE, b'\0'),
+        b''.join(i.ljust(ID_WIDTH, b'\0') for i in ids),
+        _column('B', lengths),
+        _column('h', intentos),
+        _column('B', rows),
+        _column('Q', secrets_),
+        b''.join(c.ljust(width, b'\0') for c in cells),
+    ]
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.writelines(parts)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def read_snapshot(path: str):
+    """Return (sessions, generation) from a snapshot written by `write_snapshot`.
+
+    Español: Devuelve (sesiones, generación) desde una instantánea.
+    """
+    with open(path, 'rb') as f:
+        data = memoryview(f.read())
+    magic, count, width, generation = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f'{path} is not a session snapshot')
+    offset = HEADER_SIZE
+    ids = data[offset:offset + count * ID_WIDTH]
+    offset += count * ID_WIDTH
+    lengths, offset = _read_column('B', data, offset, count)
+    intentos, offset = _read_column('h', data, offset, count)
+    rows, offset = _read_column('B', data, offset, count)
+    secrets_, offset = _read_column('Q', data, offset, count)
+    cells = data[offset:offset + count * width]
+
+    sessions = {}
+    for i in range(count):
+        session_id = bytes(ids[i * ID_WIDTH:(i + 1) * ID_WIDTH]).rstrip(b'\0').decode('ascii')
+        length, used = lengths[i], rows[i]
+        start = i * width
+        sessions[session_id] = CompactGame.from_state(
+            unpack_word(secrets_[i], length), length, intentos[i], used,
+            cells[start:start + used * length])
+    return sessions, generation
+
+
+class DeltaLog:
+    """Append-only log of session changes since the last snapshot.
+
+    Español: Registro sólo de anexado de cambios desde la última instantánea.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'ab')
+        # Drop a truncated trailing record (crash mid-write), otherwise every
+        # record appended after it would be read misaligned.
+        # Descarta un último registro truncado; si no, los siguientes se
+        # leerían desalineados.
+        size = self._file.seek(0, os.SEEK_END)
+        if size % DELTA.size:
+            self._file.truncate(size - size % DELTA.size)
+
+    def _append(self, op: int, session_id: str, length: int = 0, intentos: int = 0, word: int = 0):
+        self._file.write(DELTA.pack(op, _encode_id(session_id), length, intentos, word))
+        # Hand each record to the OS so a process crash loses nothing.
+        # Entrega cada registro al sistema para no perder nada si el proceso cae.
+        self._file.flush()
+
+    def log_new(self, session_id: str, game):
+        if game.length > MAX_LENGTH:
+            raise ValueError(f'Sessions of length {game.length} cannot be journaled (max {MAX_LENGTH})')
+        self._append(OP_NEW, session_id, game.length, game.get_intentos_restantes(),
+                     pack_word(game.get_palabra_secreta()))
+
+    def log_guess(self, session_id: str, word: str):
+        self._append(OP_GUESS, session_id, len(word), 0, pack_word(word))
+
+    def log_close(self, session_id: str):
+        self._append(OP_CLOSE, session_id)
+
+    def close(self):
+        self._file.close()
+
+
+def replay_deltas(path: str, sessions):
+    """Apply the records of a delta log to `sessions` in place.
+
+    English: A truncated trailing record (crash mid-write) is ignored.
+    Español: Se ignora un último registro truncado (fallo a mitad de escritura).
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return sessions
+    usable = len(data) - len(data) % DELTA.size
+    for op, raw_id, length, intentos, word in DELTA.iter_unpack(data[:usable]):
+        session_id = raw_id.rstrip(b'\0').decode('ascii')
+        if op == OP_NEW:
+            sessions[session_id] = CompactGame(unpack_word(word, length), length=length, intentos=intentos)
+        elif op == OP_GUESS:
+            game = sessions.get(session_id)
+            if game is not None:
+                game.check_word(unpack_word(word, length))
+        elif op == OP_CLOSE:
+            sessions.pop(session_id, None)
+    return sessions
+
+
+class Journal:
+    """Full snapshots at `path` plus generation-numbered delta logs.
+
+    Español: Instantáneas completas en `path` y registros delta numerados.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.generation = 0
+        self.deltas = None
+
+    def _delta_path(self, generation: int) -> str:
+        return f'{self.path}.delta.{generation}'
+
+    def restore(self):
+        """Load the last snapshot and its deltas; start logging. Returns sessions.
+
+        Español: Carga la última instantánea y sus deltas; empieza a registrar.
+        """
+        sessions = {}
+        if os.path.exists(self.path):
+            sessions, self.generation = read_snapshot(self.path)
+        replay_deltas(self._delta_path(self.generation), sessions)
+        self.deltas = DeltaLog(self._delta_path(self.generation))
+        return sessions
+
+    def checkpoint(self, sessions):
+        """Write a full snapshot and switch to a fresh delta log.
+
+        English: Must be called while no other change is applied (the
+        server calls it from the event loop, which serializes requests).
+        Español: Debe llamarse sin otros cambios en curso (el servidor lo
+        llama desde el bucle de eventos, que serializa las peticiones).
+        """
+        generation = self.generation + 1
+        write_snapshot(self.path, sessions, generation)
+        if self.deltas is not None:
+            self.deltas.close()
+        self.generation = generation
+        self.deltas = DeltaLog(self._delta_path(generation))
+        for stale in glob.glob(glob.escape(self.path) + '.delta.*'):
+            if stale != self.deltas.path:
+                os.remove(stale)
@@ -0,0 +1,123 @@
+"""Best-next-guess recommender based on expected information gain.
+
+English: Every allowed guess (the whole dictionary of the length) is ranked
+by the entropy of the feedback patterns it would produce over the current
+candidate secrets:
+
+    H(guess) = log2(N) - sum(c * log2(c)) / N
+
+where `c` are the sizes of the pattern buckets. The guess space is split in
+contiguous chunks across a `concurrent.futures.ProcessPoolExecutor`; each
+worker returns its local top-k and the parent merges them with a total,
+deterministic order (entropy desc, candidates first, then alphabetical), so
+the answer never depends on the number of workers. Workers read patterns
+from the shared memory-mapped matrix of `patterns.py`.
+
+Español: Cada suposición permitida se ordena por la entropía de los
+patrones que produciría sobre los secretos candidatos actuales. El espacio
+de suposiciones se reparte en bloques entre procesos; cada proceso devuelve
+su top-k local y el padre los combina con un orden total y determinista,
+de modo que la respuesta no depende del número de procesos.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import decision_tree
+import patterns
+from scoring import np
+
+
+def _entropy(bucket_sizes, total: int) -> float:
+    return math.log2(total) - sum(c * math.log2(c) for c in bucket_sizes if c) / total
+
+
+def _rank_chunk(length: int, guess_rows, candidate_rows, top_k: int):
+    """Rank the guesses at `guess_rows` against the candidates; keep top-k.
+
+    English: Runs inside worker processes, so it only receives row indices
+    and opens the pattern matrix itself (a shared read-only mapping).
+    Español: Se ejecuta en los procesos trabajadores; sólo recibe índices de
+    fila y abre la matriz de patrones por su cuenta (mapeo compartido).
+    """
+    matrix = patterns.load_matrix(length)
+    total = len(candidate_rows)
+    candidate_set = set(candidate_rows)
+    ranked = []
+    if np is not None:
+        columns = np.asarray(candidate_rows, dtype=np.intp)
+        for row in guess_rows:
+            counts = np.bincount(matrix.data[row, columns])
+            counts = counts[counts > 0]
+            h = float(math.log2(total) - (counts * np.log2(counts)).sum() / total)
+            ranked.append((h, row))
+    else:
+        for row in guess_rows:
+            values = matrix.row(matrix.words[row])
+            counts = {}
+            for col in candidate_rows:
+                p = values[col]
+                counts[p] = counts.get(p, 0) + 1
+            ranked.append((_entropy(counts.values(), total), row))
+    ranked.sort(key=lambda item: _sort_key(item, matrix.words, candidate_set))
+    return [(h, matrix.words[row]) for h, row in ranked[:top_k]]
+
+
+def _sort_key(item, words, candidate_set):
+    h, row = item
+    return (-round(h, 12), row not in candidate_set, words[row])
+
+
+def rank_guesses(length: int, candidate_words, top_k: int = 5, workers: int = 1):
+    """Return the `top_k` best guesses as a list of (entropy_bits, word).
+
+    English: `candidate_words` are the still-possible secrets, e.g.
+    `Game.get_candidatos()`. With `workers > 1` the guess space is scored in
+    a process pool; `workers=None` uses `os.cpu_count()`.
+    Español: `candidate_words` son los secretos aún posibles, p.ej.
+    `Game.get_candidatos()`. Con `workers > 1` se puntúa en un pool de
+    procesos; `workers=None` usa `os.cpu_count()`.
+    """
+    matrix = patterns.load_matrix(length)
+    candidate_rows = sorted(matrix.index[w] for w in candidate_words)
+    if not candidate_rows:
+        return []
+    if len(candidate_rows) == 1:
+        return [(0.0, matrix.words[candidate_rows[0]])]
+
+    workers = workers or os.cpu_count() or 1
+    guess_rows = range(matrix.count)
+    if workers == 1:
+        partials = [_rank_chunk(length, guess_rows, candidate_rows, top_k)]
+    else:
+        # A few chunks per worker keeps the pool busy until the end.
+        # Varios bloques por proceso mantienen el pool ocupado hasta el final.
+        n_chunks = workers * 4
+        step = -(-matrix.count // n_chunks)
+        chunks = [guess_rows[i:i + step] for i in range(0, matrix.count, step)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_rank_chunk, length, chunk, candidate_rows, top_k) for chunk in chunks]
+            partials = [f.result() for f in futures]
+
+    candidate_set = set(candidate_rows)
+    merged = [(h, matrix.index[w]) for part in partials for h, w in part]
+    merged.sort(key=lambda item: _sort_key(item, matrix.words, candidate_set))
+    return [(h, matrix.words[row]) for h, row in merged[:top_k]]
+
+
+def suggest_guess(game, workers: int = 1, tree: bool = True):
+    """Best next guess for a running `Game`, or None if nothing is possible.
+
+    English: With `tree`, a fresh precomputed decision tree
+    (`decision_tree.py`) answers in constant time while the game follows
+    it; otherwise the guesses are ranked by entropy.
+    Español: Con `tree`, un árbol de decisión precalculado y vigente
+    responde en tiempo constante mientras la partida lo siga; si no, se
+    ordenan los intentos por entropía.
+    """
+    if tree:
+        guess = decision_tree.best_guess(game)
+        if guess is not None:
+            return guess
+    ranked = rank_guesses(game.length, game.get_candidatos(), top_k=1, workers=workers)
+    return ranked[0][1] if ranked else None
@@ -2,29 +2,67 @@ import tkinter as tk
 from tkinter import messagebox, scrolledtext
 import os
 
-from game import Game
+import background
+from game import AdversarialGame, Game, MultiGame
 from word_list import WordList
 
 RULES_FILE = os.path.join(os.path.dirname(__file__), 'rules.txt')
 
+# Cell colours per feedback estado, shared by both board renderers.
+# Colores de casilla por estado, compartidos por ambos tableros.
+COLORS = {
+    'verde': '#6aaa64',
+    'amarillo': '#c9b458',
+    'rojo': '#787c7e'
+}
+
+# Letter colour of a row no dictionary word starts with.
+# Color de las letras de una fila con la que no empieza ninguna palabra.
+PREFIX_ERROR = '#d62728'
+
+# How often to re-check the typed prefix while its graph is still building.
+# Cada cuánto se vuelve a comprobar el prefijo mientras se construye su grafo.
+PREFIX_RETRY_MS = 50
+
 
 class WordleGameFrame(tk.Frame):
     """Frame that contains the Wordle game (reuses the existing logic).
 
+    With `adversarial=True` the frame plays `game.AdversarialGame` (no
+    fixed secret); with `hard=True`, hard mode (revealed hints must be
+    reused).
+
     Español: Frame que contiene el juego Wordle y reutiliza la lógica del
     módulo `game.py`. Este widget es configurable por longitud (5/6/7 letras)
-    y expone un callback `on_back` para volver al menú.
+    y expone un callback `on_back` para volver al menú. Con
+    `adversarial=True` juega `game.AdversarialGame` (sin secreto fijo); con
+    `hard=True`, en modo difícil.
     """
 
-    def __init__(self, master=None, length: int = 6, on_back=None, **kwargs):
+    def __init__(self, master=None, length: int = 6, on_back=None, adversarial: bool = False,
+                 hard: bool = False, **kwargs):
         super().__init__(master, **kwargs)
         self.length = length
         self.on_back = on_back
-        self.game = Game(length=self.length)
+        self.adversarial = adversarial
+        self.hard = hard
+        self.game = self._new_game()
         self.valid_length = self.length
         self.max_attempts = self.game.get_intentos_restantes()
         self.current_attempt = 0
         self.entries_rows = []
+        # Row currently flagged as an impossible prefix (None when clear).
+        # Fila marcada como prefijo imposible (None si no hay ninguna).
+        self._flagged_row = None
+        # Hint analysis runs off the main thread; see `background.py`.
+        # El análisis de pistas corre fuera del hilo principal; ver `background.py`.
+        self.scheduler = background.BackgroundScheduler(self)
+        # The prefix graph is built off the main thread; until it is ready
+        # every prefix counts as valid (see `_check_prefix`).
+        # El grafo de prefijos se construye fuera del hilo principal; hasta
+        # entonces todo prefijo se da por válido.
+        WordList.prewarm(self.length, tries=True)
+        self._prefix_retry = None
         self._build_ui()
 
     def _build_ui(self):
@@ -38,6 +76,9 @@ class WordleGameFrame(tk.Frame):
         grid_frame.grid(row=1, column=0, padx=10, pady=5)
 
         entry_font = ("Helvetica", 24, "bold")
+        # One Tcl command for the whole grid (not one per cell).
+        # Un único comando Tcl para toda la cuadrícula (no uno por casilla).
+        validate = (self.register(self._validate_entry), '%P')
 
         for r in range(self.max_attempts):
             row_entries = []
@@ -52,13 +93,27 @@ class WordleGameFrame(tk.Frame):
                 e.bind('<FocusIn>', lambda ev, rr=r, cc=c: self._on_focus(ev, rr, cc))
                 # Validate input: only allow a single alphabetic character
                 # Validación: solo permitir un carácter alfabético por casilla
-                e.config(validate='key', validatecommand=(self.register(self._validate_entry), '%P'))
+                e.config(validate='key', validatecommand=validate)
                 row_entries.append(e)
             self.entries_rows.append(row_entries)
 
+        self._build_buttons()
+
+        # Bind global Enter to submit when focus is inside the active row.
+        # Enlaza Enter globalmente para enviar cuando el foco esté en la fila activa.
+        self.bind_all('<Return>', self._on_return)
+
+        # focus first cell
+        self.after(50, lambda: self._focus_cell(0, 0))
+
+    def _build_buttons(self):
         buttons_frame = tk.Frame(self)
         buttons_frame.grid(row=2, column=0, pady=(5, 10))
 
+        self.hint_var = tk.StringVar(value='')
+        hint = tk.Label(self, textvariable=self.hint_var, font=(None, 10), fg='#555555')
+        hint.grid(row=3, column=0, pady=(0, 10))
+
         listo_btn = tk.Button(buttons_frame, text='Listo', command=self.submit_guess, width=10)
         listo_btn.pack(side='left', padx=5)
 
@@ -67,13 +122,6 @@ class WordleGameFrame(tk.Frame):
         back_btn = tk.Button(buttons_frame, text='Volver', command=self._on_back, width=10)
         back_btn.pack(side='left', padx=5)
 
-        # Bind global Enter to submit when focus is inside the active row.
-        # Enlaza Enter globalmente para enviar cuando el foco esté en la fila activa.
-        self.bind_all('<Return>', self._on_return)
-
-        # focus first cell
-        self.after(50, lambda: self._focus_cell(0, 0))
-
     def _on_return(self, event):
         
         widget = self.focus_get()
@@ -96,6 +144,9 @@ class WordleGameFrame(tk.Frame):
 
         key = event.keysym
         widget = event.widget
+        # Check the typed prefix once Tk has applied this key.
+        # Comprueba el prefijo escrito cuando Tk haya aplicado esta tecla.
+        self.after_idle(self._check_prefix)
 
         if key == 'BackSpace':
             if widget.get() == '':
@@ -156,22 +207,16 @@ class WordleGameFrame(tk.Frame):
             return
 
         # si la palabra no fue encontrada devuelve Game(None, True, False, False)
-        if resultados is None:
+        if resultados is None and not is_known:
             self.status_var.set('Palabra no encontrada en la lista, Intenta otra')
             return
 
-        colors = {
-            'verde': '#6aaa64',
-            'amarillo': '#c9b458',
-            'rojo': '#787c7e'
-        }
+        # Known but rejected by hard mode / conocida pero rechazada por el modo difícil
+        if resultados is None:
+            self.status_var.set('Modo difícil: {}.'.format(self.game.check_hard_mode(word)))
+            return
 
-        for idx, (letter, estado) in enumerate(resultados):
-            e = self.entries_rows[self.current_attempt][idx]
-            e.config(disabledbackground=colors.get(estado, '#ffffff'), disabledforeground='white')
-            e.delete(0, 'end')
-            e.insert(0, letter.upper())
-            e.config(state='disabled')
+        self._paint_row(self.current_attempt, resultados)
 
         if not is_known:
             self.status_var.set('Palabra incorrecta, se muestran las pistas.')
@@ -197,25 +242,137 @@ class WordleGameFrame(tk.Frame):
                 self._on_back()
             return
 
+        self._open_row(self.current_attempt)
+        self._request_hints()
+
+    def _request_hints(self):
+        """Start the hint analysis for the current history in the background.
+
+        English: Replaces any analysis still running for an older guess.
+        Español: Reemplaza cualquier análisis aún en curso de un intento anterior.
+        """
+        history = [(r.word, r.pattern) for r in self.game.get_historial()]
+        self.hint_var.set('Analizando...')
+        self.scheduler.submit('hints', background.analyze, self.length, history, callback=self._show_hints)
+
+    def _show_hints(self, hints):
+        text = 'Posibles: {}'.format(hints['candidatos'])
+        if hints['sugerencias']:
+            text += '  |  Sugerencias: {}'.format(', '.join(w.upper() for w in hints['sugerencias']))
+        self.hint_var.set(text)
+
+    def _typed_prefix(self):
+        """Letters typed in the active row, up to the first empty cell.
+
+        Español: Letras escritas en la fila activa, hasta la primera casilla vacía.
+        """
+        letters = []
         for e in self.entries_rows[self.current_attempt]:
+            val = e.get().strip()
+            if not val:
+                break
+            letters.append(val.lower())
+        return ''.join(letters)
+
+    def _check_prefix(self):
+        """Flag the active row when no dictionary word starts with it.
+
+        English: One walk of the dictionary's prefix graph
+        (`WordList.ready_trie`), so it is cheap on every key. The graph is
+        never built here: while the background loader is still on it the
+        prefix counts as valid and the check is retried shortly.
+        Español: Un recorrido del grafo de prefijos del diccionario, así que
+        es barato en cada tecla. Aquí nunca se construye: mientras el
+        cargador en segundo plano trabaja, el prefijo se da por válido y se
+        reintenta en breve.
+        """
+        if not self.winfo_exists() or self.current_attempt >= self.max_attempts:
+            return
+        prefix = self._typed_prefix()
+        trie = WordList.ready_trie(self.length)
+        if trie is None:
+            if self._prefix_retry is None:
+                self._prefix_retry = self.after(PREFIX_RETRY_MS, self._retry_prefix)
+            bad = False
+        else:
+            bad = bool(prefix) and not trie.has_prefix(prefix)
+        row = self.current_attempt if bad else None
+        if bad:
+            self.status_var.set('Ninguna palabra empieza por "{}"'.format(prefix.upper()))
+        elif self._flagged_row is not None:
+            self.status_var.set('')
+        if row != self._flagged_row:
+            old, self._flagged_row = self._flagged_row, row
+            self._flag_row(old, row)
+
+    def _retry_prefix(self):
+        self._prefix_retry = None
+        self._check_prefix()
+
+    def _flag_row(self, old, new):
+        """Move the impossible-prefix mark from row `old` to row `new`.
+
+        Español: Mueve la marca de prefijo imposible de la fila `old` a `new`.
+        """
+        if old is not None:
+            for e in self.entries_rows[old]:
+                e.config(fg='black')
+        if new is not None:
+            for e in self.entries_rows[new]:
+                e.config(fg=PREFIX_ERROR)
+
+    def _paint_row(self, row, resultados):
+        """Show the scored letters of `row` with their colours.
+
+        Español: Muestra las letras puntuadas de `row` con sus colores.
+        """
+        for idx, (letter, estado) in enumerate(resultados):
+            e = self.entries_rows[row][idx]
+            e.config(disabledbackground=COLORS.get(estado, '#ffffff'), disabledforeground='white')
+            e.delete(0, 'end')
+            e.insert(0, letter.upper())
+            e.config(state='disabled')
+
+    def _open_row(self, row):
+        """Make `row` the editable row.
+
+        Español: Convierte `row` en la fila editable.
+        """
+        for e in self.entries_rows[row]:
             e.config(state='normal')
             e.delete(0, 'end')
-        self._focus_cell(self.current_attempt, 0)
+        self._focus_cell(row, 0)
+
+    def _new_game(self):
+        if self.adversarial:
+            return AdversarialGame(length=self.length, hard=self.hard)
+        return Game(length=self.length, hard=self.hard)
 
     def restart(self):
-        self.game = Game()
-        # ensure game uses the same length when restarting
-        # se asegura de que use la misma longitud cuando se reinicia
-        self.game = Game(length=self.length)
+        # ensure game uses the same length and mode when restarting
+        # se asegura de que use la misma longitud y modo cuando se reinicia
+        self.game = self._new_game()
         self.current_attempt = 0
         self.max_attempts = self.game.get_intentos_restantes()
         self.status_var.set("Juego reiniciado")
+        self.scheduler.cancel('hints')
+        self.hint_var.set('')
+        self._reset_board()
+        self._check_prefix()
+
+    def _reset_board(self):
+        """Clear every cell and reopen the first row.
+
+        Español: Limpia todas las casillas y reabre la primera fila.
+        """
         for r, row in enumerate(self.entries_rows):
             for e in row:
                 e.config(state='normal')
                 e.delete(0, 'end')
-                e.config(bg='SystemButtonFace', fg='black')
                 try:
+                    # 'SystemButtonFace' only exists on Windows.
+                    # 'SystemButtonFace' sólo existe en Windows.
+                    e.config(bg='SystemButtonFace', fg='black')
                     e.config(disabledbackground='SystemButtonFace', disabledforeground='black')
                 except Exception:
                     pass
@@ -224,6 +381,13 @@ class WordleGameFrame(tk.Frame):
                     e.config(state='disabled')
         self._focus_cell(0, 0)
 
+    def destroy(self):
+        self.scheduler.close()
+        if self._prefix_retry is not None:
+            self.after_cancel(self._prefix_retry)
+            self._prefix_retry = None
+        super().destroy()
+
     def _on_back(self):
         # callback to return to menu
         # función de retorno para volver al menú
@@ -255,6 +419,322 @@ class WordleGameFrame(tk.Frame):
                 pass
 
 
+class CanvasGameFrame(WordleGameFrame):
+    """Game frame that draws the board on a single `tk.Canvas`.
+
+    English: Same game flow as `WordleGameFrame` (status, buttons, dialogs),
+    but the grid is one canvas with a rectangle and a text item per cell
+    instead of one `tk.Entry` widget each. Keys are handled by one canvas
+    binding, cell state lives in plain lists, and changed cells are marked
+    dirty and redrawn together in one idle callback, so typing, each
+    `submit_guess` and `restart` only touch the cells that actually changed.
+
+    Español: Mismo flujo de juego que `WordleGameFrame`, pero la cuadrícula
+    es un único canvas con un rectángulo y un texto por casilla en lugar de
+    un `tk.Entry` por casilla. Las teclas se manejan con un solo enlace, el
+    estado de las casillas vive en listas y las casillas cambiadas se marcan
+    como sucias y se redibujan juntas en una única llamada ociosa, así que
+    escribir, `submit_guess` y `restart` sólo tocan lo que cambió.
+    """
+
+    CELL = 56
+    GAP = 8
+    EMPTY_FILL = 'white'
+    EMPTY_OUTLINE = '#d3d6da'
+    TYPED_OUTLINE = '#878a8c'
+
+    def _build_ui(self):
+        self.status_var = tk.StringVar(value="Escribe una palabra para jugar")
+        status = tk.Label(self, textvariable=self.status_var, font=(None, 12))
+        status.grid(row=0, column=0, pady=(10, 5))
+
+        step = self.CELL + self.GAP
+        self.canvas = tk.Canvas(self, width=self.valid_length * step + self.GAP,
+                                height=self.max_attempts * step + self.GAP,
+                                highlightthickness=0, takefocus=1)
+        self.canvas.grid(row=1, column=0, padx=10, pady=5)
+
+        # Cell model: typed letter and fill per cell; `_shown` mirrors what
+        # the canvas currently draws so only real differences are redrawn.
+        # Modelo de casillas: letra y relleno por casilla; `_shown` refleja
+        # lo que dibuja el canvas para redibujar sólo las diferencias.
+        self._letters = [[''] * self.valid_length for _ in range(self.max_attempts)]
+        self._fills = [[None] * self.valid_length for _ in range(self.max_attempts)]
+        self._shown = [[('', None, False)] * self.valid_length for _ in range(self.max_attempts)]
+        self._dirty = set()
+        self._flush_pending = False
+        self._col = 0
+
+        font = ("Helvetica", 24, "bold")
+        self._rects = []
+        self._texts = []
+        for r in range(self.max_attempts):
+            rects, texts = [], []
+            for c in range(self.valid_length):
+                x, y = self.GAP + c * step, self.GAP + r * step
+                rects.append(self.canvas.create_rectangle(
+                    x, y, x + self.CELL, y + self.CELL,
+                    fill=self.EMPTY_FILL, outline=self.EMPTY_OUTLINE, width=2))
+                texts.append(self.canvas.create_text(
+                    x + self.CELL / 2, y + self.CELL / 2, text='', font=font))
+            self._rects.append(rects)
+            self._texts.append(texts)
+
+        self.canvas.bind('<Key>', self._on_canvas_key)
+        self.canvas.bind('<Button-1>', lambda ev: self.canvas.focus_set())
+        self._build_buttons()
+        self.canvas.focus_set()
+
+    def _set_cell(self, row, col, letter=None, fill=None):
+        if letter is not None:
+            self._letters[row][col] = letter
+        if fill is not None:
+            self._fills[row][col] = fill
+        self._dirty.add((row, col))
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.after_idle(self._flush)
+
+    def _flush(self):
+        """Redraw the dirty cells whose letter or colour really changed.
+
+        Español: Redibuja las casillas sucias cuya letra o color cambió.
+        """
+        self._flush_pending = False
+        canvas = self.canvas
+        if not canvas.winfo_exists():
+            # The frame was closed before the idle callback ran.
+            # El frame se cerró antes de que se ejecutara la llamada ociosa.
+            return
+        for row, col in self._dirty:
+            state = (self._letters[row][col], self._fills[row][col], row == self._flagged_row)
+            if state == self._shown[row][col]:
+                continue
+            letter, fill, flagged = state
+            if fill is None:
+                outline = self.TYPED_OUTLINE if letter else self.EMPTY_OUTLINE
+                canvas.itemconfigure(self._rects[row][col], fill=self.EMPTY_FILL, outline=outline)
+                canvas.itemconfigure(self._texts[row][col], text=letter,
+                                     fill=PREFIX_ERROR if flagged else 'black')
+            else:
+                canvas.itemconfigure(self._rects[row][col], fill=fill, outline=fill)
+                canvas.itemconfigure(self._texts[row][col], text=letter, fill='white')
+            self._shown[row][col] = state
+        self._dirty.clear()
+
+    def _on_canvas_key(self, event):
+        row = self.current_attempt
+        if row >= self.max_attempts:
+            return 'break'
+        key = event.keysym
+        if key == 'Return':
+            self.submit_guess()
+        elif key == 'BackSpace':
+            if self._col > 0:
+                self._col -= 1
+                self._set_cell(row, self._col, letter='')
+                self._check_prefix()
+        elif len(event.char) == 1 and event.char.isalpha() and self._col < self.valid_length:
+            self._set_cell(row, self._col, letter=event.char.upper())
+            self._col += 1
+            self._check_prefix()
+        return 'break'
+
+    def _typed_prefix(self):
+        row = self._letters[self.current_attempt]
+        return ''.join(row[:self._col]).lower()
+
+    def _flag_row(self, old, new):
+        # Only the colour changes; `_flush` reads `_flagged_row`.
+        # Sólo cambia el color; `_flush` lee `_flagged_row`.
+        for row in (old, new):
+            if row is not None:
+                for col in range(self.valid_length):
+                    self._set_cell(row, col)
+
+    def get_current_word(self):
+        return ''.join(ch.lower() for ch in self._letters[self.current_attempt])
+
+    def _paint_row(self, row, resultados):
+        for idx, (letter, estado) in enumerate(resultados):
+            self._set_cell(row, idx, letter=letter.upper(), fill=COLORS.get(estado, '#ffffff'))
+
+    def _open_row(self, row):
+        self._col = 0
+        self.canvas.focus_set()
+
+    def _reset_board(self):
+        # Only cells that hold something need clearing.
+        # Sólo hay que limpiar las casillas que tienen algo.
+        for r in range(self.max_attempts):
+            for c in range(self.valid_length):
+                if self._letters[r][c] or self._fills[r][c] is not None:
+                    self._letters[r][c] = ''
+                    self._fills[r][c] = None
+                    self._set_cell(r, c)
+        self._col = 0
+        self.canvas.focus_set()
+
+
+class MultiBoardFrame(tk.Frame):
+    """Frame for `game.MultiGame`: one guess played on several boards.
+
+    English: Every board is drawn on one scrollable `tk.Canvas` (a rectangle
+    and a text item per cell, created once). Typed letters appear in a label
+    above the boards; each submitted guess only recolours the new row of the
+    boards that were still unsolved, and a solved board gets a green frame.
+    Español: Todos los tableros se dibujan en un único `tk.Canvas`
+    desplazable (un rectángulo y un texto por casilla, creados una vez). Las
+    letras escritas aparecen en una etiqueta sobre los tableros; cada intento
+    sólo colorea la fila nueva de los tableros aún sin resolver, y un tablero
+    resuelto recibe un marco verde.
+    """
+
+    COLUMNS = 4
+    GAP = 3
+    BOARD_GAP = 14
+    WIDTH = 560
+    EMPTY_OUTLINE = '#d3d6da'
+
+    def __init__(self, master=None, length: int = 5, tableros: int = 4, on_back=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.length = length
+        self.tableros = tableros
+        self.on_back = on_back
+        self.game = MultiGame(length=length, tableros=tableros)
+        self._build_ui()
+
+    def _build_ui(self):
+        self.status_var = tk.StringVar(value='Escribe una palabra para jugar')
+        tk.Label(self, textvariable=self.status_var, font=(None, 12)).pack(pady=(10, 2))
+        self.typed_var = tk.StringVar(value='')
+        tk.Label(self, textvariable=self.typed_var, font=('Helvetica', 20, 'bold')).pack()
+
+        board_area = tk.Frame(self)
+        board_area.pack(fill='both', expand=True, padx=10, pady=5)
+        self.canvas = tk.Canvas(board_area, width=self.WIDTH, height=400, highlightthickness=0, takefocus=1)
+        scroll = tk.Scrollbar(board_area, orient='vertical', command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=scroll.set)
+        scroll.pack(side='right', fill='y')
+        self.canvas.pack(side='left', fill='both', expand=True)
+        self._draw_boards()
+
+        buttons_frame = tk.Frame(self)
+        buttons_frame.pack(pady=(5, 10))
+        tk.Button(buttons_frame, text='Listo', command=self.submit_guess, width=10).pack(side='left', padx=5)
+        tk.Button(buttons_frame, text='Reiniciar', command=self.restart, width=10).pack(side='left', padx=5)
+        tk.Button(buttons_frame, text='Volver', command=self._on_back, width=10).pack(side='left', padx=5)
+
+        self.canvas.bind('<Key>', self._on_key)
+        self.canvas.bind('<Button-1>', lambda ev: self.canvas.focus_set())
+        self.canvas.focus_set()
+
+    def _draw_boards(self):
+        """Create the (empty) cells of every board.
+
+        Español: Crea las casillas (vacías) de todos los tableros.
+        """
+        canvas = self.canvas
+        canvas.delete('all')
+        columns = min(self.COLUMNS, self.tableros)
+        width = (self.WIDTH - columns * self.BOARD_GAP) // columns
+        cell = max(10, min(32, width // self.length - self.GAP))
+        step = cell + self.GAP
+        board_w = self.length * step
+        board_h = self.game.get_intentos_restantes() * step
+        font = ('Helvetica', max(7, cell // 2), 'bold')
+        self._frames = []
+        self._rects = []
+        self._texts = []
+        for b in range(self.tableros):
+            x0 = self.BOARD_GAP // 2 + (b % columns) * (board_w + self.BOARD_GAP)
+            y0 = self.BOARD_GAP // 2 + (b // columns) * (board_h + self.BOARD_GAP)
+            self._frames.append(canvas.create_rectangle(
+                x0 - 4, y0 - 4, x0 + board_w + 1, y0 + board_h + 1, outline='', width=3))
+            rects, texts = [], []
+            for r in range(self.game.get_intentos_restantes()):
+                row_rects, row_texts = [], []
+                for c in range(self.length):
+                    x, y = x0 + c * step, y0 + r * step
+                    row_rects.append(canvas.create_rectangle(
+                        x, y, x + cell, y + cell, fill='white', outline=self.EMPTY_OUTLINE))
+                    row_texts.append(canvas.create_text(x + cell / 2, y + cell / 2, text='', font=font))
+                rects.append(row_rects)
+                texts.append(row_texts)
+            self._rects.append(rects)
+            self._texts.append(texts)
+        canvas.configure(scrollregion=canvas.bbox('all'))
+        self.current_attempt = 0
+        self._typed = []
+        self.typed_var.set('')
+
+    def _on_key(self, event):
+        key = event.keysym
+        if key == 'Return':
+            self.submit_guess()
+        elif key == 'BackSpace':
+            if self._typed:
+                self._typed.pop()
+        elif len(event.char) == 1 and event.char.isalpha() and len(self._typed) < self.length:
+            self._typed.append(event.char.upper())
+        self.typed_var.set(' '.join(self._typed))
+        return 'break'
+
+    def submit_guess(self, event=None):
+        word = ''.join(self._typed).lower()
+        if len(word) != self.length:
+            self.status_var.set('Escribe {} letras antes de enviar.'.format(self.length))
+            return
+
+        resultados, is_length_valid, is_known, is_winner = self.game.check_word(word)
+        if resultados is None:
+            self.status_var.set('Palabra no encontrada en la lista, Intenta otra')
+            return
+
+        row = self.current_attempt
+        canvas = self.canvas
+        for b, board in enumerate(resultados):
+            if board is None:
+                continue
+            for c, (letter, estado) in enumerate(board):
+                fill = COLORS.get(estado, '#ffffff')
+                canvas.itemconfigure(self._rects[b][row][c], fill=fill, outline=fill)
+                canvas.itemconfigure(self._texts[b][row][c], text=letter.upper(), fill='white')
+            if board.is_winner:
+                canvas.itemconfigure(self._frames[b], outline=COLORS['verde'])
+        self.current_attempt += 1
+        self._typed = []
+        self.typed_var.set('')
+        self.status_var.set('Resueltos {} de {}'.format(sum(self.game.get_resueltos()), self.tableros))
+
+        if is_winner:
+            again = messagebox.askyesno('¡Ganaste!', '¡Felicidades! Resolviste los {} tableros.\n¿Jugar de nuevo?'.format(self.tableros))
+        elif self.game.get_intentos_restantes() <= 0:
+            again = messagebox.askyesno('Perdiste', 'Has agotado los intentos. Las palabras eran: {}.\n¿Jugar de nuevo?'.format(
+                ', '.join(self.game.get_palabras_secretas())))
+        else:
+            return
+        if again:
+            self.restart()
+        else:
+            self._on_back()
+
+    def restart(self):
+        self.game = MultiGame(length=self.length, tableros=self.tableros)
+        self._draw_boards()
+        self.status_var.set('Juego reiniciado')
+        self.canvas.focus_set()
+
+    def _on_back(self):
+        try:
+            for child in self.winfo_children():
+                child.destroy()
+        except Exception:
+            pass
+        if callable(self.on_back):
+            self.on_back()
+
+
 class RulesFrame(tk.Frame):
     """Frame to display and edit rules from a text file.
        Frame para mostrar y editar reglas desde un archivo de texto.
@@ -290,9 +770,26 @@ class RulesFrame(tk.Frame):
         messagebox.showinfo('Reglas', 'Reglas guardadas correctamente')
 
 
+# Board renderers selectable with `MainMenuApp(board=...)` / `--board`.
+# Tableros seleccionables con `MainMenuApp(board=...)` / `--board`.
+BOARDS = {
+    'canvas': CanvasGameFrame,
+    'entry': WordleGameFrame,
+}
+
+
 class MainMenuApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, board: str = 'canvas', adversarial: bool = False, hard: bool = False,
+                 tableros: int = None, length: int = None):
         super().__init__()
+        self.board_class = BOARDS[board]
+        # Word length of multi-board games (`--length`, 5 by default).
+        # Longitud de las partidas de varios tableros (`--length`, 5 por defecto).
+        self.multi_length = length or 5
+        # Mode-screen toggle for `game.AdversarialGame`.
+        # Casilla de la pantalla de modos para `game.AdversarialGame`.
+        self.adversarial_var = tk.BooleanVar(self, value=adversarial)
+        self.hard_var = tk.BooleanVar(self, value=hard)
         self.title('Wordle - Menú')
         self.geometry('600x600')
         self.resizable(False, False)
@@ -307,6 +804,8 @@ class MainMenuApp(tk.Tk):
         self.current_frame = None
 
         self._build_menu()
+        if tableros:
+            self._launch_multi(tableros)
 
     def _build_menu(self):
         # Always clear the container before building the main menu. This
@@ -363,6 +862,22 @@ class MainMenuApp(tk.Tk):
         btn7 = tk.Button(mode_frame, text='Jugar - 7 letras', width=20, height=2, command=lambda: self._launch_mode(7))
         btn7.pack(pady=8)
 
+        adversarial = tk.Checkbutton(mode_frame, text='Modo adversario (sin palabra fija)',
+                                     variable=self.adversarial_var)
+        adversarial.pack(pady=8)
+
+        hard = tk.Checkbutton(mode_frame, text='Modo difícil (reutilizar las pistas)', variable=self.hard_var)
+        hard.pack(pady=8)
+
+        # Multi-board games of `multi_length` letters.
+        # Partidas de varios tableros de `multi_length` letras.
+        multi_frame = tk.Frame(mode_frame)
+        multi_frame.pack(pady=8)
+        tk.Label(multi_frame, text=f'Varios tableros ({self.multi_length} letras):').pack(side='left', padx=(0, 5))
+        for tableros in (4, 8, 16):
+            tk.Button(multi_frame, text=str(tableros), width=4,
+                      command=lambda n=tableros: self._launch_multi(n)).pack(side='left', padx=2)
+
         # Use the safe back callback which clears the container and rebuilds
         # the menu. This prevents the previous frame from remaining visible
         # underneath the new menu.
@@ -381,7 +896,24 @@ class MainMenuApp(tk.Tk):
                     child.destroy()
             self.current_frame = None
 
-        game_frame = WordleGameFrame(self.container, length=length, on_back=self._back_to_menu)
+        game_frame = self.board_class(self.container, length=length, on_back=self._back_to_menu,
+                                      adversarial=self.adversarial_var.get(), hard=self.hard_var.get())
+        game_frame.pack(fill='both', expand=True)
+        self.current_frame = game_frame
+
+    def _launch_multi(self, tableros: int, length: int = None):
+        # Replace the current frame with a multi-board game
+        # Remplaza el frame actual con una partida de varios tableros
+        length = length or self.multi_length
+        if self.current_frame is not None:
+            try:
+                self.current_frame.destroy()
+            except Exception:
+                for child in self.container.winfo_children():
+                    child.destroy()
+            self.current_frame = None
+
+        game_frame = MultiBoardFrame(self.container, length=length, tableros=tableros, on_back=self._back_to_menu)
         game_frame.pack(fill='both', expand=True)
         self.current_frame = game_frame
 
@@ -0,0 +1,183 @@
+"""Random access to a dictionary without loading it (mmap'd compiled file).
+
+English: The compiled 'words_N.bin' (see `word_list.compile_words`) stores
+fixed-width records, so the offset of word i is simply
+
+    COMPILED_HEADER_SIZE + i * N
+
+and the file itself is the offset index. A `WordIndex` maps it read-only and
+reads single records on demand: picking a secret costs one random number and
+one N-byte slice, never materializing the word list. This suits processes
+that only create games (e.g. the server tier) and never validate guesses.
+
+`word_of_the_day` derives the index from a hash of the date, the length, an
+optional salt and the dictionary checksum, so every node with the same
+dictionary picks the same secret without any coordination.
+
+Español: El 'words_N.bin' compilado guarda registros de ancho fijo, así que
+el desplazamiento de la palabra i es aritmético y el propio archivo es el
+índice. Un `WordIndex` lo mapea en sólo lectura y lee registros sueltos bajo
+demanda: elegir un secreto cuesta un número aleatorio y un corte de N bytes,
+sin cargar la lista. `word_of_the_day` obtiene el índice de un hash de la
+fecha, la longitud, una sal opcional y la suma de control del diccionario,
+de modo que todos los nodos con el mismo diccionario eligen el mismo secreto
+sin coordinarse.
+"""
+import datetime
+import hashlib
+import mmap
+import os
+import random
+import threading
+
+import word_list
+
+# Open indexes: length -> (source file stamp, WordIndex or None). None records
+# that the index could not be opened or compiled for that stamp (e.g. in a
+# read-only directory), so later picks go straight to the in-memory list.
+# Índices abiertos: longitud -> (sello del archivo origen, WordIndex o None).
+# None indica que no se pudo abrir ni compilar para ese sello (p. ej. en un
+# directorio de sólo lectura) y se usa directamente la lista en memoria.
+_indexes = {}
+
+# Serializes opening/compiling indexes; lookups of an open index skip it.
+# Serializa la apertura/compilación; las consultas de un índice abierto no lo usan.
+_indexes_lock = threading.Lock()
+
+
+class WordIndex:
+    """Read-only mmap view of one compiled dictionary.
+
+    Español: Vista mmap de sólo lectura de un diccionario compilado.
+    """
+
+    def __init__(self, length: int, checksum: bytes):
+        self.length = length
+        self.checksum = checksum
+        with open(word_list.compiled_path(length), 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, width, stored = word_list.COMPILED_HEADER.unpack_from(self._map)
+        if (magic != word_list.COMPILED_MAGIC or width != length or stored != checksum
+                or len(self._map) != word_list.COMPILED_HEADER_SIZE + count * width):
+            self._map.close()
+            raise ValueError(f'Stale or invalid compiled dictionary for length {length}')
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i: int) -> str:
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        start = word_list.COMPILED_HEADER_SIZE + i * self.length
+        return self._map[start:start + self.length].decode('latin-1')
+
+    def close(self):
+        self._map.close()
+
+
+def _source_stamp(length: int):
+    """(size, mtime_ns) of words_N.txt, or None if missing.
+
+    Español: (tamaño, mtime_ns) de words_N.txt, o None si no existe.
+    """
+    try:
+        st = os.stat(word_list.words_path(length))
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def get_index(length: int):
+    """Return the (cached) `WordIndex` for `length`, or None if unavailable.
+
+    English: A missing or stale 'words_N.bin' is compiled first (this loads
+    the text file once). The checksum is only recomputed when the text
+    file's size or mtime changes, so each pick stays O(1). None means there
+    is no word file, or it cannot be compiled; callers then use the
+    in-memory list; that result is cached until the text file changes.
+    Español: Si 'words_N.bin' falta o está obsoleto se compila antes (lo que
+    lee el texto una vez). La suma de control sólo se recalcula si cambian el
+    tamaño o la fecha del texto, así cada sorteo sigue siendo O(1). None
+    indica que no hay archivo de palabras o que no se puede compilar; los
+    llamadores usan entonces la lista en memoria; el resultado se guarda
+    hasta que cambie el archivo de texto.
+    """
+    stamp = _source_stamp(length)
+    cached = _indexes.get(length)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with _indexes_lock:
+        return _open_index(length, stamp)
+
+
+def _open_index(length: int, stamp):
+    """Slow path of `get_index`; the caller holds `_indexes_lock`.
+
+    Español: Camino lento de `get_index`; quien llama tiene `_indexes_lock`.
+    """
+    cached = _indexes.get(length)
+    if cached is not None and cached[0] == stamp:
+        # Opened by another thread while this one waited.
+        # Abierto por otro hilo mientras este esperaba.
+        return cached[1]
+    previous = cached[1] if cached is not None else None
+    index = None
+    checksum = word_list.words_checksum(length)
+    if checksum is not None and previous is not None and previous.checksum == checksum:
+        index = previous
+    elif checksum is not None:
+        for _ in range(2):
+            try:
+                index = WordIndex(length, checksum)
+                break
+            except (OSError, ValueError):
+                # Compile (or refresh) the binary file, then retry once.
+                # Compila (o actualiza) el archivo binario y reintenta una vez.
+                if word_list._load_words(length) is None:
+                    break
+    if previous is not None and previous is not index:
+        previous.close()
+    _indexes[length] = (stamp, index)
+    return index
+
+
+def _words(length: int):
+    """Index for `length`, or the in-memory list when there is no index.
+
+    Español: Índice de `length`, o la lista en memoria si no hay índice.
+    """
+    index = get_index(length)
+    if index is not None:
+        return index
+    word_list.WordList._ensure_loaded(length)
+    return word_list._words_by_length.get(length, [])
+
+
+def random_word(length: int, rng=random) -> str:
+    """Uniformly random word of `length` in O(1) memory.
+
+    Español: Palabra aleatoria uniforme de `length` con memoria O(1).
+    """
+    words = _words(length)
+    if not words:
+        raise ValueError(f'No words available for length {length}')
+    return words[rng.randrange(len(words))]
+
+
+def word_of_the_day(length: int, day=None, salt: str = '') -> str:
+    """Deterministic secret of `length` for `day` (default: today, UTC).
+
+    English: `salt` separates independent daily games (e.g. per event) that
+    share a dictionary.
+    Español: `salt` separa juegos diarios independientes que comparten
+    diccionario.
+    """
+    words = _words(length)
+    if not words:
+        raise ValueError(f'No words available for length {length}')
+    day = day or datetime.datetime.now(datetime.timezone.utc).date()
+    digest = hashlib.sha256(f'{salt}:{length}:{day.isoformat()}:'.encode('utf-8'))
+    if isinstance(words, WordIndex):
+        digest.update(words.checksum)
+    return words[int.from_bytes(digest.digest()[:8], 'little') % len(words)]
@@ -1,5 +1,12 @@
+import hashlib
 import random
 import os
+import re
+import struct
+import threading
+
+import metrics
+from dawg import Dawg
 
 # Directory where this module and the words files live.
 # Directorio donde se encuentran este módulo y los archivos de palabras.
@@ -9,115 +16,467 @@ MODULE_DIR = os.path.dirname(__file__)
 # Caché en memoria que mapea longitud de palabra -> lista de palabras.
 _words_by_length = {}
 
+# Membership index mapping word length -> frozenset of the same words, built
+# once alongside the ordered list so lookups are O(1) hash probes.
+# Índice de pertenencia longitud -> frozenset con las mismas palabras; se
+# construye una sola vez junto a la lista ordenada para búsquedas O(1).
+_word_sets_by_length = {}
+
+# Dictionary backend used by `WordList._ensure_loaded`: 'list' keeps a list
+# plus a frozenset per length; 'dawg' keeps one compact `dawg.Dawg` that
+# serves as both (same order, same API). Chosen with WORDLE_DICTIONARY or
+# `WordList.set_backend()`.
+# Backend del diccionario: 'list' guarda una lista y un frozenset por
+# longitud; 'dawg' guarda un único `dawg.Dawg` compacto que sirve de ambos.
+BACKENDS = ('list', 'dawg')
+BACKEND = os.environ.get('WORDLE_DICTIONARY', 'list')
+
+# Per-length load locks (once-initialization): the first caller of a cold
+# length loads it while concurrent callers of the same length wait for that
+# single load; other lengths load in parallel. `_load_locks_guard` only
+# protects the creation of the locks.
+# Candados de carga por longitud: el primer llamador carga la longitud y los
+# demás de la misma longitud esperan a esa única carga; las otras longitudes
+# se cargan en paralelo. `_load_locks_guard` sólo protege su creación.
+_load_locks = {}
+_load_locks_guard = threading.Lock()
+
+# Prefix graphs built for the 'list' backend: length -> (source list, Dawg).
+# Grafos de prefijos creados para el backend 'list': longitud -> (lista, Dawg).
+_tries_by_length = {}
+
+# Compiled dictionary format ('words_N.bin'): a fixed header followed by
+# `count` records of exactly `length` latin-1 bytes each.
+# Formato compilado ('words_N.bin'): cabecera fija seguida de `count`
+# registros de exactamente `length` bytes latin-1.
+COMPILED_MAGIC = b'WRDLDIC1'
+COMPILED_HEADER = struct.Struct('<8sII32s')
+COMPILED_HEADER_SIZE = 64
+
+
+def _load_lock(length: int):
+    """Return the load lock of `length`, creating it on first use.
+
+    Español: Devuelve el candado de carga de `length`, creándolo al primer uso.
+    """
+    lock = _load_locks.get(length)
+    if lock is None:
+        with _load_locks_guard:
+            lock = _load_locks.setdefault(length, threading.Lock())
+    return lock
+
+
+def words_path(length: int) -> str:
+    """Path of the 'words_{length}.txt' file next to this module.
+
+    Español: Ruta del archivo 'words_{length}.txt' junto a este módulo.
+    """
+    return os.path.join(MODULE_DIR, f'words_{length}.txt')
+
+
+def available_lengths():
+    """Sorted word lengths that have a words_N.txt file in `MODULE_DIR`.
+
+    Español: Longitudes ordenadas que tienen un archivo words_N.txt.
+    """
+    lengths = []
+    for name in os.listdir(MODULE_DIR):
+        match = re.fullmatch(r'words_(\d+)\.txt', name)
+        if match:
+            lengths.append(int(match.group(1)))
+    return sorted(lengths)
+
+
+def words_checksum(length: int):
+    """SHA-256 digest (bytes) of the words_N.txt content, or None if missing.
+
+    English: Derived caches (pattern matrices, compiled dictionaries) store
+    this digest and are rebuilt whenever it no longer matches.
+    Español: Las cachés derivadas guardan este resumen y se regeneran cuando
+    deja de coincidir.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(words_path(length), 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.digest()
+
 
 def _load_words_file(length: int):
     """Load a words_N.txt file for the requested length.
 
     English: Open and read 'words_{length}.txt' next to this module. Returns
     a list of lower-cased, deduplicated words or None if the file does not exist.
+    Entries of any other length are skipped so they can never be drawn as a
+    secret for this mode.
 
     Español: Abre y lee 'words_{length}.txt' al lado de este módulo. Devuelve
     una lista de palabras en minúsculas y sin duplicados, o None si el archivo
-    no existe.
+    no existe. Se omiten las entradas de otra longitud para que nunca puedan
+    salir como palabra secreta de este modo.
     """
-    path = os.path.join(MODULE_DIR, f'words_{length}.txt')
+    path = words_path(length)
     if not os.path.exists(path):
         return None
+    start = metrics.clock() if metrics.ENABLED else None
     with open(path, 'r', encoding='utf-8') as f:
-        words = [w.strip().lower() for w in f if w.strip()]
+        words = [w.strip().lower() for w in f if len(w.strip()) == length]
     # dedupe while preserving order
-    return list(dict.fromkeys(words))
+    words = list(dict.fromkeys(words))
+    if start is not None:
+        metrics.WORDS_FILE_PARSE_SECONDS.observe(metrics.clock() - start)
+    return words
+
+
+def compiled_path(length: int) -> str:
+    """Path of the compiled 'words_{length}.bin' next to the text file.
+
+    Español: Ruta del diccionario compilado 'words_{length}.bin'.
+    """
+    return os.path.join(MODULE_DIR, f'words_{length}.bin')
+
+
+def compile_words(length: int, words, checksum: bytes) -> bool:
+    """Write `words` as a compiled dictionary tagged with `checksum`.
+
+    English: Returns False (and writes nothing) when a word cannot be stored
+    as `length` latin-1 bytes or the directory is not writable; the text
+    file then simply remains the source of truth.
+    Español: Devuelve False (sin escribir nada) si alguna palabra no cabe en
+    `length` bytes latin-1 o el directorio no admite escritura; el archivo de
+    texto sigue siendo entonces la fuente de verdad.
+    """
+    try:
+        body = ''.join(words).encode('latin-1')
+    except UnicodeEncodeError:
+        return False
+    if len(body) != length * len(words):
+        return False
+    header = COMPILED_HEADER.pack(COMPILED_MAGIC, len(words), length, checksum)
+    path = compiled_path(length)
+    # Per thread: two threads compiling at once must not share a temp file.
+    # Por hilo: dos hilos compilando a la vez no comparten archivo temporal.
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(header.ljust(COMPILED_HEADER_SIZE, b'\0'))
+            f.write(body)
+        os.replace(tmp, path)
+    except OSError:
+        return False
+    return True
+
+
+def _load_compiled(length: int, checksum: bytes):
+    """Load 'words_{length}.bin' if it matches `checksum`, else None.
+
+    Español: Carga 'words_{length}.bin' si coincide con `checksum`; si no, None.
+    """
+    try:
+        with open(compiled_path(length), 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < COMPILED_HEADER_SIZE:
+        return None
+    magic, count, width, stored = COMPILED_HEADER.unpack_from(data)
+    if magic != COMPILED_MAGIC or width != length or stored != checksum:
+        return None
+    body = data[COMPILED_HEADER_SIZE:].decode('latin-1')
+    if len(body) != count * width:
+        return None
+    return [body[i:i + width] for i in range(0, len(body), width)]
+
+
+def _load_words(length: int):
+    """Load the dictionary for `length`, preferring the compiled format.
+
+    English: A fresh 'words_N.bin' is read directly; a missing or stale one
+    (checksum of words_N.txt changed) is regenerated from the text file.
+    Español: Se lee directamente un 'words_N.bin' vigente; si falta o está
+    obsoleto (cambió la suma de control de words_N.txt) se regenera desde el
+    archivo de texto.
+    """
+    checksum = words_checksum(length)
+    if checksum is None:
+        return None
+    words = _load_compiled(length, checksum)
+    if words is not None:
+        return words
+    words = _load_words_file(length)
+    if words:
+        compile_words(length, words, checksum)
+    return words
 
 
 class WordList:
     """Utility methods to work with per-length word lists.
 
     - English: Provides lazy loading of word files (words_5.txt, words_6.txt, etc.)
-      and a small fallback list when files are missing. Public API is length-aware:
+      and a small fallback list when files are missing. Loading is
+      thread-safe and happens once per length. Public API is length-aware:
         - get_random_word(length)
         - is_correct_length(word, length)
         - is_known_word(word, length)
+        - is_valid_prefix(prefix, length) / words_with_prefix(prefix, length)
 
     - Español: Provee carga perezosa de archivos de palabras (words_5.txt,
       words_6.txt, etc.) y una lista de respaldo pequeña cuando faltan archivos.
-      La API pública está basada en la longitud:
+      La carga es segura entre hilos y ocurre una vez por longitud. La API pública está basada en la longitud:
         - get_random_word(length)
         - is_correct_length(word, length)
         - is_known_word(word, length)
+        - is_valid_prefix(prefix, length) / words_with_prefix(prefix, length)
     """
 
     @classmethod
     def _ensure_loaded(cls, length: int):
         """Ensure the words list for `length` is loaded into the cache.
 
-        English: If a words_N.txt file exists it will be loaded; otherwise a
-        small fallback list is used so the game remains functional.
+        English: If a words_N.txt file exists it will be loaded (through its
+        compiled 'words_N.bin' when fresh); otherwise a small fallback list is
+        used so the game remains functional.
 
-        Español: Si existe el archivo words_N.txt se cargará; de lo contrario
-        se usa una lista de respaldo pequeña para que el juego funcione.
+        Español: Si existe el archivo words_N.txt se cargará (a través de su
+        'words_N.bin' compilado si está vigente); de lo contrario se usa una
+        lista de respaldo pequeña para que el juego funcione.
         """
         if length in _words_by_length:
+            if metrics.ENABLED:
+                metrics.DICTIONARY_CACHE_HIT.inc()
             return
-        loaded = _load_words_file(length)
-        if loaded is not None and len(loaded) > 0:
-            _words_by_length[length] = loaded
-            return
+        with _load_lock(length):
+            if length in _words_by_length:
+                # Loaded by another thread while this one waited.
+                # Cargada por otro hilo mientras este esperaba.
+                if metrics.ENABLED:
+                    metrics.DICTIONARY_CACHE_HIT.inc()
+                return
+            cls._load_locked(length)
+
+    @classmethod
+    def _load_locked(cls, length: int):
+        """Load and publish `length`; the caller holds its load lock.
 
-        # Fallback small lists if files missing (examples only).
-        # Listas de respaldo pequeñas si faltan los archivos (ejemplos).
-        if length == 5:
-            _words_by_length[length] = ['apple', 'train', 'coche', 'gatoo', 'perro']
-        elif length == 6:
-            _words_by_length[length] = ['buffer', 'perrer']
-        elif length == 7:
-            _words_by_length[length] = ['puzzled', 'running', 'esperar']
+        Español: Carga y publica `length`; quien llama tiene su candado.
+        """
+        start = None
+        if metrics.ENABLED:
+            metrics.DICTIONARY_CACHE_MISS.inc()
+            start = metrics.clock()
+        loaded = _load_words(length)
+        if loaded is None or len(loaded) == 0:
+            # Fallback small lists if files missing (examples only).
+            # Listas de respaldo pequeñas si faltan los archivos (ejemplos).
+            if length == 5:
+                loaded = ['apple', 'train', 'coche', 'gatoo', 'perro']
+            elif length == 6:
+                loaded = ['buffer', 'perrer']
+            elif length == 7:
+                loaded = ['puzzled', 'running', 'esperar']
+            else:
+                loaded = []
+
+        if BACKEND == 'dawg':
+            loaded = Dawg(loaded)
+            index = loaded
         else:
-            _words_by_length[length] = []
+            index = frozenset(loaded)
+
+        # Publish the set before the list: `length in _words_by_length` is
+        # the "loaded" marker, so readers never see a list without its index.
+        # Publica el set antes que la lista: la lista marca "cargado".
+        _word_sets_by_length[length] = index
+        _words_by_length[length] = loaded
+        if start is not None:
+            metrics.DICTIONARY_LOAD_SECONDS.observe(metrics.clock() - start)
+
+    @classmethod
+    def set_backend(cls, name: str):
+        """Select the dictionary backend ('list' or 'dawg', see `BACKENDS`).
+
+        English: Loaded lengths are dropped when the backend changes and
+        reload on next use.
+        Español: Las longitudes cargadas se descartan si cambia el backend y
+        se recargan al siguiente uso.
+        """
+        global BACKEND
+        if name not in BACKENDS:
+            raise ValueError(f'Unknown dictionary backend {name!r}; expected one of {BACKENDS}')
+        # Hold the guard and every load lock so no load of the old backend
+        # is published after the switch.
+        # Se retienen todos los candados para que ninguna carga del backend
+        # anterior se publique tras el cambio.
+        with _load_locks_guard:
+            locks = [_load_locks[length] for length in sorted(_load_locks)]
+            for lock in locks:
+                lock.acquire()
+            try:
+                if name != BACKEND:
+                    BACKEND = name
+                    _words_by_length.clear()
+                    _word_sets_by_length.clear()
+            finally:
+                for lock in locks:
+                    lock.release()
+
+    @classmethod
+    def prewarm(cls, *lengths, tries: bool = False):
+        """Load the given lengths in a background daemon thread.
+
+        English: Without lengths, every `available_lengths()` file is
+        preloaded. With `tries`, the prefix graph of each length
+        (`get_trie`) is built there too, so the GUI never builds it on the
+        Tk main thread. Returns the started thread; callers that need the
+        data can `join()` it, everyone else simply benefits from a warm
+        cache. Loading is safe to race with foreground lookups: a length
+        requested while the thread loads it waits for that load instead of
+        repeating it.
+        Español: Devuelve el hilo ya iniciado; quien necesite los datos puede
+        hacer `join()`, el resto simplemente encuentra la caché caliente. Sin
+        longitudes se precargan todos los words_N.txt disponibles; con
+        `tries` también se construye el grafo de prefijos de cada longitud.
+        Es seguro competir con búsquedas en primer plano: quien pide una
+        longitud que se está cargando espera a esa carga en lugar de repetirla.
+        """
+        lengths = lengths or available_lengths()
+
+        def load():
+            for length in lengths:
+                cls._ensure_loaded(length)
+                if tries:
+                    cls.get_trie(length)
+
+        thread = threading.Thread(target=load, name='wordlist-prewarm', daemon=True)
+        thread.start()
+        return thread
 
     @classmethod
     def get_random_word(cls, length: int):
         """Return a random word of the requested length.
 
-        English: Raises ValueError if there are no words available for the
-        requested length.
+        English: Before the list for `length` is loaded, the word is read from
+        the mmap'd compiled dictionary (`word_index`) without loading it.
+        Raises ValueError if there are no words available for the requested
+        length.
 
-        Español: Lanza ValueError si no hay palabras disponibles para la
-        longitud solicitada.
+        Español: Antes de cargar la lista de `length`, la palabra se lee del
+        diccionario compilado mapeado (`word_index`) sin cargarlo. Lanza
+        ValueError si no hay palabras disponibles para la longitud solicitada.
         """
-        cls._ensure_loaded(length)
-        words = _words_by_length.get(length, [])
+        words = _words_by_length.get(length)
+        if words is None:
+            # Not loaded yet: pick through the mmap'd index instead of
+            # loading the whole list just for one draw.
+            # Aún no cargada: se elige mediante el índice mmap en lugar de
+            # cargar la lista entera para un único sorteo.
+            import word_index
+            return word_index.random_word(length)
         if not words:
             raise ValueError(f'No words available for length {length}')
         return random.choice(words)
 
     @classmethod
-    def is_correct_length(cls, word: str, length: int):
-        """Return True when the provided word has the expected length.
+    def get_random_words(cls, length: int, count: int):
+        """Return `count` distinct random words of the requested length.
 
-        English: Validates that `word` is a string and its length
-        matches the requested `length`.
-        Español: Valida que word sea una cadena de texto y que su longitud coincida con la length solicitada.
+        English: Like `get_random_word`, reads through the mmap'd index when
+        the list is not loaded. Raises ValueError when fewer than `count`
+        words are available.
+        Español: Como `get_random_word`, lee mediante el índice mmap si la
+        lista no está cargada. Lanza ValueError si hay menos de `count`
+        palabras disponibles.
         """
-        return isinstance(word, str) and len(word) == length
+        words = _words_by_length.get(length)
+        if words is None:
+            import word_index
+            words = word_index._words(length)
+        if len(words) < count:
+            raise ValueError(f'Only {len(words)} words available for length {length}, {count} requested')
+        return [words[i] for i in random.sample(range(len(words)), count)]
 
     @classmethod
-    def is_known_word(cls, word: str, length: int):
-        """Return True when the provided word is in the known words list.
+    def get_trie(cls, length: int) -> Dawg:
+        """Return the prefix graph (`dawg.Dawg`) of the `length` dictionary.
 
-        English: Ensures the list for the requested length is loaded first.
-        Español: Se asegura de cargar la lista para la longitud solicitada.
+        English: With the 'dawg' backend this is the loaded dictionary
+        itself; with 'list' it is built once per loaded list.
+        Español: Con el backend 'dawg' es el propio diccionario cargado; con
+        'list' se construye una vez por lista cargada.
         """
         cls._ensure_loaded(length)
-        return word in _words_by_length.get(length, [])
+        words = _words_by_length[length]
+        if isinstance(words, Dawg):
+            return words
+        cached = _tries_by_length.get(length)
+        if cached is None or cached[0] is not words:
+            # Two racing builders only waste work: both graphs are equal and
+            # the tuple is published in one assignment.
+            # Dos constructores en paralelo sólo repiten trabajo: ambos grafos
+            # son iguales y la tupla se publica en una sola asignación.
+            cached = _tries_by_length[length] = (words, Dawg(words))
+        return cached[1]
 
+    @classmethod
+    def ready_trie(cls, length: int):
+        """Return the prefix graph of `length` if it is already built, else None.
 
+        English: Never loads or builds anything, so it is safe on the Tk
+        main thread; `prewarm(..., tries=True)` builds it in the background.
+        Español: Nunca carga ni construye nada, así que es seguro en el hilo
+        principal de Tk; `prewarm(..., tries=True)` lo construye en segundo plano.
+        """
+        words = _words_by_length.get(length)
+        if words is None or isinstance(words, Dawg):
+            return words
+        cached = _tries_by_length.get(length)
+        if cached is None or cached[0] is not words:
+            return None
+        return cached[1]
 
-        
-        
+    @classmethod
+    def is_valid_prefix(cls, prefix: str, length: int) -> bool:
+        """Return True when some word of `length` starts with `prefix`.
 
+        Español: Devuelve True si alguna palabra de `length` empieza por `prefix`.
+        """
+        return cls.get_trie(length).has_prefix(prefix.lower())
 
+    @classmethod
+    def words_with_prefix(cls, prefix: str, length: int, limit: int = None):
+        """Words of `length` starting with `prefix`, sorted (at most `limit`).
 
+        Español: Palabras de `length` que empiezan por `prefix`, en orden.
+        """
+        return cls.get_trie(length).with_prefix(prefix.lower(), limit)
 
+    @classmethod
+    def is_correct_length(cls, word: str, length: int):
+        """Return True when the provided word has the expected length.
 
+        English: Validates that `word` is a string and its length
+        matches the requested `length`.
+        Español: Valida que word sea una cadena de texto y que su longitud coincida con la length solicitada.
+        """
+        return isinstance(word, str) and len(word) == length
 
+    @classmethod
+    def is_known_word(cls, word: str, length: int):
+        """Return True when the provided word is in the known words list.
 
+        English: Ensures the list for the requested length is loaded first and
+        answers through the per-length frozenset index (constant time).
+        Español: Se asegura de cargar la lista para la longitud solicitada y
+        responde mediante el índice frozenset por longitud (tiempo constante).
+        """
+        if not metrics.ENABLED:
+            cls._ensure_loaded(length)
+            return word in _word_sets_by_length.get(length, ())
+        start = metrics.clock()
+        cls._ensure_loaded(length)
+        known = word in _word_sets_by_length.get(length, ())
+        metrics.KNOWN_WORD_SECONDS.observe(metrics.clock() - start)
+        return known
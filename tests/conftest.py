@@ -0,0 +1,77 @@
+"""Shared pytest fixtures.
+
+English: The game modules live flat in `src/` and import each other by
+name, so `src/` is put on `sys.path` here. The `dictionary` fixture points
+`word_list.MODULE_DIR` at a temporary directory and swaps every per-length
+cache for an empty one, so tests never read or write the shipped
+words_N.txt files or their sidecars.
+
+Español: Los módulos del juego están en `src/` y se importan por nombre,
+así que aquí se añade `src/` a `sys.path`. El fixture `dictionary` apunta
+`word_list.MODULE_DIR` a un directorio temporal y sustituye cada caché por
+longitud por una vacía, así las pruebas nunca tocan los words_N.txt reales.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import candidates  # noqa: E402
+import decision_tree  # noqa: E402
+import metrics  # noqa: E402
+import patterns  # noqa: E402
+import scoring  # noqa: E402
+import word_index  # noqa: E402
+import word_list  # noqa: E402
+
+# Module-level caches keyed by word length.
+# Cachés de módulo indexadas por longitud de palabra.
+CACHES = (
+    (word_list, '_words_by_length'),
+    (word_list, '_word_sets_by_length'),
+    (word_list, '_load_locks'),
+    (word_list, '_tries_by_length'),
+    (word_index, '_indexes'),
+    (candidates, '_indexes'),
+    (patterns, '_matrices'),
+    (scoring, '_encoded_by_length'),
+    (decision_tree, '_trees'),
+    (decision_tree, '_misses'),
+)
+
+
+@pytest.fixture
+def dictionary(tmp_path, monkeypatch):
+    """Isolated dictionary directory; call it as `dictionary(length, words)`.
+
+    Español: Directorio de diccionario aislado; se llama `dictionary(length, words)`.
+    """
+    monkeypatch.setattr(word_list, 'MODULE_DIR', str(tmp_path))
+    monkeypatch.setattr(word_list, 'BACKEND', 'list')
+    for module, name in CACHES:
+        monkeypatch.setattr(module, name, {})
+
+    def write(length, words):
+        with open(word_list.words_path(length), 'w', encoding='utf-8') as f:
+            f.writelines(w + '\n' for w in words)
+        return word_list.words_path(length)
+
+    yield write
+    for _, index in word_index._indexes.values():
+        if index is not None:
+            index.close()
+
+
+@pytest.fixture
+def enabled_metrics():
+    """Metrics enabled and zeroed for one test, disabled afterwards.
+
+    Español: Métricas activadas y a cero durante una prueba.
+    """
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.disable()
+    metrics.reset()
@@ -0,0 +1,73 @@
+"""`CandidateIndex.constrain` keeps exactly the secrets a brute-force `score_pair` filter keeps.
+
+Español: `constrain` conserva exactamente los secretos que conserva un filtro por fuerza bruta con `score_pair`.
+"""
+import random
+
+from candidates import CandidateIndex
+from encoding import AMARILLO, ROJO, VERDE, score_pair
+
+# A four-letter alphabet makes repeated letters the common case.
+# Con cuatro letras, las letras repetidas son lo habitual.
+LETTERS = 'abcd'
+
+
+def sample(seed, count, length=5):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(LETTERS) for _ in range(length)) for _ in range(count)]
+
+
+def brute_force(words, history):
+    return [w for w in words if all(score_pair(g, w) == p for g, p in history)]
+
+
+def pattern_of(*codes):
+    return sum(code * 3 ** i for i, code in enumerate(codes))
+
+
+def test_one_guess_matches_brute_force():
+    words = sorted(set(sample(1, 400)))
+    index = CandidateIndex(words, 5)
+    # Secrets outside the index too: any pattern that can occur must filter exactly.
+    # También secretos fuera del índice: todo patrón posible debe filtrar exactamente.
+    for guess in sample(2, 60) + ['aaaaa', 'aabba', 'abcda']:
+        for secret in sample(3, 15):
+            pattern = score_pair(guess, secret)
+            kept = index.words_in(index.constrain(index.all_mask, guess, pattern))
+            assert kept == brute_force(words, [(guess, pattern)]), (guess, secret)
+
+
+def test_guess_sequences_match_brute_force():
+    words = sorted(set(sample(4, 600, 6)))
+    index = CandidateIndex(words, 6)
+    rng = random.Random(5)
+    for secret in rng.sample(words, 40):
+        mask, history = index.all_mask, []
+        for guess in sample(rng.random(), 4, 6):
+            history.append((guess, score_pair(guess, secret)))
+            mask = index.constrain(mask, *history[-1])
+            assert index.words_in(mask) == brute_force(words, history)
+            assert index.count(mask) == len(index.words_in(mask))
+        assert secret in index.words_in(mask)
+
+
+def test_repeated_letters():
+    words = ['aabcd', 'abacd', 'abbcd', 'bacda', 'bbacd', 'bcdaa', 'cbadd', 'dcbbb']
+    index = CandidateIndex(words, 5)
+    cases = [
+        # One yellow and one grey 'a': exactly one 'a', not at 0 or 1.
+        # Un 'a' amarillo y otro gris: exactamente una 'a', ni en 0 ni en 1.
+        ('aaxyz', pattern_of(AMARILLO, ROJO, ROJO, ROJO, ROJO), ['bbacd', 'cbadd']),
+        # Green then grey 'a': exactly one 'a', at 0.
+        # 'a' verde y luego gris: exactamente una 'a', en 0.
+        ('aaxyz', pattern_of(VERDE, ROJO, ROJO, ROJO, ROJO), ['abbcd']),
+        # Two yellows: at least two 'a', neither at 0 nor 1.
+        # Dos amarillos: al menos dos 'a', ni en 0 ni en 1.
+        ('aaxyz', pattern_of(AMARILLO, AMARILLO, ROJO, ROJO, ROJO), ['bcdaa']),
+        # Grey 'd' repeated after a green one: exactly one 'd', at 4.
+        # 'd' gris repetida tras una verde: exactamente una 'd', en 4.
+        ('ddxyd', pattern_of(ROJO, ROJO, ROJO, ROJO, VERDE), ['aabcd', 'abacd', 'abbcd', 'bbacd']),
+    ]
+    for guess, pattern, expected in cases:
+        assert brute_force(words, [(guess, pattern)]) == expected
+        assert index.words_in(index.constrain(index.all_mask, guess, pattern)) == expected
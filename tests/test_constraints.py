@@ -0,0 +1,92 @@
+"""Hard-mode `Constraints` against brute-force references built on `score_pair`.
+
+Español: `Constraints` del modo difícil frente a referencias por fuerza bruta con `score_pair`.
+"""
+import random
+
+from candidates import CandidateIndex
+from constraints import Constraints
+from encoding import AMARILLO, ROJO, VERDE, score_pair
+
+# A four-letter alphabet makes repeated letters the common case.
+# Con cuatro letras, las letras repetidas son lo habitual.
+LETTERS = 'abcd'
+
+
+def sample(seed, count, length=5):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(LETTERS) for _ in range(length)) for _ in range(count)]
+
+
+def hard_mode_ok(word, history):
+    """Rule checked guess by guess: greens in place, revealed copies reused.
+
+    Español: Regla comprobada intento a intento: verdes en su sitio, copias reveladas reutilizadas.
+    """
+    for guess, pattern in history:
+        revealed = {}
+        for pos, ch in enumerate(guess):
+            pattern, code = divmod(pattern, 3)
+            if code == VERDE and word[pos] != ch:
+                return False
+            if code != ROJO:
+                revealed[ch] = revealed.get(ch, 0) + 1
+        if any(word.count(ch) < n for ch, n in revealed.items()):
+            return False
+    return True
+
+
+def play(secret, guesses):
+    constraints = Constraints(len(secret))
+    history = []
+    for guess in guesses:
+        history.append((guess, score_pair(guess, secret)))
+        constraints.update(*history[-1])
+    return constraints, history
+
+
+def test_violation_and_masks_match_brute_force():
+    words = sorted(set(sample(1, 500)))
+    index = CandidateIndex(words, 5)
+    rng = random.Random(2)
+    for _ in range(60):
+        secret = rng.choice(words)
+        for turns in range(1, 5):
+            constraints, history = play(secret, sample(rng.random(), turns))
+            legal = [w for w in words if hard_mode_ok(w, history)]
+            possible = [w for w in words if all(score_pair(g, w) == p for g, p in history)]
+            assert [w for w in words if constraints.violation(w) is None] == legal
+            assert index.words_in(constraints.mask(index)) == legal
+            assert index.words_in(constraints.mask(index, strict=True)) == possible
+            # The secret itself is always a legal guess.
+            # El propio secreto siempre es un intento legal.
+            assert constraints.violation(secret) is None
+
+
+def test_yellow_and_grey_of_the_same_letter():
+    # 'aaxyz' against 'bbacd': the first 'a' is yellow, the second grey.
+    # 'aaxyz' contra 'bbacd': la primera 'a' es amarilla, la segunda gris.
+    constraints, history = play('bbacd', ['aaxyz'])
+    assert history[0][1] == AMARILLO
+    assert constraints.min_counts == {'a': 1}
+    assert constraints.max_counts == {'a': 1, 'x': 0, 'y': 0, 'z': 0}
+    assert constraints.violation('bcdbc') == 'El intento debe usar A'
+    # Hard mode only asks for the 'a'; a second one or an excluded letter is fine.
+    # El modo difícil sólo exige la 'a'; otra más o una letra excluida se admiten.
+    assert constraints.violation('aaxxa') is None
+    index = CandidateIndex(['aaxxa', 'bbacd', 'cbadd', 'dcbbb', 'dabcd'], 5)
+    assert index.words_in(constraints.mask(index)) == ['aaxxa', 'bbacd', 'cbadd', 'dabcd']
+    assert index.words_in(constraints.mask(index, strict=True)) == ['bbacd', 'cbadd']
+
+
+def test_green_and_repeated_counts():
+    # Against 'abbba': 'bbcda' shows b yellow, b green, a green; 'bbbab'
+    # then shows three b (one grey) and greens at 1 and 2.
+    # Contra 'abbba': 'bbcda' y luego 'bbbab' revelan tres b (una gris).
+    constraints, _ = play('abbba', ['bbcda', 'bbbab'])
+    assert constraints.fixed == [None, 'b', 'b', None, 'a']
+    assert constraints.min_counts == {'a': 1, 'b': 3}
+    assert constraints.max_counts == {'b': 3, 'c': 0, 'd': 0}
+    assert constraints.violation('abbca') == 'El intento debe usar B 3 veces'
+    assert constraints.violation('abbbc') == 'La letra 5 debe ser A'
+    assert constraints.violation('bbbba') is None
@@ -0,0 +1,85 @@
+"""The DAWG backend answers exactly like the list+set backend.
+
+Español: El backend DAWG responde exactamente igual que el backend lista+conjunto.
+"""
+import random
+
+import pytest
+
+import word_list
+from dawg import Dawg
+from word_list import WordList
+
+ALPHABET = 'abcdeñ'
+
+
+def sample(seed, count, length):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(ALPHABET) for _ in range(length)) for _ in range(count)]
+
+
+@pytest.mark.parametrize('words', [
+    [],
+    ['casas'],
+    ['perro', 'casas', 'gatos', 'casas'],  # unsorted, with a duplicate / desordenada, con un duplicado
+    sample(1, 500, 4),
+    sample(2, 2000, 6),
+])
+def test_dawg_matches_list_and_set(words):
+    dawg = Dawg(words)
+    distinct = sorted(set(words))
+    assert len(dawg) == len(words)
+    assert list(dawg) == words
+    assert [dawg[i] for i in range(len(words))] == words
+    if words:
+        assert dawg[-1] == words[-1]
+    for bad in (len(words), -len(words) - 1):
+        with pytest.raises(IndexError):
+            dawg[bad]
+    assert [dawg.word_at_rank(r) for r in range(len(distinct))] == distinct
+    with pytest.raises(IndexError):
+        dawg.word_at_rank(len(distinct))
+
+    rng = random.Random(len(words))
+    probes = distinct[:50] + sample(3, 200, len(words[0]) if words else 5) + ['', 'zzz', 'casa', 'casass']
+    for word in probes:
+        assert (word in dawg) == (word in set(words)), word
+    assert 5 not in dawg
+
+    prefixes = {w[:k] for w in rng.sample(distinct, min(len(distinct), 30)) for k in range(len(w) + 1)}
+    prefixes |= {'', 'ñ', 'zz', 'aaaaaaaaa'}
+    for prefix in prefixes:
+        expected = [w for w in distinct if w.startswith(prefix)]
+        assert dawg.with_prefix(prefix) == expected, prefix
+        assert dawg.with_prefix(prefix, 3) == expected[:3]
+        assert dawg.has_prefix(prefix) == bool(expected)
+        assert dawg.count_prefix(prefix) == len(expected)
+
+
+def test_both_backends_serve_the_same_dictionary(dictionary, monkeypatch):
+    words = sample(4, 300, 5)
+    dictionary(5, words)
+    answers = {}
+    for backend in ('list', 'dawg'):
+        monkeypatch.setattr(word_list, 'BACKEND', backend)
+        word_list._words_by_length.clear()
+        word_list._word_sets_by_length.clear()
+        WordList._ensure_loaded(5)
+        answers[backend] = (
+            list(word_list._words_by_length[5]),
+            [WordList.is_known_word(w, 5) for w in words[:40] + sample(5, 40, 5)],
+            [WordList.words_with_prefix(p, 5) for p in ('', 'a', 'ñb', 'cd', 'zz')],
+            [WordList.is_valid_prefix(p, 5) for p in ('A', 'ñ', 'eee', 'z')],
+        )
+    assert answers['list'] == answers['dawg']
+
+
+def test_ready_trie_never_builds_on_the_caller(dictionary):
+    dictionary(5, sample(6, 300, 5))
+    assert WordList.ready_trie(5) is None  # not loaded / sin cargar
+    WordList._ensure_loaded(5)
+    assert WordList.ready_trie(5) is None  # loaded, graph not built / sin grafo
+    WordList.prewarm(5, tries=True).join()
+    trie = WordList.ready_trie(5)
+    assert trie is WordList.get_trie(5)
+    assert list(trie) == word_list._words_by_length[5]
@@ -0,0 +1,165 @@
+"""Decision trees: optimal, complete, and rebuilt when stale or corrupt.
+
+Español: Árboles de decisión: óptimos, completos y regenerados si están obsoletos o dañados.
+"""
+import os
+import random
+
+import pytest
+
+import decision_tree
+import word_list
+from encoding import score_pair, winning_pattern
+
+LETTERS = 'aeiorst'
+
+
+def synthetic(count, seed=0):
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add(''.join(rng.choice(LETTERS) for _ in range(5)))
+    return sorted(words)
+
+
+WORDS = synthetic(20)
+
+
+class Row:
+    """Minimal history entry (`.word`, `.pattern`) / Entrada mínima del historial."""
+
+    def __init__(self, word, pattern):
+        self.word = word
+        self.pattern = pattern
+
+
+def brute_force_total(words):
+    """Fewest total guesses over all secrets, trying every guess everywhere.
+
+    Español: Mínimo total de intentos sobre todos los secretos, probando todo.
+    """
+    win = winning_pattern(5)
+    memo = {}
+
+    def best(secrets):
+        if not secrets:
+            return 0
+        if secrets in memo:
+            return memo[secrets]
+        result = float('inf')
+        for guess in words:
+            buckets = {}
+            for secret in secrets:
+                buckets.setdefault(score_pair(guess, secret), []).append(secret)
+            if len(buckets) == 1 and win not in buckets:
+                continue  # no progress / no avanza
+            result = min(result, len(secrets) + sum(
+                best(frozenset(b)) for p, b in buckets.items() if p != win))
+        memo[secrets] = result
+        return result
+
+    return best(frozenset(words))
+
+
+@pytest.fixture
+def words(dictionary):
+    dictionary(5, WORDS)
+    return WORDS
+
+
+def reload_words():
+    """Drop the loaded list so the next call rereads words_5.txt.
+
+    Español: Descarta la lista cargada para releer words_5.txt.
+    """
+    word_list._words_by_length.pop(5, None)
+    word_list._word_sets_by_length.pop(5, None)
+
+
+def test_tree_wins_every_secret(words):
+    tree, total = decision_tree.solve_tree(5)
+    counts = decision_tree.evaluate(tree)
+    assert sum(counts.values()) == len(words)
+    assert sum(k * v for k, v in counts.items()) == total
+    for secret in words:
+        history = []
+        node = 0
+        while tree.guess_at(node) != secret:
+            guess = tree.guess_at(node)
+            history.append((guess, score_pair(guess, secret)))
+            node = tree.step(node, history[-1][1])
+            assert node is not None
+        assert node == tree.walk([Row(w, p) for w, p in history])
+
+
+@pytest.mark.parametrize('seed', (1, 2, 3))
+def test_total_matches_a_brute_force_optimum(dictionary, seed):
+    tiny = synthetic(8, seed)
+    dictionary(5, tiny)
+    _, total = decision_tree.solve_tree(5)
+    assert total == brute_force_total(tiny)
+
+
+def test_load_tree_without_build_returns_none(words, monkeypatch):
+    assert decision_tree.load_tree(5, build=False) is None
+    assert not os.path.exists(decision_tree.tree_path(5))
+    # The miss is remembered until a file changes: no rehash per call.
+    # El fallo se recuerda hasta que cambie un archivo: no se recalcula la suma.
+    calls = []
+    checksum = word_list.words_checksum
+    monkeypatch.setattr(word_list, 'words_checksum', lambda n: calls.append(n) or checksum(n))
+    assert decision_tree.load_tree(5, build=False) is None
+    assert calls == []
+
+
+def test_build_then_load(words):
+    built = decision_tree.load_tree(5)
+    assert os.path.exists(decision_tree.tree_path(5))
+    decision_tree._trees.clear()
+    loaded = decision_tree.load_tree(5, build=False)
+    assert loaded is not None and loaded is not built
+    for name in ('guess', 'first', 'pattern', 'child'):
+        assert list(getattr(loaded, name)) == list(getattr(built, name))
+
+
+@pytest.mark.parametrize('damage', ('truncate', 'magic', 'child', 'garbage'))
+def test_corrupt_tree_is_ignored_then_rebuilt(words, damage):
+    expected = decision_tree.load_tree(5)
+    path = decision_tree.tree_path(5)
+    data = bytearray(open(path, 'rb').read())
+    if damage == 'truncate':
+        data = data[:len(data) - 3]
+    elif damage == 'magic':
+        data[:8] = b'NOTATREE'
+    elif damage == 'child':
+        data[-4:] = (10 ** 6).to_bytes(4, 'little')  # last child out of range
+    else:
+        data = data[:decision_tree.HEADER_SIZE] + b'\xff' * (len(data) - decision_tree.HEADER_SIZE)
+    with open(path, 'wb') as f:
+        f.write(data)
+    decision_tree._trees.clear()
+    decision_tree._misses.clear()
+
+    assert decision_tree.load_tree(5, build=False) is None
+    rebuilt = decision_tree.load_tree(5)
+    assert list(rebuilt.guess) == list(expected.guess)
+    assert sum(decision_tree.evaluate(rebuilt).values()) == len(words)
+
+
+def test_rebuilt_when_the_dictionary_changes(dictionary, words):
+    decision_tree.load_tree(5)
+    path = decision_tree.tree_path(5)
+    old_checksum = decision_tree._read_header(path)[5]
+
+    # Same size, one word replaced: only the checksum tells them apart.
+    # Mismo tamaño, una palabra cambiada: sólo la suma de control lo distingue.
+    changed = words[:-1] + ['zzzzz']
+    dictionary(5, changed)
+    reload_words()
+    assert decision_tree.load_tree(5, build=False) is None
+
+    tree = decision_tree.load_tree(5)
+    assert decision_tree._read_header(path)[5] == word_list.words_checksum(5) != old_checksum
+    assert list(tree.words) == changed
+    assert sum(decision_tree.evaluate(tree).values()) == len(changed)
+    assert decision_tree.load_tree(5, build=False) is tree
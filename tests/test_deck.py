@@ -0,0 +1,105 @@
+"""Shuffled decks: full cycles without repeats and persisted positions.
+
+Español: Mazos barajados: ciclos completos sin repeticiones y posiciones persistidas.
+"""
+import pytest
+
+import deck
+from deck import Deck, DeckStore
+
+# Powers of four fill the Feistel domain exactly; the others need cycle walking.
+# Las potencias de cuatro llenan el dominio; las demás recorren ciclos.
+SIZES = (1, 2, 3, 4, 5, 16, 17, 63, 64, 65, 100, 1000, 4097)
+
+
+@pytest.mark.parametrize('count', SIZES)
+def test_every_cycle_is_a_permutation(count):
+    d = Deck(count, seed=count * 7919)
+    for cycle in range(3):
+        assert d.cycle == cycle and d.cursor == 0
+        dealt = [d.draw() for _ in range(count)]
+        assert sorted(dealt) == list(range(count))
+
+
+def test_many_draws_never_repeat_within_a_cycle():
+    count = 37
+    d = Deck(count, seed=1)
+    orders = set()
+    for _ in range(2000):
+        dealt = [d.draw() for _ in range(count)]
+        assert len(set(dealt)) == count and max(dealt) < count
+        orders.add(tuple(dealt))
+    # Each cycle reshuffles. / Cada ciclo baraja de nuevo.
+    assert len(orders) > 1900
+
+
+def test_cycle_walking_stays_in_range():
+    count = 17  # domain 4 ** 3 = 64
+    d = Deck(count, seed=3)
+    assert (1 << 2 * d._half) > count
+    assert sorted(d.position(c) for c in range(count)) == list(range(count))
+
+
+def test_same_seed_same_order_other_seed_differs():
+    a, b, c = Deck(500, seed=42), Deck(500, seed=42), Deck(500, seed=43)
+    first = [a.draw() for _ in range(500)]
+    assert first == [b.draw() for _ in range(500)]
+    assert first != [c.draw() for _ in range(500)]
+    assert first != list(range(500))
+
+
+def test_remaining_and_empty_deck():
+    d = Deck(10, seed=0)
+    for _ in range(4):
+        d.draw()
+    assert d.remaining() == 6
+    with pytest.raises(ValueError):
+        Deck(0, seed=0)
+
+
+def test_store_round_trip_keeps_positions(tmp_path):
+    count = 50
+    players = [f'player-{i}' for i in range(20)] + ['ñandú', 'x' * 300]
+    path = str(tmp_path / 'decks.bin')
+
+    straight = DeckStore(5, seed=9, count=count)
+    expected = {p: [straight.draw(p) for _ in range(120)] for p in players}
+
+    store = DeckStore(5, seed=9, count=count)
+    got = {p: [store.draw(p) for _ in range(1 + i * 5 % 97)] for i, p in enumerate(players)}
+    store.save(path)
+    restored = DeckStore.load(path, count=count)
+    assert restored.length == 5 and restored.seed == 9
+    for p in players:
+        saved, loaded = store.deck(p), restored.deck(p)
+        assert (loaded.seed, loaded.cycle, loaded.cursor) == (saved.seed, saved.cycle, saved.cursor)
+        got[p] += [restored.draw(p) for _ in range(120 - len(got[p]))]
+    assert got == expected
+    assert (tmp_path / 'decks.bin').stat().st_size == deck.HEADER.size + len(players) * deck.RECORD.size
+
+
+def test_store_load_with_new_dictionary_size_starts_new_cycle(tmp_path):
+    path = str(tmp_path / 'decks.bin')
+    store = DeckStore(5, seed=1, count=30)
+    for _ in range(12):
+        store.draw('ana')
+    store.save(path)
+    restored = DeckStore.load(path, count=31)
+    d = restored.deck('ana')
+    assert (d.count, d.cycle, d.cursor) == (31, 1, 0)
+    assert sorted(restored.draw('ana') for _ in range(31)) == list(range(31))
+
+
+def test_store_load_rejects_other_files(tmp_path):
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        DeckStore.load(str(path), count=10)
+
+
+def test_draw_word_covers_the_dictionary(dictionary):
+    words = [f'{a}{b}ema' for a in 'abcde' for b in 'fghij']
+    dictionary(5, words)
+    store = DeckStore(5, seed=2)
+    assert store.count == len(words)
+    assert sorted(store.draw_word('ana') for _ in words) == sorted(words)
@@ -0,0 +1,138 @@
+"""Streaming ingestion: chunk boundaries, over-long tokens, bounded merges and memory.
+
+Español: Ingesta en streaming: límites de bloque, tokens largos, mezclas acotadas y memoria.
+"""
+import io
+import os
+import random
+import re
+import string
+import subprocess
+import sys
+
+import pytest
+
+import ingest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+# Peak RSS an ingestion may add on top of the interpreter, well below the
+# size of the corpus it reads (the whole corpus never sits in memory).
+# Pico de RSS que puede añadir una ingesta, muy por debajo del corpus leído.
+RSS_GROWTH_LIMIT_MB = 6
+CORPUS_MB = 12
+
+
+def reference_tokens(text, max_token):
+    return [t for t in (m.lower() for m in re.findall(r'[^\W\d_]+', text))
+            if len(t) <= max_token and ingest.ALLOWED.issuperset(t)]
+
+
+@pytest.mark.parametrize('chunk_size', (1, 2, 3, 5, 7, 64))
+def test_tokens_split_across_chunks(chunk_size):
+    # Multi-byte letters land on chunk boundaries at these sizes.
+    # Las letras multibyte caen en los límites de bloque con estos tamaños.
+    text = 'Ñandu corre_por la  CIUDAD2024 año\ncañon,pingüino... x' + 'a' * 40 + ' fin pájaro ñoño'
+    got = list(ingest.iter_tokens(io.BytesIO(text.encode('utf-8')), chunk_size, max_token=10))
+    assert got == reference_tokens(text, 10)
+    # Letters outside ALPHABET drop the whole token (pingüino, pájaro).
+    # Las letras fuera de ALPHABET descartan el token entero.
+    assert got == ['ñandu', 'corre', 'por', 'la', 'ciudad', 'año', 'cañon', 'fin', 'ñoño']
+
+
+@pytest.mark.parametrize('chunk_size', (1, 4, 9, 1000))
+def test_over_long_tokens_are_dropped(chunk_size):
+    rng = random.Random(chunk_size)
+    parts = []
+    for _ in range(400):
+        n = rng.choice((1, 3, 5, 8, 9, 30, 200))
+        parts.append(''.join(rng.choice('abcñé') for _ in range(n)))
+        parts.append(rng.choice((' ', '\n', '7', '--')))
+    parts.append('z' * 5000)  # over-long run at end of input / al final de la entrada
+    text = ''.join(parts)
+    got = list(ingest.iter_tokens(io.BytesIO(text.encode('utf-8')), chunk_size, max_token=8))
+    assert got == reference_tokens(text, 8)
+    assert max(map(len, got)) <= 8
+
+
+def test_carry_stays_bounded_on_a_letters_only_stream():
+    seen = []
+
+    class Stream(io.BytesIO):
+        def read(self, size=-1):
+            data = super().read(size)
+            seen.append(len(data))
+            return data
+
+    text = 'ab ' + 'q' * 100_000 + ' cd'
+    assert list(ingest.iter_tokens(Stream(text.encode()), 1000, max_token=8)) == ['ab', 'cd']
+    assert max(seen) == 1000
+
+
+def test_on_chunk_reports_bytes_read():
+    data = 'uno dos tres cuatro '.encode() * 10
+    progress = []
+    list(ingest.iter_tokens(io.BytesIO(data), 16, on_chunk=progress.append))
+    assert progress == sorted(progress) and progress[-1] == len(data)
+
+
+def test_multi_level_merge_is_bounded_and_exact(tmp_path, monkeypatch):
+    rng = random.Random(0)
+    source = tmp_path / 'corpus.txt'
+    tokens = [''.join(rng.choice('abcdefg') for _ in range(rng.choice((4, 5, 6)))) for _ in range(5000)]
+    source.write_text(' '.join(tokens), encoding='utf-8')
+
+    # 2-word runs with a fan-in of 3 need several intermediate levels.
+    # Series de 2 palabras con abanico 3: varias pasadas intermedias.
+    monkeypatch.setattr(ingest, 'MERGE_FAN_IN', 3)
+    live = []
+    opens = [0, 0]  # run files opened, most open at once / abiertas, máximo a la vez
+
+    def tracking_open(path, *args, **kwargs):
+        f = open(path, *args, **kwargs)
+        if os.path.basename(str(path)).startswith('run'):
+            live[:] = [g for g in live if not g.closed] + [f]
+            opens[0] += 1
+            opens[1] = max(opens[1], len(live))
+        return f
+
+    monkeypatch.setattr(ingest, 'open', tracking_open, raising=False)
+    out = tmp_path / 'out'
+    counts = ingest.ingest(str(source), str(out), lengths=[4, 5, 6], chunk_size=97, max_buffer=2)
+
+    assert opens[1] == 3
+    assert opens[0] > len(set(tokens)) // 2
+    for n in (4, 5, 6):
+        expected = sorted({t for t in tokens if len(t) == n})
+        assert (out / f'words_{n}.txt').read_text(encoding='utf-8').split() == expected
+        assert counts[n] == len(expected)
+    assert sorted(os.listdir(out)) == ['words_4.txt', 'words_5.txt', 'words_6.txt']
+
+
+def test_peak_rss_does_not_grow_with_the_corpus(tmp_path):
+    rng = random.Random(1)
+    vocab = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10)))
+             for _ in range(50_000)]
+    source = tmp_path / 'corpus.txt'
+    with open(source, 'w', encoding='utf-8') as f:
+        written = 0
+        while written < CORPUS_MB * 1e6:
+            line = ' '.join(rng.choices(vocab, k=2000)) + '.\n'
+            f.write(line)
+            written += len(line)
+    script = (
+        'import sys; sys.path.insert(0, sys.argv[1]); import ingest\n'
+        'def hwm():\n'
+        '    with open("/proc/self/status") as f:\n'
+        '        return next(int(l.split()[1]) for l in f if l.startswith("VmHWM"))\n'
+        'base = hwm()\n'
+        'counts = ingest.ingest(sys.argv[2], sys.argv[3], [5, 6, 7], chunk_size=1 << 16, max_buffer=2000)\n'
+        'print(hwm() - base, sum(counts.values()))\n'
+    )
+    if not os.path.exists('/proc/self/status'):
+        pytest.skip('needs /proc to read the peak RSS')
+    result = subprocess.run([sys.executable, '-c', script, SRC, str(source), str(tmp_path / 'out')],
+                            capture_output=True, text=True, check=True)
+    growth_kb, words = map(int, result.stdout.split())
+    assert words == len({w for w in vocab if len(w) in (5, 6, 7)})
+    assert growth_kb / 1024 < RSS_GROWTH_LIMIT_MB
@@ -0,0 +1,85 @@
+"""Counters and histograms seen through `render_text` / `render_prometheus`.
+
+Español: Contadores e histogramas vistos a través de las exportaciones.
+"""
+import metrics
+from game import Game, check_words
+from word_list import WordList
+
+WORDS = ['casas', 'perro', 'gatos', 'mesas', 'libro']
+
+
+def exposition():
+    """Prometheus samples as {'name{labels}': value}.
+
+    Español: Muestras de Prometheus como {'nombre{etiquetas}': valor}.
+    """
+    samples = {}
+    for line in metrics.render_prometheus().splitlines():
+        if line and not line.startswith('#'):
+            key, value = line.rsplit(' ', 1)
+            samples[key] = float(value)
+    return samples
+
+
+def test_check_word_outcomes(dictionary, enabled_metrics):
+    dictionary(5, WORDS)
+    game = Game('casas', length=5, intentos=6)
+    game.check_word('gato')    # invalid length
+    game.check_word(42)        # not a string
+    game.check_word('zzzzz')   # unknown
+    game.check_word('perro')
+    game.check_word('casas')
+
+    samples = exposition()
+    assert samples['wordle_guesses_total{result="invalid"}'] == 2
+    assert samples['wordle_guesses_total{result="unknown"}'] == 1
+    assert samples['wordle_guesses_total{result="scored"}'] == 2
+    assert samples['wordle_guesses_total{result="rejected"}'] == 0
+    assert samples['wordle_check_word_seconds_count'] == 2
+    assert samples['wordle_score_seconds_count'] == 2
+    # Invalid guesses never reach the dictionary.
+    # Las suposiciones inválidas nunca llegan al diccionario.
+    assert samples['wordle_known_word_seconds_count'] == 3
+    assert samples['wordle_check_word_seconds_bucket{le="+Inf"}'] == 2
+
+    text = metrics.render_text()
+    assert 'wordle_guesses_total{result="scored"} 2' in text
+    assert 'wordle_check_word_seconds count=2' in text
+
+
+def test_is_known_word_cache_hit_rate(dictionary, enabled_metrics):
+    dictionary(5, WORDS)
+    for word in ('casas', 'zzzzz', 'libro', 'perro'):
+        WordList.is_known_word(word, 5)
+
+    samples = exposition()
+    assert samples['wordle_known_word_seconds_count'] == 4
+    assert samples['wordle_dictionary_cache_total{result="miss"}'] == 1
+    assert samples['wordle_dictionary_cache_total{result="hit"}'] == 3
+    assert samples['wordle_dictionary_load_seconds_count'] == 1
+    assert 'wordle_dictionary_cache_total hit_rate=75.0% (3/4)' in metrics.render_text()
+
+
+def test_check_words_counts_batched_guesses(dictionary, enabled_metrics):
+    dictionary(5, WORDS)
+    games = [Game(secret, length=5, intentos=6) for secret in WORDS]
+    results = check_words([(games[0], 'perro'), (games[1], 'perro'), (games[2], 'zzzzz'),
+                           (games[3], 'gato'), (games[4], None)])
+    assert [r[2] for r in results] == [True, True, False, False, False]
+
+    samples = exposition()
+    assert samples['wordle_guesses_total{result="scored"}'] == 2
+    assert samples['wordle_guesses_total{result="unknown"}'] == 1
+    assert samples['wordle_guesses_total{result="invalid"}'] == 2
+    assert samples['wordle_check_words_seconds_count'] == 1
+
+
+def test_disabled_records_nothing(dictionary):
+    metrics.reset()
+    dictionary(5, WORDS)
+    game = Game('casas', length=5, intentos=6)
+    game.check_word('perro')
+    check_words([(game, 'gatos')])
+    assert all(value == 0 for value in exposition().values())
+    assert metrics.render_text() == '\n'
@@ -0,0 +1,43 @@
+"""Multi-board games and their command-line validation.
+
+Español: Partidas de varios tableros y su validación en la línea de órdenes.
+"""
+import pytest
+
+import main
+from game import Game, MultiGame
+
+WORDS = ['casas', 'perro', 'gatos', 'mesas', 'libro', 'zorro']
+
+
+def test_every_board_scores_like_a_single_game(dictionary):
+    dictionary(5, WORDS)
+    secrets = ['casas', 'perro', 'gatos']
+    multi = MultiGame(secrets, length=5)
+    singles = [Game(s, length=5, intentos=multi.get_intentos_restantes()) for s in secrets]
+    assert multi.get_intentos_restantes() == 8
+    for guess in ('mesas', 'perro', 'zorro'):
+        resultados, _, is_known, _ = multi.check_word(guess)
+        assert is_known
+        for board, (single, row) in enumerate(zip(singles, resultados)):
+            if row is not None:
+                assert row == single.check_word(guess)[0]
+                assert multi.get_historial(board)[-1] == row
+    assert multi.get_resueltos() == [False, True, False]
+    assert multi.get_palabras_secretas() == secrets
+
+
+@pytest.mark.parametrize('tableros', (0, -2))
+def test_at_least_one_board(dictionary, tableros):
+    dictionary(5, WORDS)
+    with pytest.raises(ValueError, match='at least one board'):
+        MultiGame(length=5, tableros=tableros)
+    with pytest.raises(ValueError, match='at least one board'):
+        MultiGame([], length=5)
+
+
+@pytest.mark.parametrize('value', ('0', '-2'))
+def test_boards_option_rejects_non_positive_counts(value):
+    with pytest.raises(SystemExit):
+        main.parse_args(['--cli', '--boards', value])
+    assert main.parse_args(['--cli', '--boards', '3']).boards == 3
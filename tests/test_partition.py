@@ -0,0 +1,105 @@
+"""Bucketed partitions and the adversarial mode built on them.
+
+Español: Particiones por buckets y el modo adversario construido sobre ellas.
+"""
+import random
+
+import pytest
+
+import partition
+from encoding import AMARILLO, VERDE, score_pair, winning_pattern
+from game import AdversarialGame
+
+
+@pytest.fixture(params=('numpy', 'pure'))
+def engine(request, monkeypatch):
+    """Run each test with NumPy and with the pure-Python fallback.
+
+    Español: Cada prueba corre con NumPy y con la alternativa en Python puro.
+    """
+    if request.param == 'pure':
+        monkeypatch.setattr(partition, 'np', None)
+    return request.param
+
+
+def rows_of(rows):
+    return [int(r) for r in rows]
+
+
+def subset(rows):
+    """Rows in the form the active engine expects / Filas en la forma del motor."""
+    return rows if partition.np is None else partition.np.array(rows, dtype=partition.np.intp)
+
+
+def weight(pattern):
+    """(greens, yellows) of a pattern, decoded digit by digit.
+
+    Español: (verdes, amarillos) de un patrón, dígito a dígito.
+    """
+    digits = []
+    while pattern:
+        pattern, code = divmod(pattern, 3)
+        digits.append(code)
+    return digits.count(VERDE), digits.count(AMARILLO)
+
+
+def test_tie_goes_to_the_least_informative_pattern(dictionary, engine):
+    # 'axxxx' gets one green from 'abcde', 'xaxxx' one yellow, 'xxxxx' none:
+    # three buckets of one, so the all-grey one wins.
+    # Tres buckets de uno: gana el todo gris.
+    dictionary(5, ['axxxx', 'xaxxx', 'xxxxx'])
+    pattern, rows = partition.largest_bucket('abcde', None, 5)
+    assert pattern == 0 and rows_of(rows) == [2]
+    # Without it, one yellow beats one green.
+    # Sin él, un amarillo gana a un verde.
+    pattern, rows = partition.largest_bucket('abcde', subset([0, 1]), 5)
+    assert weight(pattern) == (0, 1) and rows_of(rows) == [1]
+
+
+def test_size_beats_information(dictionary, engine):
+    dictionary(5, ['abcdf', 'abcdg', 'xxxxx'])
+    pattern, rows = partition.largest_bucket('abcde', None, 5)
+    assert weight(pattern) == (4, 0) and rows_of(rows) == [0, 1]
+
+
+def test_matches_a_brute_force_reference(dictionary, engine):
+    rng = random.Random(7)
+    words = sorted({''.join(rng.choice('abcde') for _ in range(5)) for _ in range(300)})
+    dictionary(5, words)
+    for guess in rng.sample(words, 20) + ['aaaaa', 'edcba']:
+        sizes = {}
+        for secret in words:
+            p = score_pair(guess, secret)
+            sizes[p] = sizes.get(p, 0) + 1
+        best = min(sizes, key=lambda p: (-sizes[p],) + weight(p) + (p,))
+        pattern, rows = partition.largest_bucket(guess, None, 5)
+        assert pattern == best
+        assert rows_of(rows) == [i for i, w in enumerate(words) if score_pair(guess, w) == best]
+
+
+def test_adversary_dodges_until_one_candidate_is_left(dictionary, engine):
+    dictionary(5, ['casas', 'perro'])
+    game = AdversarialGame(length=5)
+    # 'casas' could win, but all-grey ('perro') ties and is less informative.
+    # 'casas' podría ganar, pero el todo gris empata y revela menos.
+    resultados, _, known, winner = game.check_word('casas')
+    assert known and not winner
+    assert [estado for _, estado in resultados] == ['rojo'] * 5
+    assert game.get_candidatos() == ['perro'] and game.get_palabra_secreta() == 'perro'
+    _, _, _, winner = game.check_word('perro')
+    assert winner and game.get_historial()[-1].pattern == winning_pattern(5)
+
+
+def test_all_green_wins_only_as_the_last_option(dictionary, engine):
+    dictionary(5, ['casas', 'cosas', 'gatos', 'pasos', 'perro', 'zorro'])
+    game = AdversarialGame(length=5, intentos=10)
+    winner = False
+    while not winner:
+        # Always guess a still-possible secret: it only wins once it is the last.
+        # Se adivina siempre un secreto posible: sólo gana cuando es el último.
+        remaining = game.get_candidatos()
+        guess = remaining[-1]
+        _, _, _, winner = game.check_word(guess)
+        assert winner == (len(remaining) == 1)
+        if not winner:
+            assert guess not in game.get_candidatos()
@@ -0,0 +1,144 @@
+"""NDJSON protocol of the session server, over a real local socket.
+
+Español: Protocolo NDJSON del servidor de sesiones, sobre un socket local real.
+"""
+import asyncio
+import json
+
+import pytest
+
+import snapshot
+from game import CompactGame
+from server import GameServer, SessionStore
+
+WORDS = ['casas', 'perro', 'gatos', 'mesas', 'libro']
+
+
+@pytest.fixture
+def words(dictionary):
+    dictionary(5, WORDS)
+
+
+def talk(game_server, requests):
+    """Send each request as one line; return the decoded response lines.
+
+    Español: Envía cada petición en una línea; devuelve las respuestas.
+    """
+    async def run():
+        server = await asyncio.start_server(game_server.serve_client, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        responses = []
+        for request in requests:
+            line = request if isinstance(request, bytes) else json.dumps(request).encode()
+            writer.write(line + b'\n')
+            await writer.drain()
+            responses.append(json.loads(await reader.readline()))
+        writer.close()
+        await writer.wait_closed()
+        await asyncio.sleep(0.01)  # let the handler see EOF / el manejador ve el EOF
+        server.close()
+        await server.wait_closed()
+        return responses
+
+    return asyncio.run(run())
+
+
+def test_play_a_game_over_the_protocol(words):
+    game_server = GameServer()
+    game_server.store.add('s1', CompactGame('casas', length=5))
+    responses = talk(game_server, [
+        {'op': 'guess', 'session': 's1', 'word': 'zzzzz', 'id': 1},
+        {'op': 'guess', 'session': 's1', 'word': 'cas'},
+        {'op': 'guess', 'session': 's1', 'word': 'MESAS'},
+        {'op': 'state', 'session': 's1'},
+        {'op': 'guess', 'session': 's1', 'word': 'casas'},
+        {'op': 'guess', 'session': 's1', 'word': 'perro'},
+        {'op': 'close', 'session': 's1'},
+        {'op': 'state', 'session': 's1'},
+    ])
+    unknown, short, mesas, state, won, over, closed, gone = responses
+    assert unknown == {'resultados': None, 'length_valid': True, 'known': False,
+                       'winner': False, 'intentos': 6, 'id': 1}
+    assert short['length_valid'] is False and short['intentos'] == 6
+    assert mesas['resultados'] == [['m', 'rojo'], ['e', 'rojo'], ['s', 'verde'], ['a', 'verde'], ['s', 'verde']]
+    assert mesas['intentos'] == 5 and 'palabra' not in mesas
+    assert state == {'historial': [mesas['resultados']], 'intentos': 5}
+    assert won['winner'] is True and won['palabra'] == 'casas'
+    assert over == {'error': 'game over'}
+    assert closed == {'closed': True}
+    assert gone == {'error': 'unknown or expired session'}
+
+
+def test_new_sessions(words):
+    game_server = GameServer()
+    new, player, too_long = talk(game_server, [
+        {'op': 'new'},
+        {'op': 'new', 'length': 5, 'player': 'ana'},
+        {'op': 'new', 'length': 99},
+    ])
+    assert new['length'] == 5 and new['intentos'] == 6
+    assert game_server.store.get(new['session']).get_palabra_secreta() in WORDS
+    assert player['session'] != new['session']
+    assert 'error' in too_long
+    assert len(game_server.store) == 2
+
+
+def test_bad_requests_keep_the_connection(dictionary):
+    dictionary(5, WORDS + ['güero'])
+    game_server = GameServer()
+    game_server.store.add('s1', CompactGame('casas', length=5))
+    responses = talk(game_server, [
+        b'{not json',
+        b'[1, 2]',
+        {'op': 'guess', 'session': 's1', 'word': 'güero'},
+        {'op': 'nope', 'session': 's1'},
+        {'op': 'state', 'session': 's1'},
+    ])
+    not_json, not_object, outside_alphabet, unknown_op, state = responses
+    assert not_json['error'].startswith('bad request:')
+    assert not_object['error'].startswith('bad request:')
+    # 'güero' is in the dictionary, but 'ü' is outside ALPHABET.
+    # 'güero' está en el diccionario, pero 'ü' no está en ALPHABET.
+    assert outside_alphabet['error'].startswith('bad request:')
+    assert unknown_op == {'error': "unknown op 'nope'"}
+    assert state == {'historial': [], 'intentos': 6}
+
+
+def test_metrics_op(words):
+    text, prometheus = talk(GameServer(), [{'op': 'metrics'}, {'op': 'metrics', 'format': 'prometheus'}])
+    assert isinstance(text['metrics'], str)
+    assert '# TYPE wordle_guesses_total counter' in prometheus['metrics']
+
+
+def test_sessions_survive_a_restart(words, tmp_path):
+    path = str(tmp_path / 's.snap')
+    first = GameServer(journal=snapshot.Journal(path))
+    new, = talk(first, [{'op': 'new'}])
+    session = new['session']
+    secret = first.store.get(session).get_palabra_secreta()
+    guess = next(w for w in WORDS if w != secret)
+    played, = talk(first, [{'op': 'guess', 'session': session, 'word': guess}])
+    first.shutdown()
+
+    second = GameServer(journal=snapshot.Journal(path))
+    state, = talk(second, [{'op': 'state', 'session': session}])
+    assert state == {'historial': [played['resultados']], 'intentos': 5}
+    second.shutdown()
+
+
+def test_store_evicts_by_lru_and_ttl():
+    now = [0.0]
+    evicted = []
+    store = SessionStore(max_sessions=2, ttl=10, clock=lambda: now[0], on_evict=evicted.append)
+    store.add('a', object())
+    store.add('b', object())
+    store.get('a')
+    store.add('c', object())  # over capacity: 'b' is least recently used
+    assert evicted == ['b'] and len(store) == 2
+    now[0] = 5
+    store.get('c')
+    now[0] = 12
+    assert store.sweep() == 1 and evicted == ['b', 'a']
+    now[0] = 30
+    assert store.get('c') is None and store.evicted == 3
@@ -0,0 +1,49 @@
+"""Headless simulation: reports, strategy errors and option validation.
+
+Español: Simulación sin interfaz: informes, errores de estrategia y validación de opciones.
+"""
+import pytest
+
+import main
+import simulate
+
+WORDS = ['casas', 'perro', 'gatos', 'mesas', 'libro', 'zorro', 'pasos', 'cosas']
+
+
+def test_every_game_is_won_or_lost(dictionary):
+    dictionary(5, WORDS)
+    report = simulate.simulate(40, 5, 'candidate', workers=1, seed=3)
+    assert sum(report['wins'].values()) + report['losses'] == 40
+    assert (report['games'], report['length'], report['strategy'], report['workers']) == (40, 5, 'candidate', 1)
+    assert simulate.play_games(40, 5, 'candidate', 3)['wins'] == report['wins']
+
+
+@pytest.mark.parametrize('guess', ('zzzzz', 'cas', None))
+def test_unplayable_guess_is_an_error(dictionary, monkeypatch, guess):
+    dictionary(5, WORDS)
+    monkeypatch.setitem(simulate.STRATEGIES, 'broken', lambda game, rng: guess)
+    with pytest.raises(ValueError, match="Strategy 'broken' played unknown word"):
+        simulate.play_games(1, 5, 'broken', 0)
+
+
+def test_simulate_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        simulate.simulate(10, 5, 'nope')
+    with pytest.raises(ValueError):
+        simulate.simulate(10, 5, workers=0)
+
+
+@pytest.mark.parametrize('argv', (
+    ['--simulate', '-5'],
+    ['--simulate', '0'],
+    ['--simulate', '10', '--workers', '0'],
+    ['--simulate', '10', '--strategy', 'entrpy'],
+))
+def test_command_line_rejects_bad_options(argv):
+    with pytest.raises(SystemExit):
+        main.parse_args(argv)
+
+
+def test_command_line_accepts_every_strategy():
+    for name in simulate.STRATEGIES:
+        assert main.parse_args(['--simulate', '3', '--strategy', name]).strategy == name
@@ -0,0 +1,167 @@
+"""Session snapshots and delta logs: round trips, crashes and stale logs.
+
+Español: Instantáneas y registros delta: ida y vuelta, fallos y registros obsoletos.
+"""
+import os
+
+import pytest
+
+import snapshot
+from game import CompactGame
+
+WORDS_5 = ['casas', 'perro', 'gatos', 'mesas', 'libro', 'ñandu', 'zorro', 'pasos']
+WORDS_7 = ['caminos', 'ventana', 'pelotas']
+
+
+@pytest.fixture
+def words(dictionary):
+    dictionary(5, WORDS_5)
+    dictionary(7, WORDS_7)
+
+
+def state(sessions):
+    """Comparable view of every session / Vista comparable de cada sesión."""
+    return {
+        k: (g.length, g.get_palabra_secreta(), g.get_intentos_restantes(),
+            [(r.word, r.pattern) for r in g.get_historial()])
+        for k, g in sessions.items()
+    }
+
+
+def sample_sessions():
+    sessions = {
+        'fresh': CompactGame('casas', length=5),
+        'playing': CompactGame('perro', length=5),
+        'won': CompactGame('ñandu', length=5),
+        'lost': CompactGame('zorro', length=5, intentos=2),
+        'long': CompactGame('ventana', length=7),
+        'x' * snapshot.ID_WIDTH: CompactGame('mesas', length=5),
+    }
+    for word in ('gatos', 'pasos', 'perro'):
+        sessions['playing'].check_word(word)
+    sessions['won'].check_word('ñandu')
+    for word in ('casas', 'mesas'):
+        sessions['lost'].check_word(word)
+    sessions['long'].check_word('caminos')
+    return sessions
+
+
+def test_snapshot_round_trip(words, tmp_path):
+    sessions = sample_sessions()
+    path = str(tmp_path / 's.snap')
+    snapshot.write_snapshot(path, sessions, generation=7)
+    restored, generation = snapshot.read_snapshot(path)
+    assert generation == 7
+    assert state(restored) == state(sessions)
+    # Restored games keep playing / Las partidas restauradas siguen jugando.
+    restored['fresh'].check_word('gatos')
+    assert restored['fresh'].get_intentos_restantes() == 5
+
+
+def test_empty_snapshot_and_bad_files(words, tmp_path):
+    path = str(tmp_path / 's.snap')
+    snapshot.write_snapshot(path, {})
+    assert snapshot.read_snapshot(path) == ({}, 0)
+    (tmp_path / 'bad.snap').write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        snapshot.read_snapshot(str(tmp_path / 'bad.snap'))
+    with pytest.raises(ValueError):
+        snapshot.write_snapshot(path, {'y' * (snapshot.ID_WIDTH + 1): CompactGame('casas', length=5)})
+
+
+def test_replay_deltas_rebuilds_sessions(words, tmp_path):
+    path = str(tmp_path / 'd')
+    log = snapshot.DeltaLog(path)
+    expected = {}
+    for session_id, secret in (('a', 'casas'), ('b', 'ventana'), ('c', 'perro')):
+        expected[session_id] = CompactGame(secret, length=len(secret))
+        log.log_new(session_id, expected[session_id])
+    for session_id, word in (('a', 'gatos'), ('b', 'pelotas'), ('a', 'casas'), ('c', 'zorro')):
+        expected[session_id].check_word(word)
+        log.log_guess(session_id, word)
+    log.log_close('c')
+    del expected['c']
+    log.close()
+    assert state(snapshot.replay_deltas(path, {})) == state(expected)
+    assert snapshot.replay_deltas(str(tmp_path / 'missing'), {}) == {}
+
+
+def test_truncated_trailing_delta_is_ignored_and_overwritten(words, tmp_path):
+    path = str(tmp_path / 'd')
+    log = snapshot.DeltaLog(path)
+    game = CompactGame('casas', length=5)
+    log.log_new('a', game)
+    log.log_guess('a', 'perro')
+    log.close()
+    with open(path, 'ab') as f:
+        f.write(snapshot.DELTA.pack(snapshot.OP_GUESS, b'a', 5, 0, 0)[:7])  # crash mid-write
+
+    replayed = snapshot.replay_deltas(path, {})
+    assert [r.word for r in replayed['a'].get_historial()] == ['perro']
+
+    # Reopening drops the partial record so new records stay aligned.
+    # Reabrir descarta el registro parcial y los nuevos quedan alineados.
+    log = snapshot.DeltaLog(path)
+    log.log_guess('a', 'gatos')
+    log.close()
+    assert os.path.getsize(path) == 3 * snapshot.DELTA.size
+    replayed = snapshot.replay_deltas(path, {})
+    assert [r.word for r in replayed['a'].get_historial()] == ['perro', 'gatos']
+
+
+def test_journal_checkpoint_removes_stale_logs(words, tmp_path):
+    path = str(tmp_path / 's.snap')
+    journal = snapshot.Journal(path)
+    sessions = journal.restore()
+    assert sessions == {} and journal.generation == 0
+    sessions['a'] = CompactGame('casas', length=5)
+    journal.deltas.log_new('a', sessions['a'])
+    (tmp_path / 's.snap.delta.9').write_bytes(b'')  # left over by an old crash
+
+    journal.checkpoint(sessions)
+    assert journal.generation == 1
+    assert sorted(n for n in os.listdir(tmp_path) if n.startswith('s.snap')) == ['s.snap', 's.snap.delta.1']
+    sessions['a'].check_word('perro')
+    journal.deltas.log_guess('a', 'perro')
+    journal.deltas.close()
+
+    again = snapshot.Journal(path)
+    assert state(again.restore()) == state(sessions)
+    assert again.generation == 1
+    again.deltas.close()
+
+
+def test_crash_between_snapshot_and_log_switch_does_not_replay_twice(words, tmp_path):
+    path = str(tmp_path / 's.snap')
+    journal = snapshot.Journal(path)
+    sessions = journal.restore()
+    sessions['a'] = CompactGame('casas', length=5)
+    journal.deltas.log_new('a', sessions['a'])
+    for word in ('perro', 'gatos'):
+        sessions['a'].check_word(word)
+        journal.deltas.log_guess('a', word)
+
+    # The snapshot of generation 1 is on disk, but the process dies before
+    # switching logs: delta.0 (already folded into the snapshot) remains.
+    # La instantánea de la generación 1 está escrita, pero el proceso cae
+    # antes de cambiar de registro: delta.0 sigue ahí.
+    snapshot.write_snapshot(path, sessions, journal.generation + 1)
+    journal.deltas.close()
+    assert os.path.exists(path + '.delta.0')
+
+    restarted = snapshot.Journal(path)
+    restored = restarted.restore()
+    assert state(restored) == state(sessions)
+    assert restored['a'].get_intentos_restantes() == 4
+    restarted.checkpoint(restored)
+    assert not os.path.exists(path + '.delta.0')
+    restarted.deltas.close()
+
+
+def test_log_new_rejects_unjournalable_lengths(tmp_path):
+    log = snapshot.DeltaLog(str(tmp_path / 'd'))
+    game = CompactGame('a' * (snapshot.MAX_LENGTH + 1), length=snapshot.MAX_LENGTH + 1)
+    with pytest.raises(ValueError):
+        log.log_new('a', game)
+    log.close()
+    assert os.path.getsize(tmp_path / 'd') == 0
@@ -0,0 +1,89 @@
+"""Concurrent cold-start loading: one load per length, never a partial dictionary.
+
+Español: Carga concurrente en frío: una carga por longitud, nunca un diccionario a medias.
+"""
+import random
+import threading
+import time
+
+import word_list
+from word_list import WordList
+
+THREADS = 32
+LENGTHS = (4, 5, 6, 7)
+
+
+def synthetic(length, count=3000):
+    rng = random.Random(length)
+    words = set()
+    while len(words) < count:
+        words.add(''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(length)))
+    return sorted(words)
+
+
+def test_concurrent_cold_start_loads_each_length_once(dictionary, monkeypatch):
+    sources = {n: synthetic(n) for n in LENGTHS}
+    for n, words in sources.items():
+        dictionary(n, words)
+    expected_sets = {n: frozenset(words) for n, words in sources.items()}
+
+    loads = {}
+    loads_lock = threading.Lock()
+    load_locked = WordList.__dict__['_load_locked'].__func__
+
+    def counted(cls, length):
+        with loads_lock:
+            loads[length] = loads.get(length, 0) + 1
+        time.sleep(0.01)  # widen the race window / amplía la ventana de carrera
+        load_locked(cls, length)
+
+    monkeypatch.setattr(WordList, '_load_locked', classmethod(counted))
+    barrier = threading.Barrier(THREADS + 1)
+    errors = []
+
+    def worker(k):
+        rng = random.Random(k)
+        barrier.wait()
+        try:
+            for i in range(300):
+                length = LENGTHS[(k + i) % len(LENGTHS)]
+                words = sources[length]
+                op = i % 3
+                if op == 0:
+                    WordList._ensure_loaded(length)
+                elif op == 1:
+                    assert WordList.is_known_word(rng.choice(words), length)
+                    assert not WordList.is_known_word('z' * (length - 1) + '1', length)
+                else:
+                    assert WordList.get_random_word(length) in expected_sets[length]
+                    continue
+                # Whoever sees a length loaded sees all of it.
+                # Quien ve una longitud cargada la ve entera.
+                listed = word_list._words_by_length[length]
+                assert len(listed) == len(words) and listed[0] == words[0] and listed[-1] == words[-1]
+                assert word_list._word_sets_by_length[length] == expected_sets[length]
+        except Exception as exc:  # reported below / se informa abajo
+            errors.append(repr(exc))
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(THREADS)]
+    for t in threads:
+        t.start()
+    preload = WordList.prewarm()
+    barrier.wait()
+    for t in threads:
+        t.join()
+    preload.join()
+
+    assert errors == []
+    assert loads == {n: 1 for n in LENGTHS}
+    for n in LENGTHS:
+        assert list(word_list._words_by_length[n]) == sources[n]
+
+
+def test_prewarm_loads_every_available_length(dictionary):
+    for n in LENGTHS:
+        dictionary(n, synthetic(n, 50))
+    assert word_list.available_lengths() == list(LENGTHS)
+    WordList.prewarm().join()
+    assert sorted(word_list._words_by_length) == list(LENGTHS)
+    assert all(len(word_list._word_sets_by_length[n]) == 50 for n in LENGTHS)